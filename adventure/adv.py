@@ -2,34 +2,66 @@
 #   Adventure
 ############################################################
 
-import argparse
 import sys
 import os
-import ast
-import random
 
 from .room import Room
-from .player import Player
+from .player import Player, is_invalid_move_error
 from .world import World
-from .memory_graph import MemoryGraph
+from .world_cache import load_world
+from .path_buffer import PathBuffer
+
+# `argparse`, `random`, `exploration`, and `PathCache` are imported
+# where they are used, so that startup only pays for what it runs.
 
 ############################################################
 
 
 class Adventure:
 
-    def __init__(self, world_file):
+    TRAVERSAL_POLICY = "random-dft+bfs"
+    LOOKAHEAD_TRAVERSAL_POLICY = "random-dft+peek+bfs"
+
+    # The `tools.debug_tools` category of `traverse_world`'s diagnostics.
+    DEBUG_CATEGORY = "traverse_world"
+
+    DEFAULT__CHECKPOINT_INTERVAL = 100_000    # moves
+
+    def __init__(
+        self,
+        world_file,
+        seed=None,
+        use_cache=True,
+        cache_dir=None,
+        optimize=False,
+        checkpoint_file=None,
+        checkpoint_interval=DEFAULT__CHECKPOINT_INTERVAL,
+        lookahead=False,
+        event_log=None,
+    ):
 
         # Load world.
         self.world = World()
+        self.world_file = world_file
 
         # Load the map into a dictionary.
-        self.world_info = ast.literal_eval(open(world_file, "r").read())
+        (self.world_info, self.world_digest) = load_world(world_file, use_cache)
         self.world.load_graph(self.world_info)
 
         # Initialize the player.
         self.player = Player(self.world.starting_room)
 
+        # Traversal settings.
+        self.seed = seed
+        self.optimize = optimize
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.path_cache = None
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_interval = checkpoint_interval
+        self.lookahead = lookahead
+        self.event_log = event_log
+
         return
 
     def show_map(self):
@@ -56,143 +88,329 @@ class Adventure:
 
         return
 
-    def traverse_world(self):
+    def traverse_world(self, show_path=True, as_buffer=False):
+        """
+        Explore the world, starting from the starting room.
+        Returns the traversed path as a list of `(move, to_node)`,
+        or as a `PathBuffer` of moves when `as_buffer` is `True`.
+
+        With a `checkpoint_file`, the traversal is saved there as it goes (see `checkpoint`),
+        and resumed from there when it exists, giving the same path as an uninterrupted run.
+        The checkpoint is removed once the world is explored.
+
+        With `lookahead`, the player peeks through unexplored exits before choosing one
+        (see `choose_direction__lookahead`). Peeks are counted in `player.peek_count`.
+
+        Each step is described with `debug_print` in `DEBUG_CATEGORY`: rooms and directions
+        at `LEVEL__DEBUG`, and what is remembered of each room at `LEVEL__TRACE`.
+
+        With an `event_log` (see `event_log.EventLog`), each move, new room, dead end and search
+        is also logged there as a structured event. The log is left open for the caller to close.
+        """
+
+        import random
+        from .exploration import (
+            make_memory,
+            find_path_to_edge_of_unknown,
+            record_room,
+            choose_direction,
+            choose_direction__lookahead,
+            move_to,
+        )
+        from tools.debug_tools import (
+            LEVEL__DEBUG,
+            LEVEL__TRACE,
+            debug_print,
+            is_debug_enabled,
+        )
+
+        # Diagnostics: checked once, so that they cost nothing when they are off.
+        debugging = is_debug_enabled(LEVEL__DEBUG, self.DEBUG_CATEGORY)
+        tracing = is_debug_enabled(LEVEL__TRACE, self.DEBUG_CATEGORY)
+
+        # Event log: `None`, or where to log each step.
+        event_log = self.event_log
+
+        if event_log is not None:
+
+            from .exploration import find_path_to_edge_of_unknown__counted
+            from .path_buffer import DIRECTION_CODES
+            from .event_log import (
+                EVENT__MOVE,
+                EVENT__NEW_ROOM,
+                EVENT__DEAD_END,
+                EVENT__BFS_START,
+                EVENT__BFS_END,
+            )
 
-        #===========================================================
-        #   HELPERS
-        #-----------------------------------------------------------
+            log_event = event_log.log
 
-        UNKNOWN = "?"
+        # Randomness:
+        rng = random.Random(self.seed)
 
-        def get_unknown_directions(memory, room_id):
-            return tuple(
-                direction for (direction, to_room_id) in memory.map[room_id].items()
-                if to_room_id == UNKNOWN
-            )
+        # World:
+        world = self.world
+        room_count = len(self.world.rooms)
 
-        def has_unknown_directions(memory, room_id):
-            return (UNKNOWN in memory.map[room_id].values())
+        # Player:
+        player = self.player
+        player.current_room = world.starting_room
+        player.peek_count = 0
 
-        def find_path_to_edge_of_unknown(memory, room_id):
+        # Player "Memory":
+        memory = make_memory()
+        found_all = len(memory.map) == room_count
 
-            def found_edge_of_unknown(curr_room_id, *rest):
-                # Returns `True` when `curr_room_id` points to `UNKNOWN`.
-                return has_unknown_directions(memory, curr_room_id)
+        # Traversed Path: a list of `(move, to_node)`, or a `PathBuffer` of moves.
+        traversed_path = PathBuffer() if as_buffer else [(None, player.current_room.id)]
+        path_offset = 0 if as_buffer else 1    # -- entries before the first move
 
-            return memory.bfs(found_edge_of_unknown, room_id)
+        # Checkpoint:
+        checkpoint = None
 
-        def record_room(memory, player):
+        if self.checkpoint_file is not None:
 
-            room = player.current_room
+            from .checkpoint import TraversalCheckpoint
 
-            if room.id not in memory.map:
-                # Add node to memory.
-                memory.add_node(room.id)
+            checkpoint = TraversalCheckpoint(self.checkpoint_file, self.checkpoint_interval)
+            resumed = checkpoint.resume(memory, player, world)
 
-                for direction in room.get_exits():
-                    # Record a "blank" edge.
-                    memory.add_edge(room.id, direction, UNKNOWN)
+            if resumed is not None:
+                (memory, moves, rng_state) = resumed
+                if rng_state is not None:
+                    rng.setstate(rng_state)
+                traversed_path = moves if as_buffer else moves.to_path(world.starting_room)
+                print(f"CHECKPOINT RESUMED: {len(moves)} moves")
 
-            else:
-                # Record any missing connections.
-                for direction in room.get_exits():
-                    if direction not in memory.map[room.id]:
-                        memory.add_edge(room.id, direction, UNKNOWN)
+            checkpoint.start()
 
-            return memory.map[room.id]
+        # Peeks: `{(room_id, direction): kind}`, for `lookahead`.
+        peeked = dict()
 
-        def choose_direction(memory, player):
+        if as_buffer:
+            append_step = (lambda step: traversed_path.append(step[0]))
+        else:
+            append_step = traversed_path.append
 
-            room = player.current_room
-            unknown_directions = get_unknown_directions(memory, room.id)
+        if event_log is not None:
 
-            if unknown_directions:
-                # Randomly choose a direction.
-                return random.choice(unknown_directions)
+            append_step__unlogged = append_step
 
-            else:
-                # There's nowhere new to go.
-                return None
+            def append_step(step):
+                append_step__unlogged(step)
+                log_event(
+                    EVENT__MOVE, len(traversed_path) - path_offset, step[1], DIRECTION_CODES[step[0]]
+                )
 
-        def move_to(memory, player, direction):
+        if event_log is not None and not memory.map:
+            log_event(EVENT__NEW_ROOM, 0, player.current_room.id, len(player.current_room.get_exits()))
 
-            from_room = player.current_room
-            player.travel(direction)
-            to_room = player.current_room
+        try:
 
-            # Remember this connection!
-            memory.add_both_edges(from_room.id, direction, to_room.id)
+            while not found_all:
 
-            return (direction, to_room.id)
+                if checkpoint is not None and len(traversed_path) - path_offset >= checkpoint.next_log:
+                    checkpoint.save(traversed_path, player.current_room.id, rng.getstate(), memory)
 
-        def move_from(memory, player, direction):
+                record_room(memory, player)
 
-            inverse_direction = memory.inverse_labels[direction]
+                if tracing:
+                    debug_print(
+                        "record_room",
+                        kwargs=lambda: {"room": player.current_room.id},
+                        messages=lambda: [memory.map[player.current_room.id]],
+                        level=LEVEL__TRACE,
+                        category=self.DEBUG_CATEGORY,
+                    )
 
-            from_room = player.current_room
-            player.travel(inverse_direction)
-            to_room = player.current_room
+                if self.lookahead:
+                    direction = choose_direction__lookahead(memory, player, rng, peeked)
+                else:
+                    direction = choose_direction(memory, player, rng)
+
+                if debugging:
+                    debug_print(
+                        "choose_direction",
+                        kwargs=lambda: {"room": player.current_room.id, "direction": direction},
+                        level=LEVEL__DEBUG,
+                        category=self.DEBUG_CATEGORY,
+                    )
+
+                if direction is not None:
+                    # Let's move :D
+                    if event_log is not None:
+                        known_room_count = len(memory.map)
+
+                    step = move_to(memory, player, direction)
+                    append_step(step)
+
+                    if event_log is not None and len(memory.map) > known_room_count:
+                        log_event(
+                            EVENT__NEW_ROOM,
+                            len(traversed_path) - path_offset,
+                            step[1],
+                            len(player.current_room.get_exits()),
+                        )
 
-            # Remember this connection!
-            memory.add_both_edges(from_room.id, inverse_direction, to_room.id)
+                else:
+                    # We can't immediately move on a new edge :(
+                    # Let's look for a new path in memory.
+                    if event_log is None:
+                        path_to_edge_of_unknown = find_path_to_edge_of_unknown(
+                            memory, player.current_room.id
+                        )
+
+                    else:
+                        room_id = player.current_room.id
+                        step_count = len(traversed_path) - path_offset
+                        log_event(EVENT__DEAD_END, step_count, room_id, len(memory.map[room_id]))
+                        log_event(EVENT__BFS_START, step_count, room_id)
+                        (path_to_edge_of_unknown, node_count) = find_path_to_edge_of_unknown__counted(
+                            memory, room_id
+                        )
+                        log_event(
+                            EVENT__BFS_END,
+                            step_count,
+                            path_to_edge_of_unknown[-1][1] if path_to_edge_of_unknown else room_id,
+                            node_count,
+                        )
+
+                    if debugging:
+                        debug_print(
+                            "find_path_to_edge_of_unknown",
+                            kwargs=lambda: {
+                                "room": player.current_room.id,
+                                "moves": len(path_to_edge_of_unknown) - 1 if path_to_edge_of_unknown else None,
+                            },
+                            level=LEVEL__DEBUG,
+                            category=self.DEBUG_CATEGORY,
+                        )
+
+                    if path_to_edge_of_unknown:
+
+                        for step in path_to_edge_of_unknown[1:]:
+                            # Follow the path.
+                            step = move_to(memory, player, step[0])
+                            append_step(step)
+
+                    else:
+                        # There's nowhere to go from here. We're done!
+                        found_all = True
+
+        finally:
+
+            if checkpoint is not None:
+                # Flush what was queued; keep the checkpoint unless the world was explored.
+                checkpoint.close(completed=found_all)
+
+        if show_path:
+            print(traversed_path)
 
-            return (direction, to_room.id)
+        return traversed_path
 
-        #===========================================================
+    def get_path_cache(self):
+        """
+        Get the path cache, opening it on first use.
+        Returns `None` when caching is turned off.
+        """
 
-        # World:
-        world = self.world
-        room_count = len(self.world.rooms)
+        if self.path_cache is None and self.use_cache:
 
-        # Player:
-        player = self.player
-        player.current_room = world.starting_room
+            from .path_cache import PathCache
 
-        # Player "Memory":
-        memory = MemoryGraph(inverse_labels=(
-            ("n", "s"),
-            ("e", "w"),
-        ))
+            self.path_cache = (
+                PathCache(self.cache_dir) if self.cache_dir is not None else PathCache()
+            )
 
-        # Traversed Path: a list of `(move, to_node)`
-        traversed_path = [(None, player.current_room.id)]
-        found_all = len(memory.map) == room_count
+        return self.path_cache
+
+    def get_path_cache_key(self):
+        """
+        Get the key of this world and its traversal settings in the path cache.
+        """
+
+        from .path_cache import PathCache
+
+        return PathCache.make_key(
+            self.world_digest,
+            policy=self.LOOKAHEAD_TRAVERSAL_POLICY if self.lookahead else self.TRAVERSAL_POLICY,
+            seed=self.seed,
+            optimize=self.optimize,
+        )
+
+    def replay_moves(self, moves):
+        """
+        Walk `moves` from the starting room, without printing.
+        Returns the traversed path as a list of `(move, to_node)`,
+        or `None` if a move is invalid or any room is left unvisited.
+        """
+
+        room = self.world.starting_room
+        traversed_path = [(None, room.id)]
+        visited_rooms = {room}
+
+        try:
+            Player(room).travel_many(moves, visited=visited_rooms, path=traversed_path)
+        except Exception as error:
+            if is_invalid_move_error(error):
+                return None
+            raise
 
-        while not found_all:
+        if len(visited_rooms) != len(self.world.rooms):
+            return None
 
-            # print("room", player.current_room.id)
+        return traversed_path
 
-            record_room(memory, player)
-            # print("... map:", memory.map)
+    def traverse_and_optimize_world(self):
+        """
+        Traverse the world, then shorten the path if `optimize` is set.
+        """
 
-            direction = choose_direction(memory, player)
-            # print("... direction:", direction)
+        traversed_path = self.traverse_world()
 
-            if direction is not None:
-                # Let's move :D
-                step = move_to(memory, player, direction)
-                traversed_path.append(step)
+        if self.optimize:
 
-            else:
-                # We can't immediately move on a new edge :(
-                # Let's look for a new path in memory.
-                path_to_edge_of_unknown = find_path_to_edge_of_unknown(
-                    memory, player.current_room.id
-                )
-                # print("... path to edge of unknown:", path_to_edge_of_unknown)
+            from .path_optimizer import optimize_path
 
-                if path_to_edge_of_unknown:
+            optimized_path = optimize_path(self.world, traversed_path)
+            print(f"PATH OPTIMIZED: {len(traversed_path) - 1} -> {len(optimized_path) - 1} moves")
+            traversed_path = optimized_path
 
-                    for step in path_to_edge_of_unknown[1:]:
-                        # Follow the path.
-                        step = move_to(memory, player, step[0])
-                        traversed_path.append(step)
+        return traversed_path
 
-                else:
-                    # There's nowhere to go from here. We're done!
-                    found_all = True
+    def solve_world(self):
+        """
+        Get a traversal path of the world, from the path cache when possible.
+        Cached paths are re-validated before use, and new paths are stored.
+        With an `event_log`, the world is always traversed, so that there are events to log.
+        """
+
+        path_cache = self.get_path_cache()
+
+        if path_cache is None or self.event_log is not None:
+            return self.traverse_and_optimize_world()
+
+        key = self.get_path_cache_key()
+        cached_moves = path_cache.get(key)
+
+        if cached_moves is not None:
+
+            traversed_path = self.replay_moves(cached_moves)
+
+            if traversed_path is not None:
+                print(f"PATH CACHE HIT: {len(cached_moves)} moves")
+                return traversed_path
+
+            # The entry doesn't solve this world. Forget it.
+            path_cache.discard(key)
+
+        traversed_path = self.traverse_and_optimize_world()
+        traversed_moves = PathBuffer.from_path(traversed_path)
+
+        # Only keep paths that visit every room.
+        if self.replay_moves(traversed_moves) is not None:
+            path_cache.put(key, traversed_moves)
 
-        print(traversed_path)
         return traversed_path
 
     def test_traverse_world(self):
@@ -202,9 +420,9 @@ class Adventure:
         player = self.player
 
         # Run and unpack results.
-        traversed_path = self.traverse_world()
-        traversed_moves = tuple(
-            move for (move, *rest) in traversed_path[1:]
+        traversed_path = self.solve_world()
+        traversed_moves = PathBuffer.from_path(
+            traversed_path
         )    # -- this takes all moves except the first (which is None).
 
         # TRAVERSAL TEST - DO NOT MODIFY
@@ -229,103 +447,211 @@ class Adventure:
 #   COMMAND LINE INTERFACE
 ############################################################
 
-adventure_cli = argparse.ArgumentParser(
-    prog="adventure",
-    description="Let's go on an adventure!",
-    epilog="Have fun!",
-)
 
-#-----------------------------------------------------------
-#   World File
-#-----------------------------------------------------------
+def make_adventure_cli():
+    """
+    Make the command line interface parser for `adventure`.
+    """
 
-adventure_cli__world_file = adventure_cli.add_mutually_exclusive_group(required=False)
+    import argparse
 
-adventure_cli__world_file.add_argument(
-    "--path",
-    "-p",
-    action="store",
-)
+    adventure_cli = argparse.ArgumentParser(
+        prog="adventure",
+        description="Let's go on an adventure!",
+        epilog="Have fun!",
+    )
 
-adventure_cli__world_file.add_argument(
-    "--example",
-    "-e",
-    nargs="?",
-    action="store",
-)
+    #-----------------------------------------------------------
+    #   World File
+    #-----------------------------------------------------------
 
-#-----------------------------------------------------------
-#   Show Map
-#-----------------------------------------------------------
+    adventure_cli__world_file = adventure_cli.add_mutually_exclusive_group(required=False)
 
-adventure_cli__show_map = adventure_cli.add_mutually_exclusive_group(required=False)
+    adventure_cli__world_file.add_argument(
+        "--path",
+        "-p",
+        action="store",
+    )
 
-adventure_cli__show_map.add_argument(
-    "--map",
-    "-m",
-    "--yes-map",
-    "-ym",
-    default=None,
-    action="store_true",
-)
+    adventure_cli__world_file.add_argument(
+        "--example",
+        "-e",
+        nargs="?",
+        action="store",
+    )
 
-adventure_cli__show_map.add_argument(
-    "--no-map",
-    "-nm",
-    default=None,
-    action="store_true",
-)
+    #-----------------------------------------------------------
+    #   Show Map
+    #-----------------------------------------------------------
 
-#-----------------------------------------------------------
-#   Run Test
-#-----------------------------------------------------------
+    adventure_cli__show_map = adventure_cli.add_mutually_exclusive_group(required=False)
 
-adventure_cli__run_test = adventure_cli.add_mutually_exclusive_group(required=False)
+    adventure_cli__show_map.add_argument(
+        "--map",
+        "-m",
+        "--yes-map",
+        "-ym",
+        default=None,
+        action="store_true",
+    )
 
-adventure_cli__run_test.add_argument(
-    "--test",
-    "-t",
-    "--yes-test",
-    "-yt",
-    default=None,
-    action="store_true",
-)
+    adventure_cli__show_map.add_argument(
+        "--no-map",
+        "-nm",
+        default=None,
+        action="store_true",
+    )
 
-adventure_cli__run_test.add_argument(
-    "--no-test",
-    "-nt",
-    default=None,
-    action="store_true",
-)
+    #-----------------------------------------------------------
+    #   Run Test
+    #-----------------------------------------------------------
 
-#-----------------------------------------------------------
-#   Walk Modes
-#-----------------------------------------------------------
+    adventure_cli__run_test = adventure_cli.add_mutually_exclusive_group(required=False)
+
+    adventure_cli__run_test.add_argument(
+        "--test",
+        "-t",
+        "--yes-test",
+        "-yt",
+        default=None,
+        action="store_true",
+    )
+
+    adventure_cli__run_test.add_argument(
+        "--no-test",
+        "-nt",
+        default=None,
+        action="store_true",
+    )
+
+    #-----------------------------------------------------------
+    #   Traversal Settings
+    #-----------------------------------------------------------
+
+    adventure_cli.add_argument(
+        "--seed",
+        "-s",
+        type=int,
+        default=None,
+        action="store",
+    )
+
+    adventure_cli.add_argument(
+        "--optimize",
+        "-o",
+        default=None,
+        action="store_true",
+    )
+
+    adventure_cli.add_argument(
+        "--no-cache",
+        "-nc",
+        default=None,
+        action="store_true",
+    )
+
+    adventure_cli.add_argument(
+        "--checkpoint",
+        "-c",
+        default=None,
+        action="store",
+    )
+
+    adventure_cli.add_argument(
+        "--checkpoint-interval",
+        "-ci",
+        type=int,
+        default=None,
+        action="store",
+    )
+
+    adventure_cli.add_argument(
+        "--lookahead",
+        "-la",
+        default=None,
+        action="store_true",
+    )
+
+    #-----------------------------------------------------------
+    #   Diagnostics
+    #-----------------------------------------------------------
+
+    adventure_cli.add_argument(
+        "--debug",
+        "-d",
+        nargs="?",
+        const="debug",
+        default=None,
+        choices=("debug", "trace"),
+        action="store",
+    )
+
+    adventure_cli.add_argument(
+        "--event-log",
+        "-el",
+        default=None,
+        action="store",
+        help="log the traversal's events to this file (the path cache is not used)",
+    )
+
+    adventure_cli.add_argument(
+        "--event-format",
+        "-ef",
+        default=None,
+        choices=("binary", "ndjson"),
+        action="store",
+        help="default: ndjson for .ndjson and .jsonl files, otherwise binary",
+    )
+
+    adventure_cli.add_argument(
+        "--event-every",
+        "-ee",
+        type=int,
+        default=None,
+        action="store",
+        help="keep every Nth event",
+    )
+
+    adventure_cli.add_argument(
+        "--event-reservoir",
+        "-er",
+        type=int,
+        default=None,
+        action="store",
+        help="keep a uniform random sample of N events",
+    )
+
+    #-----------------------------------------------------------
+    #   Walk Modes
+    #-----------------------------------------------------------
+
+    adventure_cli.add_argument(
+        "--walk",
+        "-w",
+        default=None,
+        action="store_true",
+    )
+
+    adventure_cli.add_argument(
+        "--walk-before-test",
+        "--walk-before",
+        "-wbt",
+        "-wb",
+        default=None,
+        action="store_true",
+    )
+
+    adventure_cli.add_argument(
+        "--walk-after-test",
+        "--walk-after",
+        "-wat",
+        "-wa",
+        default=None,
+        action="store_true",
+    )
+
+    return adventure_cli
 
-adventure_cli.add_argument(
-    "--walk",
-    "-w",
-    default=None,
-    action="store_true",
-)
-
-adventure_cli.add_argument(
-    "--walk-before-test",
-    "--walk-before",
-    "-wbt",
-    "-wb",
-    default=None,
-    action="store_true",
-)
-
-adventure_cli.add_argument(
-    "--walk-after-test",
-    "--walk-after",
-    "-wat",
-    "-wa",
-    default=None,
-    action="store_true",
-)
 
 #-----------------------------------------------------------
 
@@ -346,6 +672,9 @@ DEFAULT__EXAMPLE = "main_maze"
 # "main_maze"
 DEFAULT__SHOW_MAP = True
 DEFAULT__RUN_TEST = True
+DEFAULT__OPTIMIZE = False
+DEFAULT__USE_CACHE = True
+DEFAULT__LOOKAHEAD = False
 DEFAULT__WALK = False
 DEFAULT__WALK_BEFORE_TEST = False
 DEFAULT__WALK_AFTER_TEST = False
@@ -356,7 +685,7 @@ if __name__ == "__main__":
 
     args = sys.argv
     # print(args)
-    kwargs = adventure_cli.parse_args(args[1:])
+    kwargs = make_adventure_cli().parse_args(args[1:])
     # print(kwargs)
 
     current_dir = os.getcwd()
@@ -442,8 +771,70 @@ if __name__ == "__main__":
     # print("walk after test:", walk_after_test)
 
     #-----------------------------------------------------------
+    #   Traversal Settings
+    #-----------------------------------------------------------
+
+    seed = kwargs.seed
+    optimize = DEFAULT__OPTIMIZE
+    use_cache = DEFAULT__USE_CACHE
+    checkpoint_file = kwargs.checkpoint
+    checkpoint_interval = Adventure.DEFAULT__CHECKPOINT_INTERVAL
+    lookahead = DEFAULT__LOOKAHEAD
 
-    adventure = Adventure(world_file)
+    if kwargs.optimize is not None:
+        optimize = True
+
+    if kwargs.no_cache is not None:
+        use_cache = False
+
+    if kwargs.checkpoint_interval is not None:
+        checkpoint_interval = kwargs.checkpoint_interval
+
+    if kwargs.lookahead is not None:
+        lookahead = True
+
+    #-----------------------------------------------------------
+    #   Diagnostics
+    #-----------------------------------------------------------
+
+    if kwargs.debug is not None:
+
+        from tools.debug_tools import LEVEL__DEBUG, LEVEL__TRACE, set_debug_level, start_debug_writer
+
+        set_debug_level(
+            LEVEL__TRACE if kwargs.debug == "trace" else LEVEL__DEBUG,
+            Adventure.DEBUG_CATEGORY,
+        )
+
+        # Written from a background thread, to stderr, so the traversal's own output stays clean.
+        start_debug_writer(sys.stderr)
+
+    event_log = None
+
+    if kwargs.event_log is not None:
+
+        from .event_log import DEFAULT__EVERY, EventLog
+
+        event_log = EventLog(
+            kwargs.event_log,
+            format=kwargs.event_format,
+            every=kwargs.event_every if kwargs.event_every is not None else DEFAULT__EVERY,
+            reservoir_size=kwargs.event_reservoir,
+            seed=seed,
+        )
+
+    #-----------------------------------------------------------
+
+    adventure = Adventure(
+        world_file,
+        seed=seed,
+        use_cache=use_cache,
+        optimize=optimize,
+        checkpoint_file=checkpoint_file,
+        checkpoint_interval=checkpoint_interval,
+        lookahead=lookahead,
+        event_log=event_log,
+    )
 
     if show_map:
         adventure.show_map()
@@ -462,3 +853,7 @@ if __name__ == "__main__":
 
         if walk:
             adventure.walk()
+
+    if event_log is not None:
+        event_log.close()
+        print(f"EVENT LOG: {event_log.written} of {event_log.sequence} events written to {event_log.file_path}")
@@ -0,0 +1,316 @@
+############################################################
+#   ASYNC EXPLORATION
+#-----------------------------------------------------------
+#   An `asyncio` version of `Adventure.traverse_world` for
+#   worlds that live behind a slow service.
+#
+#   The explorer only talks to a `WorldBackend`, whose
+#   queries are coroutines. With `lookahead`, the explorer
+#   keeps independent queries in flight at the same time:
+#   it peeks behind every unexplored exit of the room it
+#   just entered, and it sends every move of a backtrack
+#   path at once, so their latencies overlap.
+############################################################
+
+import abc
+import asyncio
+import random
+
+from .exploration import (
+    UNKNOWN,
+    make_memory,
+    get_unknown_directions,
+    find_path_to_edge_of_unknown,
+)
+
+############################################################
+#   World Backends
+############################################################
+
+
+class WorldBackend(abc.ABC):
+    """
+    The interface of a world behind an `AsyncExplorer`.
+    Queries are stateless, so any number of them may be in flight.
+    """
+
+    starting_room_id = 0
+
+    @abc.abstractmethod
+    async def get_exits(self, room_id):
+        """
+        Get the directions of the exits of room `room_id`.
+        """
+
+    @abc.abstractmethod
+    async def travel(self, room_id, direction):
+        """
+        Get the id of the room in `direction` from room `room_id`, or `None` if there is none.
+        """
+
+
+class LocalWorldBackend(WorldBackend):
+    """
+    A stand-in backend over a local `World`.
+    Each query waits `latency` seconds, give or take up to `jitter` seconds.
+    """
+
+    DEFAULT__LATENCY = 0.0
+    DEFAULT__JITTER = 0.0
+    DEFAULT__SEED = None
+
+    def __init__(
+        self,
+        world,
+        latency=DEFAULT__LATENCY,
+        jitter=DEFAULT__JITTER,
+        seed=DEFAULT__SEED,
+    ):
+
+        self.world = world
+        self.starting_room_id = world.starting_room.id
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.query_count = 0
+
+        return
+
+    async def wait(self):
+
+        self.query_count += 1
+        delay = self.latency
+
+        if self.jitter:
+            delay += self.rng.uniform(-self.jitter, self.jitter)
+
+        await asyncio.sleep(max(delay, 0))
+
+        return
+
+    async def get_exits(self, room_id):
+
+        await self.wait()
+
+        return self.world.rooms[room_id].get_exits()
+
+    async def travel(self, room_id, direction):
+
+        await self.wait()
+        to_room = self.world.rooms[room_id].get_room_in_direction(direction)
+
+        return to_room.id if to_room is not None else None
+
+
+############################################################
+#   AsyncExplorer
+############################################################
+
+
+class AsyncExplorer:
+
+    DEFAULT__SEED = None
+    DEFAULT__LOOKAHEAD = True
+
+    def __init__(
+        self,
+        backend,
+        seed=DEFAULT__SEED,
+        lookahead=DEFAULT__LOOKAHEAD,
+    ):
+
+        self.backend = backend
+        self.rng = random.Random(seed)
+        self.lookahead = lookahead
+
+        self.memory = make_memory()
+        self.current_room_id = backend.starting_room_id
+
+        # In-flight and finished queries: `{room_id: Task}` and `{(room_id, direction): Task}`
+        self.exits_tasks = dict()
+        self.travel_tasks = dict()
+        self.peek_tasks = list()
+
+        return
+
+    #-----------------------------------------------------------
+    #   Queries
+    #-----------------------------------------------------------
+
+    def fetch_exits(self, room_id):
+        """
+        Get the task of the `get_exits` query for `room_id`, starting it if needed.
+        """
+
+        if room_id not in self.exits_tasks:
+            self.exits_tasks[room_id] = asyncio.ensure_future(self.backend.get_exits(room_id))
+
+        return self.exits_tasks[room_id]
+
+    def fetch_travel(self, room_id, direction):
+        """
+        Get the task of the `travel` query for `(room_id, direction)`, starting it if needed.
+        """
+
+        key = (room_id, direction)
+
+        if key not in self.travel_tasks:
+            self.travel_tasks[key] = asyncio.ensure_future(
+                self.backend.travel(room_id, direction)
+            )
+
+        return self.travel_tasks[key]
+
+    async def peek(self, room_id, direction):
+        """
+        Find the room in `direction` from `room_id` and its exits, without moving.
+        """
+
+        to_room_id = await self.fetch_travel(room_id, direction)
+
+        if to_room_id is not None:
+            await self.fetch_exits(to_room_id)
+
+        return
+
+    def peek_unknown_directions(self, room_id):
+        """
+        Start peeking behind every unexplored exit of `room_id`.
+        """
+
+        for direction in get_unknown_directions(self.memory, room_id):
+            self.peek_tasks.append(asyncio.ensure_future(self.peek(room_id, direction)))
+
+        return
+
+    #-----------------------------------------------------------
+    #   Moving
+    #-----------------------------------------------------------
+
+    async def record_room(self):
+
+        memory = self.memory
+        room_id = self.current_room_id
+
+        exits = await self.fetch_exits(room_id)
+
+        if room_id not in memory.map:
+            memory.add_node(room_id)
+
+        for direction in exits:
+            if direction not in memory.map[room_id]:
+                memory.add_edge(room_id, direction, UNKNOWN)
+
+        if self.lookahead:
+            self.peek_unknown_directions(room_id)
+
+        return memory.map[room_id]
+
+    def choose_direction(self):
+
+        unknown_directions = get_unknown_directions(self.memory, self.current_room_id)
+
+        if unknown_directions:
+            return self.rng.choice(unknown_directions)
+
+        else:
+            return None
+
+    def apply_move(self, direction, to_room_id):
+
+        if to_room_id is None:
+            raise Exception("AsyncExplorer.InvalidMoveError", self.current_room_id, direction)
+
+        self.memory.add_both_edges(self.current_room_id, direction, to_room_id)
+        self.current_room_id = to_room_id
+
+        return (direction, to_room_id)
+
+    async def travel(self, direction):
+        """
+        Move one step in `direction`.
+        """
+
+        to_room_id = await self.fetch_travel(self.current_room_id, direction)
+
+        return self.apply_move(direction, to_room_id)
+
+    async def follow(self, path):
+        """
+        Move along `path`, a list of `(move, to_node)` through known rooms.
+        With `lookahead`, every move is sent at once.
+        """
+
+        steps = list()
+
+        if self.lookahead:
+
+            room_id = self.current_room_id
+            tasks = list()
+
+            for (direction, to_room_id) in path:
+                tasks.append(self.fetch_travel(room_id, direction))
+                room_id = to_room_id
+
+            for ((direction, expected_room_id), to_room_id) in zip(path, await asyncio.gather(*tasks)):
+                steps.append(self.apply_move(direction, to_room_id))
+
+        else:
+
+            for (direction, expected_room_id) in path:
+                steps.append(await self.travel(direction))
+
+        return steps
+
+    #-----------------------------------------------------------
+    #   Traversal
+    #-----------------------------------------------------------
+
+    async def traverse_world(self):
+        """
+        Explore the world until every known exit has been taken.
+        Returns the traversed path as a list of `(move, to_node)`.
+        """
+
+        memory = self.memory
+        traversed_path = [(None, self.current_room_id)]
+
+        try:
+
+            while True:
+
+                await self.record_room()
+                direction = self.choose_direction()
+
+                if direction is not None:
+                    traversed_path.append(await self.travel(direction))
+                    continue
+
+                path_to_edge_of_unknown = find_path_to_edge_of_unknown(memory, self.current_room_id)
+
+                if not path_to_edge_of_unknown:
+                    break
+
+                traversed_path.extend(await self.follow(path_to_edge_of_unknown[1:]))
+
+        finally:
+
+            for task in self.peek_tasks:
+                task.cancel()
+
+            await asyncio.gather(*self.peek_tasks, return_exceptions=True)
+
+        return traversed_path
+
+
+async def traverse_world(
+    backend,
+    seed=AsyncExplorer.DEFAULT__SEED,
+    lookahead=AsyncExplorer.DEFAULT__LOOKAHEAD,
+):
+    """
+    Explore the world behind `backend` with a new `AsyncExplorer`.
+    Returns the traversed path as a list of `(move, to_node)`.
+    """
+
+    return await AsyncExplorer(backend, seed, lookahead).traverse_world()
@@ -0,0 +1,330 @@
+############################################################
+#   BATCH
+#-----------------------------------------------------------
+#   Load, traverse and validate every map in a directory,
+#   in a pool of worker processes, and summarize the moves,
+#   rooms, timings and pass/fail of each map as a table
+#   and, optionally, a JSON results file.
+#
+#   Maps that passed in the previous results file, with the
+#   same content digest and traversal settings, are skipped
+#   and their results carried over.
+#
+#   Run with `python -m adventure.batch <maps dir>`.
+#   Exits with status 1 if any map fails.
+############################################################
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+from .adv import Adventure
+
+############################################################
+
+DEFAULT__WORKERS = os.cpu_count() or 1
+DEFAULT__MAP_EXT = ".txt"
+
+############################################################
+#   Running Maps
+############################################################
+
+
+def get_file_digest(file_path):
+    """
+    Get the SHA-256 digest of a file's content, as `load_world` computes it.
+    """
+
+    with open(file_path, "rb") as stream:
+        return hashlib.sha256(stream.read()).hexdigest()
+
+
+def get_settings(seed, lookahead):
+    """
+    Get the traversal settings that results are only valid for.
+    """
+
+    return {
+        "policy": Adventure.LOOKAHEAD_TRAVERSAL_POLICY if lookahead else Adventure.TRAVERSAL_POLICY,
+        "seed": seed,
+    }
+
+
+def run_map(world_file, seed=None, lookahead=False, use_cache=True):
+    """
+    Load, traverse and validate one map.
+    Returns a dict of its results. Errors fail the map instead of being raised.
+    """
+
+    result = {
+        "digest": None,
+        "settings": get_settings(seed, lookahead),
+        "rooms": None,
+        "moves": None,
+        "load_seconds": None,
+        "traverse_seconds": None,
+        "validate_seconds": None,
+        "passed": False,
+        "error": None,
+    }
+
+    try:
+
+        started = time.perf_counter()
+        adventure = Adventure(world_file, seed=seed, use_cache=use_cache, lookahead=lookahead)
+        result["load_seconds"] = time.perf_counter() - started
+        result["digest"] = adventure.world_digest
+        result["rooms"] = len(adventure.world.rooms)
+
+        started = time.perf_counter()
+        moves = adventure.traverse_world(show_path=False, as_buffer=True)
+        result["traverse_seconds"] = time.perf_counter() - started
+        result["moves"] = len(moves)
+
+        started = time.perf_counter()
+        traversed_path = adventure.replay_moves(moves)
+        result["validate_seconds"] = time.perf_counter() - started
+
+        if traversed_path is None:
+            result["error"] = "INCOMPLETE TRAVERSAL"
+        else:
+            result["passed"] = True
+
+    except Exception as error:
+        result["error"] = repr(error)
+
+    return result
+
+
+def run_batch(
+    maps_dir,
+    seed=None,
+    lookahead=False,
+    use_cache=True,
+    workers=DEFAULT__WORKERS,
+    previous_results=None,
+):
+    """
+    Run every map in `maps_dir`, in up to `workers` processes.
+    A map whose entry in `previous_results` passed with the same digest and settings is not run again.
+    Returns `{map name: result}`, in map name order. Skipped results have `"skipped": True`.
+    """
+
+    settings = get_settings(seed, lookahead)
+    previous_maps = (previous_results or dict()).get("maps", dict())
+
+    names = sorted(name for name in os.listdir(maps_dir) if name.endswith(DEFAULT__MAP_EXT))
+    results = dict()
+    names_to_run = list()
+
+    for name in names:
+
+        previous = previous_maps.get(name)
+
+        if (
+            previous is not None
+            and previous.get("passed")
+            and previous.get("settings") == settings
+            and previous.get("digest") == get_file_digest(os.path.join(maps_dir, name))
+        ):
+            results[name] = dict(previous, skipped=True)
+        else:
+            names_to_run.append(name)
+
+    run_args = [(os.path.join(maps_dir, name), seed, lookahead, use_cache) for name in names_to_run]
+
+    if workers > 1 and len(run_args) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(run_args))) as executor:
+            run_results = list(executor.map(run_map, *zip(*run_args)))
+    else:
+        run_results = [run_map(*args) for args in run_args]
+
+    for (name, result) in zip(names_to_run, run_results):
+        results[name] = dict(result, skipped=False)
+
+    return {name: results[name] for name in names}
+
+
+############################################################
+#   Results
+############################################################
+
+
+def load_results(results_file):
+    """
+    Load a results file written by `save_results`. Returns `None` if it is missing or unreadable.
+    """
+
+    try:
+        with open(results_file, "r") as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def summarize(results):
+    """
+    Summarize `{map name: result}` as the content of a results file.
+    """
+
+    return {
+        "maps": results,
+        "passed": sum(1 for result in results.values() if result["passed"]),
+        "failed": sum(1 for result in results.values() if not result["passed"]),
+        "skipped": sum(1 for result in results.values() if result["skipped"]),
+    }
+
+
+def save_results(results_file, summary):
+
+    temp_file_path = f"{results_file}.tmp"
+
+    with open(temp_file_path, "w") as stream:
+        json.dump(summary, stream, indent=2)
+
+    os.replace(temp_file_path, results_file)
+
+    return
+
+
+def format_seconds(seconds):
+
+    return f"{seconds:.3f}" if seconds is not None else "-"
+
+
+def print_summary(summary):
+
+    print(
+        f"{'map':<32} {'rooms':>7} {'moves':>8} {'load s':>8} {'traverse s':>10}"
+        f" {'validate s':>10} {'result':>7}"
+    )
+
+    for (name, result) in summary["maps"].items():
+
+        status = "PASS" if result["passed"] else "FAIL"
+
+        if result["skipped"]:
+            status += "*"
+
+        print(
+            f"{name:<32} {result['rooms'] if result['rooms'] is not None else '-':>7}"
+            f" {result['moves'] if result['moves'] is not None else '-':>8}"
+            f" {format_seconds(result['load_seconds']):>8}"
+            f" {format_seconds(result['traverse_seconds']):>10}"
+            f" {format_seconds(result['validate_seconds']):>10} {status:>7}"
+        )
+
+        if result["error"] is not None:
+            print(f"    {result['error']}")
+
+    print(
+        f"{summary['passed']} passed, {summary['failed']} failed"
+        f" ({summary['skipped']} skipped: * results are from the previous run)"
+    )
+
+    return
+
+
+############################################################
+#   COMMAND LINE INTERFACE
+############################################################
+
+
+def make_batch_cli():
+    """
+    Make the command line interface parser for `adventure.batch`.
+    """
+
+    import argparse
+
+    batch_cli = argparse.ArgumentParser(
+        prog="adventure.batch",
+        description="Traverse and validate every map in a directory.",
+    )
+
+    batch_cli.add_argument(
+        "maps_dir",
+        action="store",
+    )
+
+    batch_cli.add_argument(
+        "--results",
+        "-r",
+        default=None,
+        action="store",
+        help="JSON results file: read to skip unchanged maps, then rewritten",
+    )
+
+    batch_cli.add_argument(
+        "--force",
+        "-f",
+        default=None,
+        action="store_true",
+        help="run every map, even if its previous results are still valid",
+    )
+
+    batch_cli.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=DEFAULT__WORKERS,
+        action="store",
+    )
+
+    batch_cli.add_argument(
+        "--seed",
+        "-s",
+        type=int,
+        default=None,
+        action="store",
+    )
+
+    batch_cli.add_argument(
+        "--lookahead",
+        "-la",
+        default=None,
+        action="store_true",
+    )
+
+    batch_cli.add_argument(
+        "--no-cache",
+        "-nc",
+        default=None,
+        action="store_true",
+    )
+
+    return batch_cli
+
+
+############################################################
+#   MAIN
+############################################################
+
+if __name__ == "__main__":
+
+    kwargs = make_batch_cli().parse_args(sys.argv[1:])
+
+    previous_results = None
+
+    if kwargs.results is not None and not kwargs.force:
+        previous_results = load_results(kwargs.results)
+
+    results = run_batch(
+        kwargs.maps_dir,
+        seed=kwargs.seed,
+        lookahead=bool(kwargs.lookahead),
+        use_cache=not kwargs.no_cache,
+        workers=kwargs.workers,
+        previous_results=previous_results,
+    )
+
+    summary = summarize(results)
+    print_summary(summary)
+
+    if kwargs.results is not None:
+        save_results(kwargs.results, summary)
+
+    sys.exit(1 if summary["failed"] else 0)
@@ -0,0 +1,294 @@
+############################################################
+#   BOUNDS
+#-----------------------------------------------------------
+#   How far from optimal is a traversal path?
+#
+#   `find_lower_bound` proves that no walk from the starting
+#   room that visits every room can be shorter than it.
+#
+#   -   Every room but the start must be entered once, so
+#       a walk has at least `rooms - 1` moves.
+#   -   Every bridge (an edge whose removal splits the world)
+#       must be crossed, and crossed back unless the walk
+#       ends beyond it. Contracting the world's 2-edge-
+#       connected components leaves a tree of bridges, and
+#       crossing them costs at least `2 * bridges - depth`,
+#       where `depth` is the most bridges from the start to
+#       where the walk could end.
+#   -   Inside each component, every room that isn't the
+#       start or the end of a bridge must be entered by a
+#       move inside the component.
+#
+#   On a tree this is exact: `2 * (rooms - 1) - eccentricity`.
+#
+#   `solve_exact` finds a shortest walk by branch-and-bound
+#   over (room, visited set) states, for small worlds.
+############################################################
+
+import time
+
+from .world_graph import memory_from_world
+
+############################################################
+
+DEFAULT__TIME_LIMIT = 10.0    # seconds
+EXACT__MAX_ROOMS = 24
+
+TIME_CHECK_INTERVAL = (1 << 12)
+
+############################################################
+#   Lower Bound
+############################################################
+
+
+def find_bridges(room_graph, starting_room_id):
+    """
+    Find the bridges of the undirected graph `room_graph` reachable from `starting_room_id`.
+    Returns a set of `frozenset({room_id_a, room_id_b})`.
+    """
+
+    order = {starting_room_id: 0}
+    low = {starting_room_id: 0}
+    bridges = set()
+
+    # Iterative depth-first search: `(room_id, parent_room_id, neighbor iterator)`
+    stack = [(starting_room_id, None, iter(room_graph[starting_room_id].values()))]
+
+    while stack:
+
+        (room_id, parent_room_id, neighbors) = stack[-1]
+        descended = False
+
+        for next_room_id in neighbors:
+
+            if next_room_id == parent_room_id:
+                continue
+
+            if next_room_id in order:
+                low[room_id] = min(low[room_id], order[next_room_id])
+                continue
+
+            order[next_room_id] = low[next_room_id] = len(order)
+            stack.append((next_room_id, room_id, iter(room_graph[next_room_id].values())))
+            descended = True
+            break
+
+        if descended:
+            continue
+
+        stack.pop()
+
+        if parent_room_id is not None:
+            low[parent_room_id] = min(low[parent_room_id], low[room_id])
+            if low[room_id] > order[parent_room_id]:
+                bridges.add(frozenset((parent_room_id, room_id)))
+
+    return bridges
+
+
+def find_lower_bound(room_graph, starting_room_id):
+    """
+    Find a lower bound on the length of any walk from `starting_room_id` that visits every room.
+    Returns a dict of the bound and the quantities it is built from.
+    """
+
+    bridges = find_bridges(room_graph, starting_room_id)
+
+    # Label the 2-edge-connected components: flood fill without crossing bridges.
+    component_of = dict()
+    component_sizes = list()
+
+    for room_id in room_graph:
+
+        if room_id in component_of:
+            continue
+
+        component = len(component_sizes)
+        component_of[room_id] = component
+        rooms_to_visit = [room_id]
+        size = 0
+
+        while rooms_to_visit:
+            curr_room_id = rooms_to_visit.pop()
+            size += 1
+            for next_room_id in room_graph[curr_room_id].values():
+                if next_room_id not in component_of and frozenset((curr_room_id, next_room_id)) not in bridges:
+                    component_of[next_room_id] = component
+                    rooms_to_visit.append(next_room_id)
+
+        component_sizes.append(size)
+
+    # Rooms that can be entered by crossing a bridge (or where the walk starts).
+    bridge_ends = {starting_room_id}
+    bridge_tree = {component: list() for component in range(len(component_sizes))}
+
+    for bridge in bridges:
+        (room_id_a, room_id_b) = tuple(bridge)
+        bridge_ends.add(room_id_a)
+        bridge_ends.add(room_id_b)
+        bridge_tree[component_of[room_id_a]].append(component_of[room_id_b])
+        bridge_tree[component_of[room_id_b]].append(component_of[room_id_a])
+
+    internal_moves = sum(1 for room_id in room_graph if room_id not in bridge_ends)
+
+    # The most bridges between the start and any component.
+    start_component = component_of[starting_room_id]
+    depths = {start_component: 0}
+    components_to_visit = [start_component]
+
+    while components_to_visit:
+        component = components_to_visit.pop()
+        for next_component in bridge_tree[component]:
+            if next_component not in depths:
+                depths[next_component] = depths[component] + 1
+                components_to_visit.append(next_component)
+
+    max_depth = max(depths.values())
+    bridge_moves = 2 * len(bridges) - max_depth
+
+    room_count = len(room_graph)
+    lower_bound = max(room_count - 1, bridge_moves + internal_moves)
+
+    return {
+        "lower_bound": lower_bound,
+        "rooms": room_count,
+        "bridges": len(bridges),
+        "components": len(component_sizes),
+        "max_bridge_depth": max_depth,
+        "internal_moves": internal_moves,
+    }
+
+
+############################################################
+#   Exact Solver
+############################################################
+
+
+def solve_exact(
+    room_graph,
+    starting_room_id,
+    upper_bound=None,
+    lower_bound=0,
+    time_limit=DEFAULT__TIME_LIMIT,
+):
+    """
+    Find a shortest walk from `starting_room_id` that visits every room,
+    by depth-first branch-and-bound over `(room, visited set)` states.
+    A state reached again at the same or a greater depth is pruned.
+
+    `upper_bound` is the length of a known walk; only shorter walks are searched for.
+    The search stops early if it finds a walk of length `lower_bound`, or after `time_limit` seconds.
+    Returns a dict with the best `length` and `moves` found (`None` if none beat `upper_bound`),
+    and whether they are proven `optimal`.
+    """
+
+    room_ids = sorted(room_graph)
+    index_of = {room_id: index for (index, room_id) in enumerate(room_ids)}
+    neighbors = [
+        tuple((direction, index_of[to_room_id]) for (direction, to_room_id) in room_graph[room_id].items())
+        for room_id in room_ids
+    ]
+
+    room_count = len(room_ids)
+    full_mask = (1 << room_count) - 1
+    start = index_of[starting_room_id]
+
+    best = {
+        "length": (upper_bound + 1) if upper_bound is not None else float("inf"),
+        "moves": None,
+    }
+    seen = dict()
+    moves = list()
+    deadline = time.perf_counter() + time_limit
+    counter = [0, False]    # -- nodes expanded, timed out
+
+    def search(room, mask, depth, unvisited):
+
+        if mask == full_mask:
+            if depth < best["length"]:
+                best["length"] = depth
+                best["moves"] = "".join(moves)
+            return
+
+        if depth + unvisited >= best["length"] or best["length"] <= lower_bound:
+            return
+
+        key = (mask << 8) | room if room_count <= 256 else (mask, room)
+
+        if seen.get(key, depth + 1) <= depth:
+            return
+
+        seen[key] = depth
+
+        counter[0] += 1
+        if counter[0] % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            counter[1] = True
+        if counter[1]:
+            return
+
+        # Try unvisited neighbors first, to find short walks early.
+        for visit_new in (True, False):
+            for (direction, next_room) in neighbors[room]:
+                if bool(mask & (1 << next_room)) != visit_new:
+                    moves.append(direction)
+                    search(
+                        next_room,
+                        mask | (1 << next_room),
+                        depth + 1,
+                        unvisited - 1 if visit_new else unvisited,
+                    )
+                    moves.pop()
+
+        return
+
+    search(start, 1 << start, 0, room_count - 1)
+
+    found = best["moves"] is not None
+
+    return {
+        "length": best["length"] if found else None,
+        "moves": best["moves"],
+        "optimal": not counter[1],
+        "states": len(seen),
+    }
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    import os
+    from .adv import Adventure
+
+    maps_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps"))
+    seeds = (0, 1, 2)
+
+    print(f"{'map':<20} {'seed':>4} {'moves':>6} {'bound':>6} {'gap':>5} {'optimum':>8}")
+
+    for name in sorted(os.listdir(maps_dir)):
+
+        if not name.endswith(".txt"):
+            continue
+
+        adventure = Adventure(os.path.join(maps_dir, name), use_cache=False)
+        room_graph = memory_from_world(adventure.world).map
+        starting_room_id = adventure.world.starting_room.id
+        lower_bound = find_lower_bound(room_graph, starting_room_id)["lower_bound"]
+
+        for seed in seeds:
+
+            adventure.seed = seed
+            move_count = len(adventure.traverse_world(show_path=False)) - 1
+            optimum = ""
+
+            if len(room_graph) <= EXACT__MAX_ROOMS:
+                exact = solve_exact(room_graph, starting_room_id, move_count, lower_bound)
+                length = exact["length"] if exact["length"] is not None else move_count
+                optimum = f"{length}{'' if exact['optimal'] else '?'}"
+
+            print(
+                f"{name:<20} {seed:>4} {move_count:>6} {lower_bound:>6}"
+                f" {move_count - lower_bound:>5} {optimum:>8}"
+            )
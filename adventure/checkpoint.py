@@ -0,0 +1,318 @@
+############################################################
+#   CHECKPOINT
+#-----------------------------------------------------------
+#   Pause and resume `Adventure.traverse_world` exactly.
+#
+#   A checkpoint is two files:
+#
+#   -   a snapshot, `<file>`: the moves so far, the player's
+#       room, the RNG state and the player's memory, all at
+#       one point of the traversal;
+#   -   an append-only log, `<file>.log`: one record per
+#       `log_interval` moves, holding the moves since the
+#       previous record and the room and RNG state after them.
+#
+#   Resuming loads the snapshot and replays each record in
+#   the log: walking its moves rebuilds the memory exactly
+#   as the traversal built it. Snapshots are rewritten less
+#   and less often as the path grows, so their total cost
+#   stays linear in its length.
+#
+#   The traversal only encodes records and snapshots. A
+#   background thread writes them, in order.
+############################################################
+
+import io
+import marshal
+import os
+import queue
+import threading
+
+from .path_buffer import PathBuffer
+from .exploration import ExplorationMemory, record_room, move_to
+
+############################################################
+
+DEFAULT__SNAPSHOT_INTERVAL = 100_000    # moves
+DEFAULT__LOG_INTERVAL = 1_000    # moves
+DEFAULT__SYNC = False
+
+FORMAT__MAGIC = b"TRAVCP"
+FORMAT__VERSION = 1
+
+LOG_SUFFIX = ".log"
+
+############################################################
+#   Encoding
+############################################################
+
+
+def write_block(stream, data):
+
+    stream.write(len(data).to_bytes(4, "little"))
+    stream.write(data)
+
+    return
+
+
+def read_block(stream):
+    """
+    Read one block written by `write_block`. Returns `None` at the end of the stream
+    or when the block was cut short, as by a crash while it was being written.
+    """
+
+    header = stream.read(4)
+
+    if len(header) < 4:
+        return None
+
+    size = int.from_bytes(header, "little")
+    data = stream.read(size)
+
+    if len(data) < size:
+        return None
+
+    return data
+
+
+def encode_state(length, room_id, rng_state, moves):
+    """
+    Encode the state of a traversal after `length` moves, ending with `moves`.
+    """
+
+    return marshal.dumps((length, room_id, rng_state, moves.to_bytes()))
+
+
+def decode_state(data):
+    """
+    Returns `(length, room_id, rng_state, moves)`.
+    """
+
+    (length, room_id, rng_state, moves_bytes) = marshal.loads(data)
+
+    return (length, room_id, rng_state, PathBuffer.from_bytes(moves_bytes))
+
+
+############################################################
+#   TraversalCheckpoint
+############################################################
+
+
+class TraversalCheckpoint:
+
+    def __init__(
+        self,
+        file_path,
+        snapshot_interval=DEFAULT__SNAPSHOT_INTERVAL,
+        log_interval=DEFAULT__LOG_INTERVAL,
+        sync=DEFAULT__SYNC,
+    ):
+
+        self.file_path = file_path
+        self.log_path = file_path + LOG_SUFFIX
+        self.snapshot_interval = snapshot_interval
+        self.log_interval = log_interval
+        self.sync = sync
+
+        # Path lengths at which the next record and snapshot are due.
+        self.logged_length = 0
+        self.next_log = log_interval
+        self.next_snapshot = snapshot_interval
+
+        self.jobs = None
+        self.writer = None
+        self.error = None
+
+        return
+
+    #-----------------------------------------------------------
+    #   Resuming
+    #-----------------------------------------------------------
+
+    def resume(self, memory, player, world):
+        """
+        Restore the traversal saved in the checkpoint files, if any.
+        `memory` and `player` are the fresh ones of a new traversal: without a snapshot,
+        the log is replayed onto them. Otherwise, `memory` is replaced by the snapshot's.
+        Returns `(memory, moves, rng_state)`, or `None` if there is no checkpoint.
+        `rng_state` is `None` if nothing was saved yet.
+        """
+
+        has_snapshot = os.path.exists(self.file_path)
+        has_log = os.path.exists(self.log_path)
+
+        if not has_snapshot and not has_log:
+            return None
+
+        moves = PathBuffer()
+        rng_state = None
+
+        if has_snapshot:
+
+            with open(self.file_path, "rb") as stream:
+
+                magic = stream.read(len(FORMAT__MAGIC) + 1)
+
+                if magic != FORMAT__MAGIC + bytes((FORMAT__VERSION,)):
+                    raise Exception("TraversalCheckpoint.FormatError", self.file_path, magic)
+
+                (length, room_id, rng_state, moves) = decode_state(read_block(stream))
+                memory = ExplorationMemory.load(stream)
+
+            player.current_room = world.rooms[room_id]
+
+        if has_log:
+
+            with open(self.log_path, "r+b") as stream:
+
+                valid_size = 0
+
+                while True:
+
+                    data = read_block(stream)
+
+                    if data is None:
+                        break
+
+                    (end, room_id, record_rng_state, segment) = decode_state(data)
+
+                    # Records from before the snapshot, left by a crash while the log was being reset.
+                    if end <= len(moves):
+                        continue
+
+                    if end - len(segment) != len(moves):
+                        break
+
+                    valid_size = stream.tell()
+
+                    for direction in segment:
+                        record_room(memory, player)
+                        move_to(memory, player, direction)
+
+                    if player.current_room.id != room_id:
+                        raise Exception("TraversalCheckpoint.ReplayError", self.log_path, end, room_id)
+
+                    moves.extend(segment)
+                    rng_state = record_rng_state
+
+                # Drop whatever follows the last record that was replayed, so new records continue it.
+                stream.truncate(valid_size)
+
+        self.logged_length = len(moves)
+        self.next_log = len(moves) + self.log_interval
+        self.next_snapshot = len(moves) + max(self.snapshot_interval, len(moves))
+
+        return (memory, moves, rng_state)
+
+    #-----------------------------------------------------------
+    #   Saving
+    #-----------------------------------------------------------
+
+    def start(self):
+        """
+        Start the background writer.
+        """
+
+        self.jobs = queue.Queue()
+        self.writer = threading.Thread(target=self.write_jobs, name="TraversalCheckpoint", daemon=True)
+        self.writer.start()
+
+        return
+
+    def save(self, moves, room_id, rng_state, memory):
+        """
+        Queue a log record of the moves since the last one, and a snapshot if one is due.
+        `moves` is the whole path so far, as a `PathBuffer` or a list of `(move, to_node)`.
+        """
+
+        if self.error is not None:
+            raise self.error
+
+        if isinstance(moves, PathBuffer):
+            length = len(moves)
+            segment = moves[self.logged_length:]
+        else:
+            length = len(moves) - 1
+            segment = PathBuffer("".join(move for (move, *rest) in moves[self.logged_length + 1:]))
+
+        self.jobs.put(("log", encode_state(length, room_id, rng_state, segment)))
+        self.logged_length = length
+        self.next_log = length + self.log_interval
+
+        if length >= self.next_snapshot:
+
+            if not isinstance(moves, PathBuffer):
+                moves = PathBuffer.from_path(moves)
+
+            snapshot = io.BytesIO()
+            snapshot.write(FORMAT__MAGIC + bytes((FORMAT__VERSION,)))
+            write_block(snapshot, encode_state(length, room_id, rng_state, moves))
+            memory.save(snapshot)
+
+            self.jobs.put(("snapshot", snapshot.getvalue()))
+            self.next_snapshot = length + max(self.snapshot_interval, length)
+
+        return
+
+    def close(self, completed):
+        """
+        Wait for queued writes to finish, and stop the writer.
+        A `completed` traversal doesn't need its checkpoint, so its files are removed.
+        """
+
+        if self.writer is not None:
+            self.jobs.put(None)
+            self.writer.join()
+            self.writer = None
+
+        if self.error is not None:
+            raise self.error
+
+        if completed:
+            for file_path in (self.file_path, self.log_path):
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+
+        return
+
+    def write_jobs(self):
+
+        log_stream = open(self.log_path, "ab")
+
+        try:
+
+            while True:
+
+                job = self.jobs.get()
+
+                if job is None:
+                    break
+
+                (kind, data) = job
+
+                if kind == "log":
+                    write_block(log_stream, data)
+                    log_stream.flush()
+                    if self.sync:
+                        os.fsync(log_stream.fileno())
+
+                else:
+                    temp_file_path = f"{self.file_path}.tmp"
+                    with open(temp_file_path, "wb") as stream:
+                        stream.write(data)
+                        if self.sync:
+                            stream.flush()
+                            os.fsync(stream.fileno())
+                    os.replace(temp_file_path, self.file_path)
+
+                    # The snapshot holds everything logged so far.
+                    log_stream.close()
+                    log_stream = open(self.log_path, "wb")
+
+        except Exception as error:
+            self.error = error
+
+        finally:
+            log_stream.close()
+
+        return
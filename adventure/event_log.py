@@ -0,0 +1,332 @@
+############################################################
+#   EVENT LOG
+#-----------------------------------------------------------
+#   A structured record of the steps of
+#   `Adventure.traverse_world`, for analyzing long
+#   traversals afterwards.
+#
+#   Each event is `(sequence, step, kind, room_id, value)`:
+#   its number among all the events logged, the number of
+#   moves made so far (counting a move event's own move),
+#   its kind, the room it happened in, and a value that
+#   depends on its kind:
+#
+#   -   `move`: the direction's code, as in `PathBuffer`;
+#       the room is the one moved to;
+#   -   `new room`: the room's number of exits;
+#   -   `dead end`: the room's number of exits, none of them
+#       unexplored;
+#   -   `bfs start`: 0;
+#   -   `bfs end`: the number of nodes the search reached;
+#       the room is the one it found, or the one it started
+#       from if it found none.
+#
+#   Events are sampled as they are logged: all of them,
+#   every `n`th one, or a uniform random sample of a fixed
+#   size (reservoir sampling). Sampled events are kept as
+#   tuples, then encoded and written in batches, as binary
+#   records of `RECORD.size` bytes or as newline-delimited
+#   JSON. A reservoir is only written when the log is closed.
+#
+#   Run `python -m adventure.event_log <file>` to summarize
+#   a log.
+############################################################
+
+import json
+import math
+import random
+import struct
+import sys
+
+############################################################
+
+EVENT__MOVE = 0
+EVENT__NEW_ROOM = 1
+EVENT__DEAD_END = 2
+EVENT__BFS_START = 3
+EVENT__BFS_END = 4
+
+EVENT_NAMES = ("move", "new room", "dead end", "bfs start", "bfs end")
+EVENT_KINDS = {name: kind for (kind, name) in enumerate(EVENT_NAMES)}
+
+FORMAT__BINARY = "binary"
+FORMAT__NDJSON = "ndjson"
+FORMATS = (FORMAT__BINARY, FORMAT__NDJSON)
+NDJSON_EXTS = (".ndjson", ".jsonl")
+
+FORMAT__MAGIC = b"TRAVEV"
+FORMAT__VERSION = 1
+
+# `(sequence, step, kind, room_id, value)`
+RECORD = struct.Struct("<QQBii")
+
+DEFAULT__EVERY = 1
+DEFAULT__BATCH_SIZE = 8192    # events
+
+############################################################
+#   Encoding
+############################################################
+
+
+def encode_events__binary(events):
+
+    pack = RECORD.pack
+
+    return b"".join(pack(*event) for event in events)
+
+
+def encode_events__ndjson(events):
+
+    return "".join(
+        f'{{"seq": {sequence}, "step": {step}, "event": "{EVENT_NAMES[kind]}", "room": {room_id}, "value": {value}}}\n'
+        for (sequence, step, kind, room_id, value) in events
+    ).encode()
+
+
+def read_events(file_path):
+    """
+    Iterate over the events of a log written by `EventLog`, in either format,
+    as `(sequence, step, kind, room_id, value)`.
+    """
+
+    with open(file_path, "rb") as stream:
+
+        magic = stream.read(len(FORMAT__MAGIC) + 1)
+
+        if magic == FORMAT__MAGIC + bytes((FORMAT__VERSION,)):
+
+            while True:
+
+                data = stream.read(RECORD.size * DEFAULT__BATCH_SIZE)
+
+                # A record cut short, as by a crash while it was being written, is left out.
+                yield from RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size])
+
+                if len(data) < RECORD.size * DEFAULT__BATCH_SIZE:
+                    break
+
+        else:
+
+            stream.seek(0)
+
+            for line in stream:
+
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+
+                yield (event["seq"], event["step"], EVENT_KINDS[event["event"]], event["room"], event["value"])
+
+    return
+
+
+############################################################
+#   EventLog
+############################################################
+
+
+class EventLog:
+
+    def __init__(
+        self,
+        file_path,
+        format=None,
+        every=DEFAULT__EVERY,
+        reservoir_size=None,
+        seed=None,
+        batch_size=DEFAULT__BATCH_SIZE,
+    ):
+        """
+        Log events to `file_path`, in `format`: `FORMAT__NDJSON` for `NDJSON_EXTS`, otherwise
+        `FORMAT__BINARY`, by default. With a `reservoir_size`, keep a uniform random sample of that
+        many events, chosen with `seed`; otherwise, keep every `every`th event, starting from the first.
+        """
+
+        if format is None:
+            format = FORMAT__NDJSON if file_path.endswith(NDJSON_EXTS) else FORMAT__BINARY
+
+        if format not in FORMATS:
+            raise Exception("EventLog.FormatError", format)
+
+        if every < 1 or (reservoir_size is not None and reservoir_size < 1):
+            raise Exception("EventLog.SamplingError", every, reservoir_size)
+
+        self.file_path = file_path
+        self.format = format
+        self.every = every
+        self.reservoir_size = reservoir_size
+        self.batch_size = batch_size
+
+        self.encode_events = encode_events__ndjson if format == FORMAT__NDJSON else encode_events__binary
+
+        # Events logged, sampled or not, and events written.
+        self.sequence = 0
+        self.written = 0
+
+        # The batch to write next, or the reservoir.
+        self.events = list()
+
+        # `log` is bound to the sampling method once, instead of checking the sampling on every event.
+        if reservoir_size is not None:
+            self.rng = random.Random(seed)
+            self.reservoir_weight = 1.0
+            self.next_sample = 0
+            self.log = self.log__reservoir
+        elif every > 1:
+            self.log = self.log__every
+        else:
+            self.log = self.log__all
+
+        self.stream = open(file_path, "wb")
+
+        if format == FORMAT__BINARY:
+            self.stream.write(FORMAT__MAGIC + bytes((FORMAT__VERSION,)))
+
+        return
+
+    #-----------------------------------------------------------
+    #   Logging
+    #-----------------------------------------------------------
+
+    def log__all(self, kind, step, room_id, value=0):
+
+        events = self.events
+        events.append((self.sequence, step, kind, room_id, value))
+        self.sequence += 1
+
+        if len(events) >= self.batch_size:
+            self.flush()
+
+        return
+
+    def log__every(self, kind, step, room_id, value=0):
+
+        sequence = self.sequence
+        self.sequence = sequence + 1
+
+        if sequence % self.every:
+            return
+
+        events = self.events
+        events.append((sequence, step, kind, room_id, value))
+
+        if len(events) >= self.batch_size:
+            self.flush()
+
+        return
+
+    def log__reservoir(self, kind, step, room_id, value=0):
+        """
+        Reservoir sampling, skipping ahead to the next event to keep ("Algorithm L"),
+        so that events which aren't kept cost one comparison.
+        """
+
+        sequence = self.sequence
+        self.sequence = sequence + 1
+
+        if sequence < self.next_sample:
+            return
+
+        event = (sequence, step, kind, room_id, value)
+        reservoir_size = self.reservoir_size
+
+        if sequence < reservoir_size:
+            self.events.append(event)
+            if sequence + 1 < reservoir_size:
+                return
+        else:
+            self.events[self.rng.randrange(reservoir_size)] = event
+
+        rng = self.rng
+        self.reservoir_weight *= math.exp(math.log(1.0 - rng.random()) / reservoir_size)
+        skip = math.floor(math.log(1.0 - rng.random()) / math.log(1.0 - self.reservoir_weight))
+        self.next_sample = sequence + skip + 1
+
+        return
+
+    #-----------------------------------------------------------
+    #   Writing
+    #-----------------------------------------------------------
+
+    def write_events(self, events):
+
+        self.stream.write(self.encode_events(events))
+        self.written += len(events)
+
+        return
+
+    def flush(self):
+        """
+        Write the current batch. A reservoir is only written by `close`.
+        """
+
+        if self.reservoir_size is None and self.events:
+            self.write_events(self.events)
+            self.events = list()
+
+        self.stream.flush()
+
+        return
+
+    def close(self):
+
+        if self.stream.closed:
+            return
+
+        if self.reservoir_size is not None:
+            self.events.sort()
+            self.write_events(self.events)
+            self.events = list()
+
+        self.flush()
+        self.stream.close()
+
+        return
+
+
+############################################################
+#   Summary
+############################################################
+
+
+def summarize_events(events):
+    """
+    Count events by kind, with the nodes reached by searches. Returns a dict.
+    """
+
+    counts = [0] * len(EVENT_NAMES)
+    search_nodes = 0
+    last_sequence = -1
+    last_step = 0
+
+    for (sequence, step, kind, room_id, value) in events:
+
+        counts[kind] += 1
+        last_sequence = sequence
+        last_step = step
+
+        if kind == EVENT__BFS_END:
+            search_nodes += value
+
+    summary = {name: counts[kind] for (kind, name) in enumerate(EVENT_NAMES)}
+    summary["events"] = sum(counts)
+    summary["last sequence"] = last_sequence
+    summary["last step"] = last_step
+    summary["nodes reached by searches"] = search_nodes
+
+    return summary
+
+
+############################################################
+#   MAIN
+############################################################
+
+if __name__ == "__main__":
+
+    for file_path in sys.argv[1:]:
+
+        print(file_path)
+
+        for (name, count) in summarize_events(read_events(file_path)).items():
+            print(f"    {name:<28} {count:>12}")
@@ -0,0 +1,291 @@
+############################################################
+#   EXACT SOLVER
+#-----------------------------------------------------------
+#   Provably shortest traversals of small worlds, found by
+#   breadth-first search over `(room, visited set)` states.
+#
+#   A state is one int: the visited bitmask shifted left,
+#   with the current room in the low bits. The first layer
+#   that holds a state with every room visited is optimal.
+#
+#   -   A table of every kept state and its depth drops
+#       states already reached, and is walked backwards to
+#       recover the path.
+#   -   Within a layer, a state is dropped when another
+#       state in the same room has visited a superset of
+#       its rooms (dominance pruning).
+#   -   Large layers are expanded in parallel: the layer is
+#       split into chunks and each worker process expands
+#       its chunk; the parent merges the results.
+#   -   The table is capped at `max_states` entries.
+############################################################
+
+import os
+import sys
+
+from .world_graph import memory_from_world
+
+############################################################
+
+DEFAULT__MAX_STATES = 5_000_000
+DEFAULT__WORKERS = 1
+
+PARALLEL__MIN_LAYER = 50_000    # smaller layers are expanded in this process
+PARALLEL__CHUNKS_PER_WORKER = 4
+
+DOMINANCE__MAX_GROUP = 64    # larger groups of same-room states are not pruned
+
+############################################################
+#   Expansion
+############################################################
+
+# Neighbor table of the world being solved, set in each worker process.
+_NEIGHBOR_BITS = None
+_ROOM_BITS = None
+
+
+def _init_worker(neighbor_bits, room_bits):
+
+    global _NEIGHBOR_BITS, _ROOM_BITS
+
+    _NEIGHBOR_BITS = neighbor_bits
+    _ROOM_BITS = room_bits
+
+    return
+
+
+def expand_states(states, neighbor_bits=None, room_bits=None):
+    """
+    Get the set of states one move away from any state in `states`.
+    `neighbor_bits[room]` lists `(next_room, 1 << next_room)` for each exit of `room`.
+    """
+
+    if neighbor_bits is None:
+        neighbor_bits = _NEIGHBOR_BITS
+        room_bits = _ROOM_BITS
+
+    room_mask = (1 << room_bits) - 1
+    next_states = set()
+
+    for state in states:
+
+        room = state & room_mask
+        mask = state >> room_bits
+
+        for (next_room, next_bit) in neighbor_bits[room]:
+            next_states.add(((mask | next_bit) << room_bits) | next_room)
+
+    return next_states
+
+
+def prune_dominated(states, room_bits):
+    """
+    Drop each state whose room has another state in `states` that visited a superset of its rooms.
+    """
+
+    room_mask = (1 << room_bits) - 1
+    groups = dict()
+
+    for state in states:
+        groups.setdefault(state & room_mask, list()).append(state >> room_bits)
+
+    kept = list()
+
+    for (room, masks) in groups.items():
+
+        if len(masks) > DOMINANCE__MAX_GROUP:
+            kept.extend((mask << room_bits) | room for mask in masks)
+            continue
+
+        # Larger sets first, so each mask only needs checking against kept ones.
+        masks.sort(key=lambda mask: bin(mask).count("1"), reverse=True)
+        maximal = list()
+
+        for mask in masks:
+            if not any(mask & other == mask for other in maximal):
+                maximal.append(mask)
+
+        kept.extend((mask << room_bits) | room for mask in maximal)
+
+    return kept
+
+
+############################################################
+#   Solver
+############################################################
+
+
+def estimate_table_bytes(depths):
+    """
+    Estimate the memory held by the `{state: depth}` table.
+    """
+
+    if not depths:
+        return sys.getsizeof(depths)
+
+    sample_state = max(depths)
+
+    return sys.getsizeof(depths) + len(depths) * sys.getsizeof(sample_state)
+
+
+def solve_exact__bfs(
+    room_graph,
+    starting_room_id,
+    max_states=DEFAULT__MAX_STATES,
+    workers=DEFAULT__WORKERS,
+):
+    """
+    Find a shortest walk from `starting_room_id` that visits every room in `room_graph`.
+    Returns a dict with the `length` and `moves` of the walk (both `None` if `max_states`
+    was reached first), the number of `states` kept, and the table's estimated `table_bytes`.
+    """
+
+    room_ids = sorted(room_graph)
+    index_of = {room_id: index for (index, room_id) in enumerate(room_ids)}
+    room_count = len(room_ids)
+    room_bits = max(1, (room_count - 1).bit_length())
+
+    neighbor_bits = tuple(
+        tuple((index_of[to_room_id], 1 << index_of[to_room_id]) for to_room_id in room_graph[room_id].values())
+        for room_id in room_ids
+    )
+
+    full_mask = (1 << room_count) - 1
+    start = index_of[starting_room_id]
+    start_state = ((1 << start) << room_bits) | start
+
+    depths = {start_state: 0}
+    layer = [start_state]
+    depth = 0
+    goal_state = start_state if room_count == 1 else None
+
+    executor = None
+
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(neighbor_bits, room_bits),
+        )
+
+    try:
+
+        while goal_state is None and layer and len(depths) < max_states:
+
+            if executor is not None and len(layer) >= PARALLEL__MIN_LAYER:
+                chunk_count = workers * PARALLEL__CHUNKS_PER_WORKER
+                chunks = [layer[i::chunk_count] for i in range(chunk_count)]
+                next_states = set()
+                for chunk_states in executor.map(expand_states, chunks):
+                    next_states |= chunk_states
+            else:
+                next_states = expand_states(layer, neighbor_bits, room_bits)
+
+            depth += 1
+            next_states = [state for state in next_states if state not in depths]
+            layer = prune_dominated(next_states, room_bits)
+
+            for state in layer:
+                depths[state] = depth
+                if state >> room_bits == full_mask:
+                    goal_state = state
+
+    finally:
+
+        if executor is not None:
+            executor.shutdown()
+
+    result = {
+        "length": None,
+        "moves": None,
+        "states": len(depths),
+        "table_bytes": estimate_table_bytes(depths),
+    }
+
+    if goal_state is None:
+        return result
+
+    result["length"] = depths[goal_state]
+    result["moves"] = trace_moves(room_graph, room_ids, room_bits, depths, goal_state)
+
+    return result
+
+
+def trace_moves(room_graph, room_ids, room_bits, depths, goal_state):
+    """
+    Walk back from `goal_state` through states one layer shallower each step.
+    Returns the moves from the starting room to `goal_state`, as a string.
+    """
+
+    room_mask = (1 << room_bits) - 1
+    index_of = {room_id: index for (index, room_id) in enumerate(room_ids)}
+
+    # `incoming[room]` lists `(prev_room, direction)` for each exit into `room`.
+    incoming = [list() for _ in room_ids]
+    for (room_id, exits) in room_graph.items():
+        for (direction, to_room_id) in exits.items():
+            incoming[index_of[to_room_id]].append((index_of[room_id], direction))
+
+    moves = list()
+    state = goal_state
+
+    while depths[state] > 0:
+
+        room = state & room_mask
+        mask = state >> room_bits
+        prev_depth = depths[state] - 1
+
+        for (prev_room, direction) in incoming[room]:
+            prev_states = (
+                (mask << room_bits) | prev_room,
+                ((mask & ~(1 << room)) << room_bits) | prev_room,
+            )
+            prev_state = next((s for s in prev_states if depths.get(s) == prev_depth), None)
+            if prev_state is not None:
+                moves.append(direction)
+                state = prev_state
+                break
+
+        else:
+            raise Exception("trace_moves.BrokenChainError", state)
+
+    moves.reverse()
+
+    return "".join(moves)
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    import time
+    from .adv import Adventure
+
+    maps_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps"))
+    worker_counts = (1, os.cpu_count() or 1)
+
+    print(f"{'map':<20} {'rooms':>5} {'workers':>7} {'length':>6} {'states':>8} {'table KiB':>9} {'seconds':>8}")
+
+    for name in sorted(os.listdir(maps_dir)):
+
+        if not name.endswith(".txt") or name == "main_maze.txt":
+            continue
+
+        adventure = Adventure(os.path.join(maps_dir, name), use_cache=False)
+        room_graph = memory_from_world(adventure.world).map
+
+        for workers in worker_counts:
+
+            started = time.perf_counter()
+            result = solve_exact__bfs(room_graph, adventure.world.starting_room.id, workers=workers)
+            elapsed = time.perf_counter() - started
+
+            assert adventure.replay_moves(result["moves"]) is not None
+
+            print(
+                f"{name:<20} {len(room_graph):>5} {workers:>7} {result['length']:>6}"
+                f" {result['states']:>8} {result['table_bytes'] / 1024:>9.1f} {elapsed:>8.3f}"
+            )
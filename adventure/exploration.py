@@ -0,0 +1,308 @@
+############################################################
+#   EXPLORATION
+#-----------------------------------------------------------
+#   Helpers for exploring a world with a player and
+#   remembering what was found in a `MemoryGraph`.
+############################################################
+
+from .memory_graph import MemoryGraph
+from .path_buffer import DIRECTIONS, DIRECTION_CODES
+
+############################################################
+
+UNKNOWN = "?"
+
+# What a peek shows behind an exit, by the number of exits of the room there.
+DEAD_END = "dead end"    # -- 1 exit: the way back
+CORRIDOR = "corridor"    # -- 2 exits
+JUNCTION = "junction"    # -- 3 or more exits
+
+INVERSE_DIRECTIONS = (
+    ("n", "s"),
+    ("e", "w"),
+)
+
+# The order `Room.get_exits` lists exits in, and so the order unknown exits are recorded in.
+EXIT_ORDER = ("n", "s", "w", "e")
+
+# Every exits mask, decoded to its directions in `EXIT_ORDER`.
+MASK_DIRECTIONS = tuple(
+    tuple(direction for direction in EXIT_ORDER if mask & (1 << DIRECTION_CODES[direction]))
+    for mask in range(1 << len(DIRECTIONS))
+)
+
+############################################################
+#   Memory
+############################################################
+
+
+class ExplorationMemory(MemoryGraph):
+    """
+    A `MemoryGraph` of rooms and the directions between them,
+    which also keeps each room's known and unknown exits as bitmasks.
+    Bit `1 << code` stands for the direction with `PathBuffer` code `code`,
+    so the inverse of a direction's code is `code ^ 1`.
+    Shortest-path trees added with `add_path_tree` are kept up to date as edges are added.
+    """
+
+    def __init__(self, *args, **kwargs):
+
+        self.known_exits = dict()
+        self.unknown_exits = dict()
+        self.path_trees = list()
+
+        super().__init__(*args, **kwargs)
+
+        return
+
+    def add_edge(self, from_node, label, to_node, weight=None):
+
+        super().add_edge(from_node, label, to_node, weight)
+
+        bit = 1 << DIRECTION_CODES[label]
+        known_exits = self.known_exits.get(from_node, 0)
+        unknown_exits = self.unknown_exits.get(from_node, 0)
+
+        if to_node == UNKNOWN:
+            self.known_exits[from_node] = known_exits & ~bit
+            self.unknown_exits[from_node] = unknown_exits | bit
+        else:
+            self.known_exits[from_node] = known_exits | bit
+            self.unknown_exits[from_node] = unknown_exits & ~bit
+
+        for path_tree in self.path_trees:
+            path_tree.add_edge(from_node, label, to_node)
+
+        return
+
+    def add_inverse_edge(self, from_node, label, to_node, weight=None):
+
+        self.add_edge(to_node, DIRECTIONS[DIRECTION_CODES[label] ^ 1], from_node, weight)
+
+        return
+
+    def add_path_tree(self, root):
+        """
+        Add a `ShortestPathTree` from `root`, updated from now on as edges are added.
+        """
+
+        from .path_tree import ShortestPathTree
+
+        path_tree = ShortestPathTree(self, root)
+        self.path_trees.append(path_tree)
+
+        return path_tree
+
+    def rebuild_exit_masks(self):
+        """
+        Recompute every room's exit masks from `map`.
+        """
+
+        self.known_exits.clear()
+        self.unknown_exits.clear()
+
+        for (room_id, exits) in self.map.items():
+
+            known_exits = 0
+            unknown_exits = 0
+
+            for (direction, to_room_id) in exits.items():
+                if to_room_id == UNKNOWN:
+                    unknown_exits |= 1 << DIRECTION_CODES[direction]
+                else:
+                    known_exits |= 1 << DIRECTION_CODES[direction]
+
+            self.known_exits[room_id] = known_exits
+            self.unknown_exits[room_id] = unknown_exits
+
+        return
+
+    @classmethod
+    def load(cls, stream):
+
+        memory = super().load(stream)
+        memory.rebuild_exit_masks()
+
+        return memory
+
+    @classmethod
+    def from_edges(cls, *args, **kwargs):
+
+        memory = super().from_edges(*args, **kwargs)
+        memory.rebuild_exit_masks()
+
+        return memory
+
+
+def make_memory():
+    """
+    Make an empty `ExplorationMemory` for remembering rooms and their exits.
+    """
+
+    return ExplorationMemory(inverse_labels=INVERSE_DIRECTIONS)
+
+
+def get_unknown_directions(memory, room_id):
+
+    return MASK_DIRECTIONS[memory.unknown_exits.get(room_id, 0)]
+
+
+def has_unknown_directions(memory, room_id):
+
+    return memory.unknown_exits.get(room_id, 0) != 0
+
+
+def find_path_to_edge_of_unknown(memory, room_id):
+
+    unknown_exits = memory.unknown_exits
+
+    def found_edge_of_unknown(curr_room_id, *rest):
+        # Returns `True` when `curr_room_id` points to `UNKNOWN`.
+        return unknown_exits.get(curr_room_id, 0) != 0
+
+    return memory.bfs__parents(found_edge_of_unknown, room_id)
+
+
+def find_path_to_edge_of_unknown__counted(memory, room_id):
+    """
+    Like `find_path_to_edge_of_unknown`, also counting the nodes the search reaches.
+    Returns `(path, node_count)`.
+    """
+
+    unknown_exits = memory.unknown_exits
+    node_count = 0
+
+    def found_edge_of_unknown(curr_room_id, *rest):
+        nonlocal node_count
+        node_count += 1
+        return unknown_exits.get(curr_room_id, 0) != 0
+
+    path = memory.bfs__parents(found_edge_of_unknown, room_id)
+
+    return (path, node_count)
+
+
+def record_room(memory, player):
+
+    room = player.current_room
+
+    if room.id not in memory.map:
+        # Add node to memory.
+        memory.add_node(room.id)
+
+        for direction in room.get_exits():
+            # Record a "blank" edge.
+            memory.add_edge(room.id, direction, UNKNOWN)
+
+    else:
+        # Record any missing connections.
+        for direction in room.get_exits():
+            if direction not in memory.map[room.id]:
+                memory.add_edge(room.id, direction, UNKNOWN)
+
+    return memory.map[room.id]
+
+
+############################################################
+#   Moving
+############################################################
+
+
+def choose_direction(memory, player, rng):
+
+    room = player.current_room
+    unknown_directions = get_unknown_directions(memory, room.id)
+
+    if unknown_directions:
+        # Randomly choose a direction.
+        return rng.choice(unknown_directions)
+
+    else:
+        # There's nowhere new to go.
+        return None
+
+
+def classify_exits(exits):
+    """
+    Classify a room by its `exits`: `DEAD_END`, `CORRIDOR` or `JUNCTION`.
+    """
+
+    if len(exits) <= 1:
+        return DEAD_END
+
+    if len(exits) == 2:
+        return CORRIDOR
+
+    return JUNCTION
+
+
+def peek_unknown_directions(memory, player, peeked):
+    """
+    Classify the room behind each unexplored exit of the player's room, with `Player.peek`.
+    `peeked` remembers `{(room_id, direction): kind}` between calls, so each exit is peeked through once.
+    Returns `{direction: kind}`.
+    """
+
+    room = player.current_room
+    kinds = dict()
+
+    for direction in get_unknown_directions(memory, room.id):
+
+        key = (room.id, direction)
+
+        if key not in peeked:
+            peeked[key] = classify_exits(player.peek(direction))
+
+        kinds[direction] = peeked[key]
+
+    return kinds
+
+
+def choose_direction__lookahead(memory, player, rng, peeked):
+    """
+    Like `choose_direction`, but peek first, and prefer dead ends, then corridors, then junctions.
+    A neighboring dead end costs a move in and a move back now, instead of a walk back to it later,
+    and leaving junctions for last keeps branches that need backtracking out of the way.
+    """
+
+    room = player.current_room
+    unknown_directions = get_unknown_directions(memory, room.id)
+
+    if len(unknown_directions) <= 1:
+        # There's no choice to make, so no need to peek.
+        return unknown_directions[0] if unknown_directions else None
+
+    kinds = peek_unknown_directions(memory, player, peeked)
+
+    for kind in (DEAD_END, CORRIDOR):
+        directions = [direction for direction in unknown_directions if kinds[direction] == kind]
+        if directions:
+            return rng.choice(directions)
+
+    return rng.choice(unknown_directions)
+
+
+def move_to(memory, player, direction):
+
+    from_room = player.current_room
+    player.travel(direction)
+    to_room = player.current_room
+
+    # Remember this connection!
+    memory.add_both_edges(from_room.id, direction, to_room.id)
+
+    return (direction, to_room.id)
+
+
+def move_from(memory, player, direction):
+
+    inverse_direction = memory.inverse_labels[direction]
+
+    from_room = player.current_room
+    player.travel(inverse_direction)
+    to_room = player.current_room
+
+    # Remember this connection!
+    memory.add_both_edges(from_room.id, inverse_direction, to_room.id)
+
+    return (direction, to_room.id)
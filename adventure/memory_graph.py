@@ -3,7 +3,12 @@
 #-----------------------------------------------------------
 ############################################################
 
-from tools.data_structures import DefaultDict, Stack, Queue
+import heapq
+import itertools
+import marshal
+import os
+
+from tools.data_structures import DefaultDict, LRUCache, Stack, Queue
 from tools.iter_tools import is_iterable
 
 ############################################################
@@ -17,6 +22,13 @@ class MemoryGraph:
     DEFAULT__EDGES = None
     DEFAULT__INVERSE_LABELS = None
     DEFAULT__USE_INVERSE_LABELS = True
+    DEFAULT__WEIGHT = 1
+    DEFAULT__QUERY_CACHE_SIZE = 1024
+
+    # Binary format of `save` and `load`.
+    FORMAT__MAGIC = b"MGRAPH"
+    FORMAT__VERSION = 1
+    FORMAT__BLOCK_NODES = 4096
 
     def __init__(
         self,
@@ -29,6 +41,18 @@ class MemoryGraph:
         self.map = DefaultDict(dict)
         self.inverse_labels = dict()
 
+        # Edge weights other than `DEFAULT__WEIGHT`, as `{from_node: {label: weight}}`.
+        # `None` until the first such weight is added, so unweighted graphs pay nothing.
+        self.weights = None
+
+        # Counts changes to edges, so cached query results know when they are stale.
+        self.version = 0
+
+        # `None` until `enable_query_cache`; see `cache_query`.
+        self.query_cache = None
+        self.query_cache_version = 0
+        self.query_cache_invalidations = 0
+
         if is_iterable(inverse_labels):
             for (label_a, label_b) in inverse_labels:
                 self.add_inverse_label(label_a, label_b)
@@ -38,14 +62,52 @@ class MemoryGraph:
                 self.add_node(node)
 
         if is_iterable(edges):
-            for (from_node, label, to_node) in edges:
+            for (from_node, label, to_node, *weight) in edges:
+                weight = weight[0] if weight else None
                 if use_inverse_labels and label in self.inverse_labels:
-                    self.add_both_edges(from_node, label, to_node)
+                    self.add_both_edges(from_node, label, to_node, weight)
                 else:
-                    self.add_edge(from_node, label, to_node)
+                    self.add_edge(from_node, label, to_node, weight)
 
         return
 
+    @classmethod
+    def from_edges(
+        cls,
+        edges,
+        inverse_labels=DEFAULT__INVERSE_LABELS,
+        use_inverse_labels=DEFAULT__USE_INVERSE_LABELS,
+    ):
+        """
+        Make a graph from many `(from_node, label, to_node)` edges at once.
+        The result is the same as `MemoryGraph(edges=edges, inverse_labels=inverse_labels)`,
+        including which of several edges with the same `from_node` and `label` is kept (the last),
+        but each edge and its inverse are added in one step instead of through `add_edge`.
+        `edges` may also be a NumPy array of shape `(count, 3)`, or anything else with `tolist`.
+        Edges are unweighted; use the constructor for weighted edges.
+        """
+
+        graph = cls(inverse_labels=inverse_labels)
+
+        if hasattr(edges, "tolist"):
+            edges = edges.tolist()
+
+        graph_map = graph.map    # -- a `DefaultDict(dict)`, so missing nodes are added on lookup
+        get_inverse_label = (graph.inverse_labels if use_inverse_labels else dict()).get
+
+        for (from_node, label, to_node) in edges:
+
+            from_edges = graph_map[from_node]
+            to_edges = graph_map[to_node]
+            from_edges[label] = to_node
+
+            inverse_label = get_inverse_label(label)
+
+            if inverse_label is not None:
+                to_edges[inverse_label] = from_node
+
+        return graph
+
     def add_inverse_label(self, label_a, label_b):
         """
         Add the inverse label pair `(label_a, label_b)` to the graph's `inverse_labels` dict.
@@ -67,9 +129,10 @@ class MemoryGraph:
 
         return
 
-    def add_edge(self, from_node, label, to_node):
+    def add_edge(self, from_node, label, to_node, weight=None):
         """
         Add a directed edge `(from_node, label, to_node)` to the graph.
+        Its weight is `weight`, or `DEFAULT__WEIGHT` if `None`.
         """
 
         if from_node not in self.map:
@@ -78,31 +141,77 @@ class MemoryGraph:
         if to_node not in self.map:
             self.add_node(to_node)
 
-        self.map[from_node][label] = to_node
+        from_edges = self.map[from_node]
+
+        if label not in from_edges or from_edges[label] != to_node:
+            from_edges[label] = to_node
+            self.version += 1
+
+        if weight is not None or self.weights is not None:
+            self.set_weight(from_node, label, weight)
 
         return
 
-    def add_inverse_edge(self, from_node, label, to_node):
+    def add_inverse_edge(self, from_node, label, to_node, weight=None):
         """
         Add a directed edge `(to_node, self.inverse_labels[label], from_node)` to the graph.
         """
 
         inverse_label = self.inverse_labels[label]
 
-        self.add_edge(to_node, inverse_label, from_node)
+        self.add_edge(to_node, inverse_label, from_node, weight)
 
         return
 
-    def add_both_edges(self, from_node, label, to_node):
+    def add_both_edges(self, from_node, label, to_node, weight=None):
         """
         Add both the forward and inverse directed edges for `(from_node, label, to_node)` to the graph.
+        Both get the same `weight`.
         """
 
-        self.add_edge(from_node, label, to_node)
-        self.add_inverse_edge(from_node, label, to_node)
+        self.add_edge(from_node, label, to_node, weight)
+        self.add_inverse_edge(from_node, label, to_node, weight)
 
         return
 
+    def set_weight(self, from_node, label, weight):
+        """
+        Set the weight of the edge from `from_node` labelled `label`.
+        A weight of `None` resets it to `DEFAULT__WEIGHT`.
+        """
+
+        if weight is None or weight == self.DEFAULT__WEIGHT:
+            if self.weights is not None and from_node in self.weights:
+                self.weights[from_node].pop(label, None)
+            return
+
+        if weight < 0:
+            raise Exception("MemoryGraph.NegativeWeightError", from_node, label, weight)
+
+        if self.weights is None:
+            self.weights = dict()
+
+        self.weights.setdefault(from_node, dict())[label] = weight
+
+        return
+
+    def get_weight(self, from_node, label):
+        """
+        Get the weight of the edge from `from_node` labelled `label`.
+        """
+
+        if self.weights is None or from_node not in self.weights:
+            return self.DEFAULT__WEIGHT
+
+        return self.weights[from_node].get(label, self.DEFAULT__WEIGHT)
+
+    def is_weighted(self):
+        """
+        Whether any edge has a weight other than `DEFAULT__WEIGHT`.
+        """
+
+        return self.weights is not None and any(self.weights.values())
+
     def get_neighbors(self, node):
         """
         Get all neighbors of the node with label `node`.
@@ -166,7 +275,10 @@ class MemoryGraph:
     ):
         """
         Find a path in the graph from `from_node` until `found(...)` is True, in customizable order.
-        The order is determined by how `paths_to_search` implements `*.push` and `*.pop`.
+        The order is determined by how `paths_to_search` implements `*.push` and `*.pop`;
+        a `PriorityQueue` or `IndexedPriorityQueue` keyed on the path orders which paths are expanded first.
+        `found` is checked when a path is pushed, not when it is popped, so the path returned is the first
+        one reached, not the cheapest: for a cheapest path by edge weight, use `dijkstra`.
         The signature of `found` is `(curr_node, curr_path, from_node, paths_to_search, visited_nodes,) -> bool`.
         """
 
@@ -260,6 +372,12 @@ class MemoryGraph:
         Find the shortest path from `from_node` to `to_node`, in breadth-first order.
         """
 
+        if self.query_cache is not None:
+            return self.cache_query(
+                ("bfs__to_node", from_node, to_node),
+                lambda: self.xfs__to_node(to_node, from_node, Queue()),
+            )
+
         return self.xfs__to_node(to_node, from_node, Queue())
 
     def dfs__to_node(self, to_node, from_node):
@@ -290,6 +408,12 @@ class MemoryGraph:
         Find the shortest path from `from_node` to a node in `to_node_set`, in breadth-first order.
         """
 
+        if self.query_cache is not None:
+            return self.cache_query(
+                ("bfs__to_node_set", from_node, frozenset(to_node_set)),
+                lambda: self.xfs__to_node_set(to_node_set, from_node, Queue()),
+            )
+
         return self.xfs__to_node_set(to_node_set, from_node, Queue())
 
     def dfs__to_node_set(self, to_node_set, from_node):
@@ -299,6 +423,315 @@ class MemoryGraph:
 
         return self.xfs__to_node_set(to_node_set, from_node, Stack())
 
+    def enable_query_cache(self, max_size=DEFAULT__QUERY_CACHE_SIZE):
+        """
+        Cache the results of `bfs__to_node` and `bfs__to_node_set`, for up to `max_size` queries,
+        dropping the least recently used. Any change to an edge through `add_edge` empties the cache.
+        After changing `map` directly, call `clear_query_cache`.
+        """
+
+        self.query_cache = LRUCache(max_size)
+        self.query_cache_version = self.version
+
+        return
+
+    def disable_query_cache(self):
+
+        self.query_cache = None
+
+        return
+
+    def clear_query_cache(self):
+
+        if self.query_cache is not None:
+            self.query_cache.clear()
+
+        return
+
+    def cache_query(self, key, search):
+        """
+        Get the result of the query `key` from the cache, or from `search()` on a miss.
+        Results are copied in and out of the cache, so callers may change them.
+        """
+
+        query_cache = self.query_cache
+
+        if self.query_cache_version != self.version:
+            if len(query_cache) > 0:
+                query_cache.clear()
+                self.query_cache_invalidations += 1
+            self.query_cache_version = self.version
+
+        path = query_cache.get(key)
+
+        if path is None:
+            path = search()
+            query_cache.put(key, list(path))
+            return path
+
+        return list(path)
+
+    def get_query_cache_stats(self):
+        """
+        Get the query cache's counts of hits, misses, evictions and invalidations, and its size.
+        Returns `None` if the cache isn't enabled.
+        """
+
+        query_cache = self.query_cache
+
+        if query_cache is None:
+            return None
+
+        lookups = query_cache.hits + query_cache.misses
+
+        return {
+            "hits": query_cache.hits,
+            "misses": query_cache.misses,
+            "hit_rate": query_cache.hits / lookups if lookups else 0.0,
+            "evictions": query_cache.evictions,
+            "invalidations": self.query_cache_invalidations,
+            "size": len(query_cache),
+            "max_size": query_cache.max_size,
+        }
+
+    def dijkstra(self, found, from_node):
+        """
+        Find a cheapest path in the graph from `from_node` to a node where `found(node)` is True.
+        Returns the path in the format of `bfs`, or `[]` if there is none.
+        On an unweighted graph, every path is as cheap as it is short,
+        so a breadth-first search over parent links is used instead of a heap.
+        """
+
+        if not self.is_weighted():
+            return self.bfs__parents(found, from_node)
+
+        distances = {from_node: 0}
+        parents = {from_node: None}
+        settled = set()
+
+        # `(distance, order, node)`; stale entries are skipped when popped.
+        order = itertools.count()
+        nodes_to_visit = [(0, next(order), from_node)]
+        weights = self.weights
+
+        while nodes_to_visit:
+
+            (distance, _, node) = heapq.heappop(nodes_to_visit)
+
+            if node in settled:
+                continue
+
+            if found(node):
+                return self.trace_parents(parents, node)
+
+            settled.add(node)
+            node_weights = weights.get(node, ())
+
+            for (label, next_node) in self.map[node].items():
+
+                next_distance = distance + (
+                    node_weights[label] if label in node_weights else self.DEFAULT__WEIGHT
+                )
+
+                if next_distance < distances.get(next_node, next_distance + 1):
+                    distances[next_node] = next_distance
+                    parents[next_node] = (label, node)
+                    heapq.heappush(nodes_to_visit, (next_distance, next(order), next_node))
+
+        return []
+
+    def bfs__parents(self, found, from_node):
+        """
+        Find a shortest path in the graph from `from_node` to a node where `found(node)` is True.
+        Unlike `bfs`, each node keeps a link to its parent instead of a copy of its path.
+        Returns the path in the format of `bfs`, or `[]` if there is none.
+        """
+
+        if found(from_node):
+            return [(None, from_node)]
+
+        parents = {from_node: None}
+        nodes_to_visit = Queue()
+        nodes_to_visit.push(from_node)
+
+        while len(nodes_to_visit) > 0:
+
+            node = nodes_to_visit.pop()
+
+            for (label, next_node) in self.map[node].items():
+
+                if next_node in parents:
+                    continue
+
+                parents[next_node] = (label, node)
+
+                if found(next_node):
+                    return self.trace_parents(parents, next_node)
+
+                nodes_to_visit.push(next_node)
+
+        return []
+
+    @staticmethod
+    def trace_parents(parents, node):
+        """
+        Follow `parents` links, `{node: (label, parent_node)}`, back from `node` to the root.
+        Returns the path from the root in the format of `bfs`.
+        """
+
+        path = list()
+
+        while parents[node] is not None:
+            (label, parent_node) = parents[node]
+            path.append((label, node))
+            node = parent_node
+
+        path.append((None, node))
+        path.reverse()
+
+        return path
+
+    def dijkstra__to_node(self, to_node, from_node):
+        """
+        Find a cheapest path from `from_node` to `to_node`.
+        """
+
+        return self.dijkstra(lambda node: node == to_node, from_node)
+
+    def dijkstra__to_node_set(self, to_node_set, from_node):
+        """
+        Find a cheapest path from `from_node` to a node in `to_node_set`.
+        """
+
+        return self.dijkstra(lambda node: node in to_node_set, from_node)
+
+    def save(self, stream, block_nodes=FORMAT__BLOCK_NODES):
+        """
+        Write the graph to the binary `stream`, `block_nodes` nodes at a time.
+
+        The stream holds a magic string and version byte, followed by blocks,
+        each a 4-byte little-endian length and a `marshal`-ed tuple:
+        -   a header: `(labels, inverse label pairs, weighted)`;
+        -   node blocks: flat records `node, degree, label index, to_node, [weight,] ...`;
+        -   an empty block, which ends the graph.
+        Nodes may be any `marshal`-able value, such as the `"?"` of unknown edges.
+        """
+
+        weighted = self.is_weighted()
+        labels = sorted({label for edges in self.map.values() for label in edges} | set(self.inverse_labels), key=repr)
+        label_indexes = {label: index for (index, label) in enumerate(labels)}
+        inverse_label_pairs = tuple(
+            (label_a, label_b) for (label_a, label_b) in self.inverse_labels.items()
+            if repr(label_a) <= repr(label_b)
+        )
+
+        def write_block(block):
+            data = marshal.dumps(block)
+            stream.write(len(data).to_bytes(4, "little"))
+            stream.write(data)
+            return
+
+        stream.write(self.FORMAT__MAGIC + bytes((self.FORMAT__VERSION,)))
+        write_block((tuple(labels), inverse_label_pairs, weighted))
+
+        weights = self.weights or dict()
+        block = list()
+        block_count = 0
+
+        for (node, edges) in self.map.items():
+
+            block.append(node)
+            block.append(len(edges))
+            node_weights = weights.get(node, ())
+
+            for (label, to_node) in edges.items():
+                block.append(label_indexes[label])
+                block.append(to_node)
+                if weighted:
+                    block.append(node_weights[label] if label in node_weights else self.DEFAULT__WEIGHT)
+
+            block_count += 1
+
+            if block_count == block_nodes:
+                write_block(tuple(block))
+                block.clear()
+                block_count = 0
+
+        if block:
+            write_block(tuple(block))
+
+        write_block(())
+
+        return
+
+    @classmethod
+    def load(cls, stream):
+        """
+        Read a graph written by `save` from the binary `stream`.
+        """
+
+        magic = stream.read(len(cls.FORMAT__MAGIC) + 1)
+
+        if magic[:-1] != cls.FORMAT__MAGIC or magic[-1:] != bytes((cls.FORMAT__VERSION,)):
+            raise Exception("MemoryGraph.load.FormatError", magic)
+
+        def read_block():
+            size = int.from_bytes(stream.read(4), "little")
+            return marshal.loads(stream.read(size))
+
+        (labels, inverse_label_pairs, weighted) = read_block()
+        graph = cls(inverse_labels=inverse_label_pairs)
+        graph_map = graph.map
+        stride = 3 if weighted else 2
+
+        while True:
+
+            block = read_block()
+
+            if not block:
+                break
+
+            position = 0
+
+            while position < len(block):
+
+                node = block[position]
+                degree = block[position + 1]
+                position += 2
+                edges = graph_map[node]
+
+                for _ in range(degree):
+                    label = labels[block[position]]
+                    edges[label] = block[position + 1]
+                    if weighted:
+                        graph.set_weight(node, label, block[position + 2])
+                    position += stride
+
+        return graph
+
+    def save_file(self, file_path):
+        """
+        Write the graph to `file_path` with `save`, replacing the file only once it is complete.
+        """
+
+        temp_file_path = f"{file_path}.tmp"
+
+        with open(temp_file_path, "wb") as stream:
+            self.save(stream)
+
+        os.replace(temp_file_path, file_path)
+
+        return
+
+    @classmethod
+    def load_file(cls, file_path):
+        """
+        Read a graph written by `save_file`.
+        """
+
+        with open(file_path, "rb") as stream:
+            return cls.load(stream)
+
 
 ############################################################
 #   Main
@@ -356,6 +789,18 @@ if __name__ == "__main__":
     results__bfs__to_node_set = memory_graph.bfs__to_node_set({3, 6, 5, 9}, 1)
     results__dfs__to_node_set = memory_graph.dfs__to_node_set({3, 6, 5, 9}, 1)
 
+    weighted_memory_graph = MemoryGraph(
+        inverse_labels=memory_graph__inverse_labels,
+        nodes=memory_graph__nodes,
+        edges=[
+            (*edge, 5) if edge == (2, "e", 3) else edge
+            for edge in memory_graph__edges
+        ],
+    )
+
+    results__dijkstra__to_node = weighted_memory_graph.dijkstra__to_node(6, 1)
+    results__dijkstra__to_node_set = weighted_memory_graph.dijkstra__to_node_set({3, 9}, 1)
+
     #-----------------------------------------------------------
 
     import pprint
@@ -390,6 +835,10 @@ if __name__ == "__main__":
         pprint.pformat(results__bfs__to_node_set),
         "--- dfs - to node set ---",
         pprint.pformat(results__dfs__to_node_set),
+        "--- dijkstra - to node (2 ← → 3 costs 5) ---",
+        pprint.pformat(results__dijkstra__to_node),
+        "--- dijkstra - to node set (2 ← → 3 costs 5) ---",
+        pprint.pformat(results__dijkstra__to_node_set),
         sep="\n\n",
     )
     print_line(liner="=", width=line_width)
@@ -0,0 +1,248 @@
+############################################################
+#   MULTI-AGENT EXPLORATION
+#-----------------------------------------------------------
+#   Several agents explore one world together, sharing a
+#   single `MemoryGraph`. A coordinator sends each idle
+#   agent to the nearest frontier room that no other agent
+#   has claimed. Agents move in lockstep rounds, so the
+#   number of rounds is the makespan.
+############################################################
+
+import random
+
+from tools.data_structures import Queue
+
+from .player import Player
+from .exploration import (
+    make_memory,
+    get_unknown_directions,
+    has_unknown_directions,
+    record_room,
+    move_to,
+)
+
+############################################################
+#   Agent
+############################################################
+
+
+class Agent:
+
+    def __init__(self, agent_id, starting_room):
+
+        self.id = agent_id
+        self.player = Player(starting_room)
+
+        # Traversed Path: a list of `(move, to_node)`
+        self.traversed_path = [(None, starting_room.id)]
+
+        # The frontier room this agent is heading to, and the moves to get there.
+        self.target = None
+        self.plan = Queue()
+
+        return
+
+    @property
+    def move_count(self):
+
+        return len(self.traversed_path) - 1
+
+
+############################################################
+#   Coordinator
+############################################################
+
+
+class Coordinator:
+
+    DEFAULT__AGENT_COUNT = 2
+    DEFAULT__SEED = None
+
+    def __init__(
+        self,
+        world,
+        agent_count=DEFAULT__AGENT_COUNT,
+        seed=DEFAULT__SEED,
+    ):
+
+        self.world = world
+        self.memory = make_memory()
+        self.rng = random.Random(seed)
+
+        self.agents = [Agent(agent_id, world.starting_room) for agent_id in range(agent_count)]
+
+        # Frontier rooms claimed as targets: `{room_id: agent_id}`
+        self.claimed_targets = dict()
+
+        self.visited_room_ids = {world.starting_room.id}
+        self.round_count = 0
+
+        return
+
+    def release_target(self, agent):
+        """
+        Release the frontier room claimed by `agent`, if any.
+        """
+
+        if agent.target is not None:
+            if self.claimed_targets.get(agent.target) == agent.id:
+                del self.claimed_targets[agent.target]
+            agent.target = None
+
+        return
+
+    def find_path_to_target(self, agent):
+        """
+        Find the path from `agent` to the nearest frontier room that no other agent has claimed.
+        """
+
+        memory = self.memory
+        claimed_targets = self.claimed_targets
+
+        def found_unclaimed_edge_of_unknown(curr_room_id, *rest):
+            return (
+                has_unknown_directions(memory, curr_room_id)
+                and claimed_targets.get(curr_room_id, agent.id) == agent.id
+            )
+
+        return memory.bfs(found_unclaimed_edge_of_unknown, agent.player.current_room.id)
+
+    def choose_direction(self, agent):
+        """
+        Choose `agent`'s next move, or `None` if it has nothing to do.
+        """
+
+        memory = self.memory
+        room_id = agent.player.current_room.id
+
+        if len(agent.plan) > 0:
+            return agent.plan.pop()
+
+        if agent.target == room_id:
+            self.release_target(agent)
+
+        unknown_directions = get_unknown_directions(memory, room_id)
+
+        if unknown_directions:
+            return self.rng.choice(unknown_directions)
+
+        self.release_target(agent)
+        path_to_target = self.find_path_to_target(agent)
+
+        if not path_to_target or len(path_to_target) < 2:
+            return None
+
+        agent.target = path_to_target[-1][1]
+        self.claimed_targets[agent.target] = agent.id
+
+        for (direction, room_id) in path_to_target[2:]:
+            agent.plan.push(direction)
+
+        return path_to_target[1][0]
+
+    def step(self, agent):
+        """
+        Let `agent` record its room and make at most one move.
+        Returns `True` if it moved.
+        """
+
+        record_room(self.memory, agent.player)
+        direction = self.choose_direction(agent)
+
+        if direction is None:
+            return False
+
+        step = move_to(self.memory, agent.player, direction)
+        agent.traversed_path.append(step)
+        self.visited_room_ids.add(step[1])
+
+        return True
+
+    def explore(self):
+        """
+        Run rounds until every room has been visited or no agent can move.
+        Returns a report of the exploration.
+        """
+
+        room_count = len(self.world.rooms)
+        moved = True
+
+        while len(self.visited_room_ids) < room_count and moved:
+
+            moved = False
+
+            for agent in self.agents:
+                if self.step(agent):
+                    moved = True
+
+            if moved:
+                self.round_count += 1
+
+        return self.report()
+
+    def report(self):
+        """
+        Summarize the exploration so far.
+        """
+
+        move_counts = [agent.move_count for agent in self.agents]
+
+        return {
+            "agents": len(self.agents),
+            "rooms_visited": len(self.visited_room_ids),
+            "makespan": max(move_counts),
+            "total_moves": sum(move_counts),
+            "moves_per_agent": move_counts,
+        }
+
+
+############################################################
+#   Comparison
+############################################################
+
+
+def compare_with_single_agent(adventure, agent_counts, seed=None):
+    """
+    Explore `adventure`'s world with each count in `agent_counts`,
+    and with the single-agent `Adventure.traverse_world`.
+    Returns `(single_agent_moves, reports)`.
+    """
+
+    single_agent_moves = len(adventure.traverse_world(show_path=False)) - 1
+
+    reports = [
+        Coordinator(adventure.world, agent_count, seed).explore()
+        for agent_count in agent_counts
+    ]
+
+    return (single_agent_moves, reports)
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    import os
+    from .adv import Adventure
+
+    maps_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps"))
+    agent_counts = (1, 2, 4, 8)
+    seed = 0
+
+    print(f"{'map':<20} {'agents':>6} {'makespan':>9} {'total':>7} {'single':>7} {'rooms':>6}")
+
+    for name in sorted(os.listdir(maps_dir)):
+
+        if not name.endswith(".txt"):
+            continue
+
+        adventure = Adventure(os.path.join(maps_dir, name), seed=seed, use_cache=False)
+        (single_agent_moves, reports) = compare_with_single_agent(adventure, agent_counts, seed)
+
+        for report in reports:
+            print(
+                f"{name:<20} {report['agents']:>6} {report['makespan']:>9}"
+                f" {report['total_moves']:>7} {single_agent_moves:>7} {report['rooms_visited']:>6}"
+            )
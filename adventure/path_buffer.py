@@ -0,0 +1,264 @@
+############################################################
+#   PATH BUFFER
+#-----------------------------------------------------------
+#   A compact sequence of moves, packed 4 per byte.
+#   Each move is a 2-bit code, chosen so that the inverse
+#   of a direction is its code with the low bit flipped.
+############################################################
+
+import itertools
+
+from .player import Player, is_invalid_move_error
+
+############################################################
+
+DIRECTIONS = ("n", "s", "e", "w")
+DIRECTION_CODES = {direction: code for (code, direction) in enumerate(DIRECTIONS)}
+
+MOVES_PER_BYTE = 4
+BITS_PER_MOVE = 2
+MOVE_MASK = (1 << BITS_PER_MOVE) - 1
+
+LENGTH_BYTES = 8
+ITER_CHUNK_BYTES = (1 << 12)
+
+# Run-length encoding: each byte holds a code in its top 2 bits and `run - 1` in the rest.
+RLE_MAX_RUN = (1 << (8 - BITS_PER_MOVE))
+
+# Every packed byte, decoded to its 4 moves.
+_BYTE_TO_MOVES = tuple(
+    "".join(DIRECTIONS[(byte >> (BITS_PER_MOVE * i)) & MOVE_MASK] for i in range(MOVES_PER_BYTE))
+    for byte in range(256)
+)
+
+# `bytes.translate` table from move characters to codes. Other characters map to 0xFF.
+_MOVES_TO_CODES = bytes(
+    DIRECTION_CODES[chr(char)] if chr(char) in DIRECTION_CODES else 0xFF
+    for char in range(256)
+)
+
+############################################################
+#   PathBuffer
+############################################################
+
+
+class PathBuffer:
+
+    __slots__ = ("_data", "_length")
+
+    def __init__(self, moves=None):
+
+        self._data = bytearray()
+        self._length = 0
+
+        if moves is not None:
+            self.extend(moves)
+
+        return
+
+    #-----------------------------------------------------------
+    #   Conversion
+    #-----------------------------------------------------------
+
+    @classmethod
+    def from_path(cls, path):
+        """
+        Make a `PathBuffer` from a traversed path: a list of `(move, to_node)`
+        whose first entry is `(None, starting_node)`.
+        """
+
+        return cls("".join(move for (move, *rest) in path[1:]))
+
+    def to_path(self, starting_room):
+        """
+        Walk the moves from `starting_room`.
+        Returns the traversed path as a list of `(move, to_node)`.
+        """
+
+        path = [(None, starting_room.id)]
+
+        try:
+            Player(starting_room).travel_many(self, path=path)
+        except Exception as error:
+            if is_invalid_move_error(error):
+                raise Exception("PathBuffer.InvalidMoveError", *error.args[1:]) from error
+            raise
+
+        return path
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Make a `PathBuffer` from bytes made by `to_bytes`.
+        """
+
+        length = int.from_bytes(data[:LENGTH_BYTES], "little")
+        packed = data[LENGTH_BYTES:]
+
+        if len(packed) != -(-length // MOVES_PER_BYTE):
+            raise Exception("PathBuffer.from_bytes.LengthError", length, len(packed))
+
+        buffer = cls()
+        buffer._data = bytearray(packed)
+        buffer._length = length
+
+        return buffer
+
+    def to_bytes(self):
+        """
+        Get the length and packed moves as bytes.
+        """
+
+        return self._length.to_bytes(LENGTH_BYTES, "little") + bytes(self._data)
+
+    @classmethod
+    def from_rle(cls, data):
+        """
+        Make a `PathBuffer` from bytes made by `to_rle`.
+        """
+
+        return cls("".join(
+            DIRECTIONS[byte >> (8 - BITS_PER_MOVE)] * ((byte & (RLE_MAX_RUN - 1)) + 1)
+            for byte in data
+        ))
+
+    def to_rle(self):
+        """
+        Get the moves run-length encoded as bytes, one byte per run of up to 64 equal moves.
+        Long corridors walked in one direction shrink the most.
+        """
+
+        data = bytearray()
+
+        for (move, run) in itertools.groupby(self.to_str()):
+
+            code = DIRECTION_CODES[move] << (8 - BITS_PER_MOVE)
+            run_length = sum(1 for _ in run)
+
+            while run_length > 0:
+                chunk = min(run_length, RLE_MAX_RUN)
+                data.append(code | (chunk - 1))
+                run_length -= chunk
+
+        return bytes(data)
+
+    def to_str(self):
+        """
+        Get the moves as a string, like `"nnesw"`.
+        """
+
+        return "".join(map(_BYTE_TO_MOVES.__getitem__, self._data))[:self._length]
+
+    #-----------------------------------------------------------
+    #   Sequence
+    #-----------------------------------------------------------
+
+    def __len__(self):
+
+        return self._length
+
+    def __iter__(self):
+
+        data = self._data
+        remaining = self._length
+
+        for start in range(0, len(data), ITER_CHUNK_BYTES):
+            chunk = "".join(map(_BYTE_TO_MOVES.__getitem__, data[start:start + ITER_CHUNK_BYTES]))
+            yield from chunk[:remaining]
+            remaining -= len(chunk)
+
+        return
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+
+            (start, stop, step) = index.indices(self._length)
+
+            if step != 1:
+                return PathBuffer(self.to_str()[index])
+
+            # Decode only the bytes that hold the slice.
+            stop = max(start, stop)
+            first_byte = start // MOVES_PER_BYTE
+            chunk = "".join(map(
+                _BYTE_TO_MOVES.__getitem__,
+                self._data[first_byte:-(-stop // MOVES_PER_BYTE)],
+            ))
+            offset = start - first_byte * MOVES_PER_BYTE
+
+            return PathBuffer(chunk[offset:offset + stop - start])
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("PathBuffer index out of range")
+
+        byte = self._data[index // MOVES_PER_BYTE]
+
+        return DIRECTIONS[(byte >> (BITS_PER_MOVE * (index % MOVES_PER_BYTE))) & MOVE_MASK]
+
+    def __eq__(self, other):
+
+        if isinstance(other, PathBuffer):
+            return self._length == other._length and self._data == other._data
+
+        return NotImplemented
+
+    def __repr__(self):
+
+        return f"PathBuffer({self.to_str()!r})"
+
+    def __sizeof__(self):
+
+        return object.__sizeof__(self) + self._data.__sizeof__()
+
+    def append(self, move):
+        """
+        Append one move.
+        """
+
+        code = DIRECTION_CODES[move]
+        offset = self._length % MOVES_PER_BYTE
+
+        if offset == 0:
+            self._data.append(code)
+        else:
+            self._data[-1] |= code << (BITS_PER_MOVE * offset)
+
+        self._length += 1
+
+        return
+
+    def extend(self, moves):
+        """
+        Append every move in `moves`: a string, a `PathBuffer`, or any iterable of moves.
+        """
+
+        if not isinstance(moves, str):
+            moves = moves.to_str() if isinstance(moves, PathBuffer) else "".join(moves)
+
+        # Fill the last, partial byte one move at a time.
+        head = (-self._length) % MOVES_PER_BYTE
+        for move in moves[:head]:
+            self.append(move)
+
+        codes = moves[head:].encode("ascii").translate(_MOVES_TO_CODES)
+
+        if 0xFF in codes:
+            raise KeyError(moves[head + codes.index(0xFF)])
+
+        data = self._data
+        full = len(codes) - len(codes) % MOVES_PER_BYTE
+
+        data.extend(
+            a | (b << 2) | (c << 4) | (d << 6)
+            for (a, b, c, d) in zip(codes[0:full:4], codes[1:full:4], codes[2:full:4], codes[3:full:4])
+        )
+        self._length += full
+
+        for code in codes[full:]:
+            self.append(DIRECTIONS[code])
+
+        return
@@ -0,0 +1,176 @@
+############################################################
+#   PATH CACHE
+#-----------------------------------------------------------
+#   An on-disk cache of solved traversal paths.
+#   Entries are keyed by a digest of the world file's content
+#   and the traversal settings, and hold the best known
+#   sequence of moves for that key, packed by `PathBuffer`.
+############################################################
+
+import hashlib
+import os
+
+from .path_buffer import PathBuffer
+
+############################################################
+
+DEFAULT__CACHE_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "../.cache/paths")
+)
+DEFAULT__MAX_BYTES = (1 << 20)    # 1 MiB
+
+ENTRY_EXT = ".moves"
+
+############################################################
+#   PathCache
+############################################################
+
+
+class PathCache:
+
+    DEFAULT__CACHE_DIR = DEFAULT__CACHE_DIR
+    DEFAULT__MAX_BYTES = DEFAULT__MAX_BYTES
+
+    def __init__(
+        self,
+        cache_dir=DEFAULT__CACHE_DIR,
+        max_bytes=DEFAULT__MAX_BYTES,
+    ):
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        return
+
+    @staticmethod
+    def make_key(world_digest, **settings):
+        """
+        Make a cache key from the content digest of a world file and the traversal `settings`.
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update(world_digest.encode("ascii"))
+        hasher.update(b"\0")
+        hasher.update(repr(sorted(settings.items())).encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    @staticmethod
+    def encode_moves(moves):
+        """
+        Encode a sequence of one-character moves as packed bytes.
+        """
+
+        return PathBuffer(moves).to_bytes()
+
+    @staticmethod
+    def decode_moves(data):
+        """
+        Decode bytes made by `encode_moves` back into a `PathBuffer`.
+        """
+
+        return PathBuffer.from_bytes(data)
+
+    def get_entry_path(self, key):
+        """
+        Get the file path of the entry for `key`.
+        """
+
+        return os.path.join(self.cache_dir, key + ENTRY_EXT)
+
+    def get(self, key):
+        """
+        Get the moves cached for `key`, or `None` if there are none.
+        A hit marks the entry as most recently used.
+        """
+
+        entry_path = self.get_entry_path(key)
+
+        try:
+            with open(entry_path, "rb") as entry_file:
+                moves = self.decode_moves(entry_file.read())
+        except Exception:
+            return None    # -- a missing, unreadable, or corrupt entry is a miss.
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return moves
+
+    def put(self, key, moves):
+        """
+        Store `moves` for `key`, unless a path at least as short is already cached.
+        Returns `True` when the entry was written.
+        """
+
+        moves = PathBuffer(moves)
+        cached_moves = self.get(key)
+
+        if cached_moves is not None and len(cached_moves) <= len(moves):
+            return False
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        entry_path = self.get_entry_path(key)
+        temp_path = entry_path + ".tmp"
+
+        with open(temp_path, "wb") as entry_file:
+            entry_file.write(self.encode_moves(moves))
+
+        os.replace(temp_path, entry_path)
+        self.evict()
+
+        return True
+
+    def discard(self, key):
+        """
+        Remove the entry for `key`, if there is one.
+        """
+
+        try:
+            os.remove(self.get_entry_path(key))
+        except OSError:
+            pass
+
+        return
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in `max_bytes`.
+        """
+
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        entries = list()
+        total_bytes = 0
+
+        for name in names:
+            if name.endswith(ENTRY_EXT):
+                entry_path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+                total_bytes += stat.st_size
+
+        entries.sort()
+
+        for (mtime, size, entry_path) in entries:
+
+            if total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+            total_bytes -= size
+
+        return
@@ -0,0 +1,317 @@
+############################################################
+#   PATH OPTIMIZER
+#-----------------------------------------------------------
+#   Shortens a valid traversal path of a `World` without
+#   losing any room it visits.
+#
+#   A path is viewed as the order in which it first visits
+#   its rooms. The optimizer:
+#
+#   -   rebuilds the path from shortest paths between the
+#       rooms in that order, skipping rooms already passed,
+#       which also drops the tail after the last new room;
+#   -   reorders the rooms it actually walks to ("waypoints")
+#       with 2-opt moves, reversing a segment of the order
+#       when that shortens the sum of shortest distances.
+#
+#   Each rebuilt path is kept only when it is shorter.
+############################################################
+
+from tools.data_structures import Queue
+
+from .path_buffer import PathBuffer
+from .world_graph import memory_from_world
+
+############################################################
+
+DEFAULT__WINDOW = 16
+DEFAULT__RADIUS = 24
+DEFAULT__MAX_ROUNDS = 100    # -- a safety limit: rounds stop once one finds no improvement
+
+############################################################
+#   Graph Helpers
+############################################################
+
+
+def find_shortest_path(room_graph, from_room_id, to_room_id):
+    """
+    Find a shortest path from `from_room_id` to `to_room_id`, as a list of `(move, to_node)`.
+    The starting room is not included.
+    """
+
+    if from_room_id == to_room_id:
+        return []
+
+    parents = {from_room_id: None}
+    rooms_to_visit = Queue()
+    rooms_to_visit.push(from_room_id)
+
+    while len(rooms_to_visit) > 0:
+
+        room_id = rooms_to_visit.pop()
+
+        for (direction, next_room_id) in room_graph[room_id].items():
+
+            if next_room_id in parents:
+                continue
+
+            parents[next_room_id] = (direction, room_id)
+
+            if next_room_id == to_room_id:
+
+                path = list()
+                curr_room_id = to_room_id
+
+                while parents[curr_room_id] is not None:
+                    (move, prev_room_id) = parents[curr_room_id]
+                    path.append((move, curr_room_id))
+                    curr_room_id = prev_room_id
+
+                path.reverse()
+                return path
+
+            rooms_to_visit.push(next_room_id)
+
+    raise Exception("find_shortest_path.UnreachableError", from_room_id, to_room_id)
+
+
+def find_distances(room_graph, from_room_id, to_room_ids, max_distance=None):
+    """
+    Find the distance from `from_room_id` to each room in `to_room_ids`.
+    The search stops as soon as all of them are found, or past `max_distance`.
+    Rooms that weren't found are left out.
+    """
+
+    to_room_ids = set(to_room_ids)
+    distances = dict()
+
+    if from_room_id in to_room_ids:
+        distances[from_room_id] = 0
+
+    remaining = len(to_room_ids) - len(distances)
+    visited = {from_room_id}
+    frontier = [from_room_id]
+    depth = 0
+
+    while frontier and remaining > 0 and (max_distance is None or depth < max_distance):
+
+        depth += 1
+        next_frontier = list()
+
+        for room_id in frontier:
+            for next_room_id in room_graph[room_id].values():
+                if next_room_id not in visited:
+                    visited.add(next_room_id)
+                    next_frontier.append(next_room_id)
+                    if next_room_id in to_room_ids:
+                        distances[next_room_id] = depth
+                        remaining -= 1
+
+        frontier = next_frontier
+
+    return distances
+
+
+############################################################
+#   Passes
+############################################################
+
+
+def walk_moves(room_graph, starting_room_id, moves):
+    """
+    Walk `moves` from `starting_room_id`. Returns the list of rooms entered, starting room first.
+    """
+
+    room_ids = [starting_room_id]
+    room_id = starting_room_id
+
+    for move in moves:
+        room_id = room_graph[room_id][move]
+        room_ids.append(room_id)
+
+    return room_ids
+
+
+def get_first_visit_order(room_ids):
+    """
+    Get the rooms of a walk in the order they are first visited.
+    """
+
+    return list(dict.fromkeys(room_ids))
+
+
+def rebuild_path(room_graph, starting_room_id, order):
+    """
+    Walk shortest paths through the rooms in `order`, skipping rooms already visited,
+    and stopping once every room in `order` has been visited.
+    Returns `(moves, waypoints, groups, legs)`: the moves, the rooms actually walked to,
+    the rooms first visited on the way to each waypoint (ending with the waypoint),
+    and the length of the walk to each waypoint.
+    """
+
+    room_count = len(set(order) | {starting_room_id})
+    visited = {starting_room_id}
+
+    moves = list()
+    waypoints = [starting_room_id]
+    groups = [[starting_room_id]]
+    legs = list()
+
+    room_id = starting_room_id
+
+    for target_room_id in order:
+
+        if len(visited) == room_count:
+            break
+
+        if target_room_id in visited:
+            continue
+
+        leg = find_shortest_path(room_graph, room_id, target_room_id)
+        group = list()
+
+        for (move, next_room_id) in leg:
+            moves.append(move)
+            if next_room_id not in visited:
+                visited.add(next_room_id)
+                group.append(next_room_id)
+
+        waypoints.append(target_room_id)
+        groups.append(group)
+        legs.append(len(leg))
+        room_id = target_room_id
+
+    return (moves, waypoints, groups, legs)
+
+
+def two_opt(
+    room_graph,
+    waypoints,
+    groups,
+    legs,
+    window=DEFAULT__WINDOW,
+    radius=DEFAULT__RADIUS,
+):
+    """
+    Improve the order of `waypoints` (the first stays put) by reversing segments
+    of up to `window` waypoints when that shortens the open walk through them.
+    New legs longer than `radius` aren't considered, which bounds each search.
+    `legs[i]` is the distance from `waypoints[i]` to `waypoints[i + 1]`.
+    `groups` are reversed along with `waypoints`, so walking them in order still visits every room.
+    All three are updated in place. Returns `True` if the order changed.
+    """
+
+    improved = False
+    count = len(waypoints)
+
+    for i in range(1, count - 1):
+
+        last = min(count - 1, i + window)
+
+        before = waypoints[i - 1]
+        first = waypoints[i]
+
+        # A reversal can only help if its new legs are shorter than the two it replaces.
+        max_distance = min(radius, legs[i - 1] + max(legs[i:last + 1], default=0))
+
+        from_before = find_distances(room_graph, before, waypoints[i + 1:last + 1], max_distance)
+
+        if not from_before:
+            continue
+
+        from_first = find_distances(room_graph, first, waypoints[i + 2:last + 2], max_distance)
+
+        for j in range(i + 1, last + 1):
+
+            after = waypoints[j + 1] if j + 1 < count else None
+
+            if waypoints[j] not in from_before or (after is not None and after not in from_first):
+                continue
+
+            old_length = legs[i - 1] + (legs[j] if after is not None else 0)
+            new_length = (
+                from_before[waypoints[j]]
+                + (from_first[after] if after is not None else 0)
+            )
+
+            if new_length < old_length:
+
+                waypoints[i:j + 1] = waypoints[i:j + 1][::-1]
+                groups[i:j + 1] = [group[::-1] for group in groups[i:j + 1][::-1]]
+                legs[i:j] = legs[i:j][::-1]
+                legs[i - 1] = from_before[waypoints[i]]
+                if after is not None:
+                    legs[j] = from_first[after]
+
+                improved = True
+                break
+
+    return improved
+
+
+############################################################
+#   Optimizer
+############################################################
+
+
+def optimize_moves(
+    world,
+    moves,
+    window=DEFAULT__WINDOW,
+    radius=DEFAULT__RADIUS,
+    max_rounds=DEFAULT__MAX_ROUNDS,
+    room_graph=None,
+):
+    """
+    Shorten `moves`, a valid walk from the world's starting room, keeping every room it visits.
+    Rounds of `two_opt` run until one finds no improvement, or for at most `max_rounds` rounds,
+    as a safety limit. Returns the shortest walk found, as a `PathBuffer`.
+    """
+
+    if room_graph is None:
+        room_graph = memory_from_world(world).map
+
+    starting_room_id = world.starting_room.id
+    order = get_first_visit_order(walk_moves(room_graph, starting_room_id, moves))
+
+    best_moves = PathBuffer(moves)
+    (rebuilt_moves, waypoints, groups, legs) = rebuild_path(room_graph, starting_room_id, order)
+
+    if len(rebuilt_moves) < len(best_moves):
+        best_moves = PathBuffer(rebuilt_moves)
+
+    for _ in range(max_rounds):
+
+        if not two_opt(room_graph, waypoints, groups, legs, window, radius):
+            break
+
+        order = [room_id for group in groups[1:] for room_id in group]
+        (rebuilt_moves, waypoints, groups, legs) = rebuild_path(room_graph, starting_room_id, order)
+
+        if len(rebuilt_moves) < len(best_moves):
+            best_moves = PathBuffer(rebuilt_moves)
+
+    return best_moves
+
+
+def optimize_path(
+    world,
+    traversed_path,
+    window=DEFAULT__WINDOW,
+    radius=DEFAULT__RADIUS,
+    max_rounds=DEFAULT__MAX_ROUNDS,
+):
+    """
+    Shorten a traversed path, a list of `(move, to_node)` from `traverse_world`.
+    Returns a list of `(move, to_node)` that visits the same rooms.
+    """
+
+    moves = optimize_moves(
+        world,
+        PathBuffer.from_path(traversed_path),
+        window=window,
+        radius=radius,
+        max_rounds=max_rounds,
+    )
+
+    return moves.to_path(world.starting_room)
@@ -0,0 +1,244 @@
+############################################################
+#   PATH TREE
+#-----------------------------------------------------------
+#   Shortest-path trees of a `MemoryGraph`, for answering
+#   "route to X" without a search per query.
+#
+#   A `ShortestPathTree` is a breadth-first search tree
+#   from one root (the starting room, or any hub), kept as
+#   parent links and depths. A route is read off the tree by
+#   following parent links, from both ends up to where they
+#   meet. Routes to and from the root are shortest paths;
+#   other routes go through the tree, so they are only as
+#   short as the tree allows.
+#
+#   The tree follows the graph as it grows: when an edge is
+#   added, only the nodes it brings closer to the root are
+#   updated, instead of searching again from the root.
+#   Edges are assumed to be only ever added (replacing an
+#   edge to `UNKNOWN` counts as adding it); after removing
+#   or redirecting edges, call `rebuild`. Over a whole
+#   exploration, the updates add up to more than one rebuild
+#   at the end would cost: they pay off when routes are
+#   needed while the world is still being explored.
+############################################################
+
+from .exploration import UNKNOWN
+
+############################################################
+#   ShortestPathTree
+############################################################
+
+
+class ShortestPathTree:
+
+    def __init__(self, graph, root, skip_nodes=(UNKNOWN,)):
+        """
+        Make the shortest-path tree of `graph` from `root`.
+        Nodes in `skip_nodes`, like the `UNKNOWN` placeholder, are left out of the tree.
+        """
+
+        self.graph = graph
+        self.root = root
+        self.skip_nodes = frozenset(skip_nodes)
+
+        # `{node: (label, parent_node)}`, `None` for the root, and `{node: depth}`.
+        self.parents = None
+        self.depths = None
+
+        self.rebuild()
+
+        return
+
+    def __contains__(self, node):
+
+        return node in self.depths
+
+    def __len__(self):
+
+        return len(self.depths)
+
+    #-----------------------------------------------------------
+    #   Building
+    #-----------------------------------------------------------
+
+    def rebuild(self):
+        """
+        Rebuild the tree from scratch, by a breadth-first search from the root.
+        """
+
+        self.parents = {self.root: None}
+        self.depths = {self.root: 0}
+
+        self.relax_from(self.root)
+
+        return
+
+    def add_edge(self, from_node, label, to_node):
+        """
+        Update the tree for the new edge `(from_node, label, to_node)` of the graph.
+        """
+
+        depths = self.depths
+
+        if to_node in self.skip_nodes or from_node not in depths:
+            return
+
+        depth = depths[from_node] + 1
+
+        if to_node in depths and depths[to_node] <= depth:
+            return
+
+        self.parents[to_node] = (label, from_node)
+        depths[to_node] = depth
+
+        self.relax_from(to_node)
+
+        return
+
+    def relax_from(self, from_node):
+        """
+        Breadth-first search from `from_node`, through nodes that the search brings closer to the root.
+        `from_node` must already have its parent and depth.
+        Nodes not in the graph yet are looked up without adding them to its map (a `DefaultDict`).
+        """
+
+        graph_map = self.graph.map
+        parents = self.parents
+        depths = self.depths
+        skip_nodes = self.skip_nodes
+
+        # Every node in a frontier has the same depth, so frontiers are searched layer by layer.
+        frontier = [from_node]
+        next_depth = depths[from_node] + 1
+
+        while frontier:
+
+            next_frontier = list()
+
+            for node in frontier:
+
+                if node not in graph_map:
+                    continue
+
+                for (label, next_node) in graph_map[node].items():
+                    if next_depth < depths.get(next_node, next_depth + 1) and next_node not in skip_nodes:
+                        parents[next_node] = (label, node)
+                        depths[next_node] = next_depth
+                        next_frontier.append(next_node)
+
+            frontier = next_frontier
+            next_depth += 1
+
+        return
+
+    #-----------------------------------------------------------
+    #   Routes
+    #-----------------------------------------------------------
+
+    def get_depth(self, node):
+        """
+        Get the length of a shortest path from the root to `node`, or `None` if it can't be reached.
+        """
+
+        return self.depths.get(node)
+
+    def get_path_from_root(self, node):
+        """
+        Get a shortest path from the root to `node`, in the format of `MemoryGraph.bfs`.
+        """
+
+        return self.graph.trace_parents(self.parents, node)
+
+    def get_path_to_root(self, node):
+        """
+        Get a shortest path from `node` to the root, in the format of `MemoryGraph.bfs`.
+        Walking an edge backwards uses the graph's inverse labels.
+        """
+
+        inverse_labels = self.graph.inverse_labels
+        parents = self.parents
+        path = [(None, node)]
+
+        while parents[node] is not None:
+            (label, parent_node) = parents[node]
+            path.append((inverse_labels[label], parent_node))
+            node = parent_node
+
+        return path
+
+    def find_meeting_node(self, node_a, node_b):
+        """
+        Find the deepest node of the tree on the paths from the root to both `node_a` and `node_b`.
+        """
+
+        parents = self.parents
+        depths = self.depths
+
+        while depths[node_a] > depths[node_b]:
+            node_a = parents[node_a][1]
+
+        while depths[node_b] > depths[node_a]:
+            node_b = parents[node_b][1]
+
+        while node_a != node_b:
+            node_a = parents[node_a][1]
+            node_b = parents[node_b][1]
+
+        return node_a
+
+    def get_route_length(self, from_node, to_node):
+        """
+        Get the length of `get_route(from_node, to_node)`, or `None` if either node isn't in the tree.
+        """
+
+        if from_node not in self.depths or to_node not in self.depths:
+            return None
+
+        meeting_node = self.find_meeting_node(from_node, to_node)
+
+        return self.depths[from_node] + self.depths[to_node] - 2 * self.depths[meeting_node]
+
+    def get_route(self, from_node, to_node):
+        """
+        Get a path from `from_node` to `to_node` through the tree, in the format of `MemoryGraph.bfs`:
+        up from `from_node` to where the two paths from the root meet, then down to `to_node`.
+        Returns `[]` if either node isn't in the tree.
+        """
+
+        if from_node not in self.depths or to_node not in self.depths:
+            return []
+
+        meeting_node = self.find_meeting_node(from_node, to_node)
+        meeting_depth = self.depths[meeting_node]
+
+        path_up = self.get_path_to_root(from_node)[:self.depths[from_node] - meeting_depth + 1]
+        path_down = self.get_path_from_root(to_node)[meeting_depth + 1:]
+
+        return path_up + path_down
+
+
+############################################################
+#   Routing
+############################################################
+
+
+def find_route(path_trees, from_node, to_node):
+    """
+    Get the shortest of the routes from `from_node` to `to_node` through any of `path_trees`,
+    in the format of `MemoryGraph.bfs`, or `[]` if no tree holds both nodes.
+    """
+
+    best_tree = None
+    best_length = None
+
+    for path_tree in path_trees:
+        length = path_tree.get_route_length(from_node, to_node)
+        if length is not None and (best_length is None or length < best_length):
+            best_tree = path_tree
+            best_length = length
+
+    if best_tree is None:
+        return []
+
+    return best_tree.get_route(from_node, to_node)
@@ -2,11 +2,20 @@
 #   Player
 ############################################################
 
+# The `Room` attribute that holds the neighbor in each direction.
+DIRECTION_ATTRS = {
+    "n": "n_to",
+    "s": "s_to",
+    "e": "e_to",
+    "w": "w_to",
+}
+
 
 class Player:
 
     def __init__(self, starting_room):
         self.current_room = starting_room
+        self.peek_count = 0
 
     def travel(self, direction, show_rooms=False):
         next_room = self.current_room.get_room_in_direction(direction)
@@ -16,3 +25,63 @@ class Player:
                 next_room.print_room_description(self)
         else:
             print("You cannot move in that direction.")
+
+    def peek(self, direction):
+        """
+        Look through the exit in `direction` without moving.
+        Returns the exits of the room there, or `None` if there is no room there.
+        Each peek is counted in `peek_count`.
+        """
+
+        self.peek_count += 1
+        next_room = self.current_room.get_room_in_direction(direction)
+
+        return next_room.get_exits() if next_room is not None else None
+
+    def travel_many(self, moves, visited=None, visit_counts=None, path=None):
+        """
+        Travel each direction in `moves` in order, without printing.
+        Rooms entered are added to the set `visited` and counted in the dict `visit_counts`, if given,
+        and each move is appended to the list `path` as `(direction, room_id)`, if given.
+        Returns the final room.
+
+        On the first invalid move, the player stays in the last room reached
+        and `Player.InvalidMoveError` is raised with the move's index and direction.
+        """
+
+        room = self.current_room
+        direction_attrs = DIRECTION_ATTRS
+
+        for (index, direction) in enumerate(moves):
+
+            next_room = (
+                getattr(room, direction_attrs[direction])
+                if direction in direction_attrs else None
+            )
+
+            if next_room is None:
+                self.current_room = room
+                raise Exception("Player.InvalidMoveError", index, direction)
+
+            room = next_room
+
+            if visited is not None:
+                visited.add(room)
+
+            if visit_counts is not None:
+                visit_counts[room] = visit_counts.get(room, 0) + 1
+
+            if path is not None:
+                path.append((direction, room.id))
+
+        self.current_room = room
+
+        return room
+
+
+def is_invalid_move_error(error):
+    """
+    Whether `error` was raised by `Player.travel_many` for an invalid move.
+    """
+
+    return error.args[:1] == ("Player.InvalidMoveError",)
@@ -2,9 +2,6 @@
 #   World
 ############################################################
 
-import random
-import math
-
 from .room import Room
 
 ############################################################
@@ -0,0 +1,136 @@
+############################################################
+#   WORLD CACHE
+#-----------------------------------------------------------
+#   A `marshal`-ed cache of parsed world files.
+#   Each cache file sits next to its source map and is
+#   invalidated when the source's mtime or size changes.
+############################################################
+
+import marshal
+import os
+import sys
+
+# `ast` and `hashlib` are only needed on a cache miss, so they are imported there.
+
+############################################################
+
+CACHE_EXT = ".marshal"
+CACHE_VERSION = (1, marshal.version, sys.version_info[:2])
+
+############################################################
+#   Parsing
+############################################################
+
+
+def get_cache_file(world_file):
+    """
+    Get the path of the cache file for `world_file`.
+    """
+
+    return world_file + CACHE_EXT
+
+
+def parse_world_bytes(world_bytes):
+    """
+    Parse the raw bytes of a world file into its `room_graph` dict.
+    """
+
+    import ast
+
+    return ast.literal_eval(world_bytes.decode("utf-8"))
+
+
+def read_world_file(world_file):
+    """
+    Read and parse `world_file`, without using the cache.
+    Returns `(world_info, world_digest)`.
+    """
+
+    import hashlib
+
+    with open(world_file, "rb") as world_file_stream:
+        world_bytes = world_file_stream.read()
+
+    world_info = parse_world_bytes(world_bytes)
+    world_digest = hashlib.sha256(world_bytes).hexdigest()
+
+    return (world_info, world_digest)
+
+
+############################################################
+#   Loading
+############################################################
+
+
+def load_cached_world(world_file):
+    """
+    Load the cached parse of `world_file`.
+    Returns `(world_info, world_digest)`, or `None` if the cache is missing or stale.
+    """
+
+    try:
+        stat = os.stat(world_file)
+        with open(get_cache_file(world_file), "rb") as cache_file:
+            entry = marshal.loads(cache_file.read())
+    except (OSError, EOFError, TypeError, ValueError):
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+
+    if (
+        entry.get("version") != CACHE_VERSION
+        or entry.get("mtime_ns") != stat.st_mtime_ns
+        or entry.get("size") != stat.st_size
+    ):
+        return None
+
+    return (entry["world_info"], entry["world_digest"])
+
+
+def save_cached_world(world_file, world_info, world_digest):
+    """
+    Save the parse of `world_file` next to it.
+    Returns `True` when the cache file was written.
+    """
+
+    cache_file_path = get_cache_file(world_file)
+    temp_file_path = cache_file_path + ".tmp"
+
+    try:
+        stat = os.stat(world_file)
+        with open(temp_file_path, "wb") as cache_file:
+            marshal.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "world_digest": world_digest,
+                    "world_info": world_info,
+                },
+                cache_file,
+            )
+        os.replace(temp_file_path, cache_file_path)
+    except OSError:
+        return False
+
+    return True
+
+
+def load_world(world_file, use_cache=True):
+    """
+    Load the `room_graph` dict of `world_file`, using its cache when it is fresh.
+    Returns `(world_info, world_digest)`.
+    """
+
+    if use_cache:
+        cached = load_cached_world(world_file)
+        if cached is not None:
+            return cached
+
+    (world_info, world_digest) = read_world_file(world_file)
+
+    if use_cache:
+        save_cached_world(world_file, world_info, world_digest)
+
+    return (world_info, world_digest)
@@ -0,0 +1,249 @@
+############################################################
+#   WORLD GRAPH
+#-----------------------------------------------------------
+#   Whole-world graphs for offline planning, built straight
+#   from a `World`'s room links or from the raw world info
+#   (`{room_id: [(x, y), {direction: room_id}]}`), in one
+#   pass over the rooms, instead of by walking the world:
+#
+#   -   `memory_from_world`, `memory_from_world_info`: an
+#       `ExplorationMemory` with every exit known, as
+#       `traverse_world` would have left it;
+#   -   `CSRGraph`: a compressed sparse row snapshot, with
+#       each room's exits in one slice of flat arrays, for
+#       fast repeated searches such as distance indexes.
+############################################################
+
+import array
+
+from .exploration import EXIT_ORDER, INVERSE_DIRECTIONS, ExplorationMemory
+from .path_buffer import DIRECTIONS, DIRECTION_CODES
+from .player import DIRECTION_ATTRS
+
+############################################################
+
+# `(direction, Room attribute, exits mask bit)`, in `EXIT_ORDER`.
+EXIT_LINKS = tuple(
+    (direction, DIRECTION_ATTRS[direction], 1 << DIRECTION_CODES[direction])
+    for direction in EXIT_ORDER
+)
+
+UNREACHABLE = -1
+
+############################################################
+#   Memory Graphs
+############################################################
+
+
+def memory_from_world(world):
+    """
+    Make an `ExplorationMemory` of every room and exit of `world`, from its rooms' links.
+    """
+
+    memory = ExplorationMemory(inverse_labels=INVERSE_DIRECTIONS)
+    graph_map = memory.map
+    known_exits = memory.known_exits
+    unknown_exits = memory.unknown_exits
+
+    for (room_id, room) in world.rooms.items():
+
+        exits = dict()
+        mask = 0
+
+        for (direction, attr, bit) in EXIT_LINKS:
+            to_room = getattr(room, attr)
+            if to_room is not None:
+                exits[direction] = to_room.id
+                mask |= bit
+
+        graph_map[room_id] = exits
+        known_exits[room_id] = mask
+        unknown_exits[room_id] = 0
+
+    return memory
+
+
+def memory_from_world_info(world_info):
+    """
+    Make an `ExplorationMemory` of every room and exit in `world_info`,
+    as loaded from a map file: `{room_id: [(x, y), {direction: room_id}]}`.
+    """
+
+    memory = ExplorationMemory(inverse_labels=INVERSE_DIRECTIONS)
+    graph_map = memory.map
+    known_exits = memory.known_exits
+    unknown_exits = memory.unknown_exits
+
+    for (room_id, (coords, room_exits)) in world_info.items():
+
+        mask = 0
+
+        for direction in room_exits:
+            mask |= 1 << DIRECTION_CODES[direction]
+
+        graph_map[room_id] = dict(room_exits)
+        known_exits[room_id] = mask
+        unknown_exits[room_id] = 0
+
+    return memory
+
+
+############################################################
+#   CSRGraph
+############################################################
+
+
+class CSRGraph:
+    """
+    A read-only graph of rooms in compressed sparse row form.
+    Rooms are numbered `0 ... len(room_ids) - 1` in the order of `room_ids`.
+    The exits of room number `i` are `targets[offsets[i]:offsets[i + 1]]`,
+    with their `PathBuffer` direction codes in `codes` at the same positions.
+    """
+
+    __slots__ = ("room_ids", "index_of", "offsets", "targets", "codes")
+
+    def __init__(self, room_ids, index_of, offsets, targets, codes):
+
+        self.room_ids = room_ids
+        self.index_of = index_of
+        self.offsets = offsets
+        self.targets = targets
+        self.codes = codes
+
+        return
+
+    @classmethod
+    def from_exits(cls, room_exits):
+        """
+        Make a `CSRGraph` from `(room_id, {direction: to_room_id})` pairs.
+        """
+
+        room_exits = list(room_exits)
+        room_ids = [room_id for (room_id, exits) in room_exits]
+        index_of = {room_id: index for (index, room_id) in enumerate(room_ids)}
+
+        offsets = array.array("q", [0])
+        targets = array.array("q")
+        codes = array.array("b")
+
+        for (room_id, exits) in room_exits:
+            for (direction, to_room_id) in exits.items():
+                targets.append(index_of[to_room_id])
+                codes.append(DIRECTION_CODES[direction])
+            offsets.append(len(targets))
+
+        return cls(room_ids, index_of, offsets, targets, codes)
+
+    @classmethod
+    def from_world(cls, world):
+        """
+        Make a `CSRGraph` of `world` from its rooms' links.
+        """
+
+        return cls.from_exits(
+            (
+                room_id,
+                {
+                    direction: getattr(room, attr).id
+                    for (direction, attr, bit) in EXIT_LINKS
+                    if getattr(room, attr) is not None
+                },
+            )
+            for (room_id, room) in world.rooms.items()
+        )
+
+    @classmethod
+    def from_world_info(cls, world_info):
+        """
+        Make a `CSRGraph` from `world_info`, as loaded from a map file.
+        """
+
+        return cls.from_exits(
+            (room_id, room_exits) for (room_id, (coords, room_exits)) in world_info.items()
+        )
+
+    def __len__(self):
+
+        return len(self.room_ids)
+
+    def get_neighbors(self, room_id):
+        """
+        Get the exits of room `room_id` as `{direction: to_room_id}`.
+        """
+
+        index = self.index_of[room_id]
+        room_ids = self.room_ids
+
+        return {
+            DIRECTIONS[self.codes[position]]: room_ids[self.targets[position]]
+            for position in range(self.offsets[index], self.offsets[index + 1])
+        }
+
+    def to_room_graph(self):
+        """
+        Get the graph as `{room_id: {direction: to_room_id}}`.
+        """
+
+        return {room_id: self.get_neighbors(room_id) for room_id in self.room_ids}
+
+    def find_distances(self, from_room_id):
+        """
+        Find the number of moves from `from_room_id` to every room, by breadth-first search.
+        Returns an `array` indexed by room number, holding `UNREACHABLE` for rooms that can't be reached.
+        """
+
+        offsets = self.offsets
+        targets = self.targets
+
+        distances = array.array("q", [UNREACHABLE]) * len(self.room_ids)
+        start = self.index_of[from_room_id]
+        distances[start] = 0
+        frontier = [start]
+        distance = 0
+
+        while frontier:
+
+            distance += 1
+            next_frontier = list()
+
+            for index in frontier:
+                for position in range(offsets[index], offsets[index + 1]):
+                    next_index = targets[position]
+                    if distances[next_index] == UNREACHABLE:
+                        distances[next_index] = distance
+                        next_frontier.append(next_index)
+
+            frontier = next_frontier
+
+        return distances
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    import os
+    import time
+    from .adv import Adventure
+
+    world_file = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps/main_maze.txt"))
+    adventure = Adventure(world_file, seed=0, use_cache=False)
+
+    for (name, build) in (
+        ("memory_from_world", lambda: memory_from_world(adventure.world)),
+        ("memory_from_world_info", lambda: memory_from_world_info(adventure.world_info)),
+        ("CSRGraph.from_world", lambda: CSRGraph.from_world(adventure.world)),
+        ("CSRGraph.from_world_info", lambda: CSRGraph.from_world_info(adventure.world_info)),
+    ):
+        started = time.perf_counter()
+        graph = build()
+        elapsed = time.perf_counter() - started
+        room_count = len(graph.map) if hasattr(graph, "map") else len(graph)
+        print(f"{name:<26} {room_count:>6} rooms {elapsed * 1000:>8.2f} ms")
+
+    csr_graph = CSRGraph.from_world(adventure.world)
+    distances = csr_graph.find_distances(adventure.world.starting_room.id)
+    print(f"farthest room from the start: {max(distances)} moves")
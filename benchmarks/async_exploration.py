@@ -0,0 +1,59 @@
+############################################################
+#   BENCHMARK : ASYNC EXPLORATION
+#-----------------------------------------------------------
+#   Throughput of the `asyncio` traversal at different
+#   simulated latencies, with and without lookahead.
+#
+#   Run with `python -m benchmarks.async_exploration`.
+############################################################
+
+import asyncio
+import os
+import time
+
+from adventure.adv import Adventure
+from adventure.async_exploration import LocalWorldBackend, traverse_world
+
+############################################################
+
+WORLD_FILE = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps/main_maze.txt"))
+
+LATENCIES = (0.0, 0.0005, 0.001, 0.002)    # seconds per query
+JITTER_RATIO = 0.5    # jitter as a fraction of latency
+
+SEED = 0
+
+############################################################
+
+
+def bench(world, latency, lookahead):
+
+    backend = LocalWorldBackend(world, latency, latency * JITTER_RATIO, seed=SEED)
+
+    started = time.perf_counter()
+    traversed_path = asyncio.run(traverse_world(backend, seed=SEED, lookahead=lookahead))
+    elapsed = time.perf_counter() - started
+
+    move_count = len(traversed_path) - 1
+
+    print(
+        f"{latency * 1000:>10.2f} {str(lookahead):>9} {move_count:>6} {backend.query_count:>7}"
+        f" {elapsed:>9.3f} {move_count / elapsed:>11.0f}"
+    )
+
+    return
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    world = Adventure(WORLD_FILE, use_cache=False).world
+
+    print(f"{'latency ms':>10} {'lookahead':>9} {'moves':>6} {'queries':>7} {'seconds':>9} {'moves/sec':>11}")
+
+    for latency in LATENCIES:
+        for lookahead in (False, True):
+            bench(world, latency, lookahead)
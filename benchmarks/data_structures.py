@@ -0,0 +1,213 @@
+############################################################
+#   BENCHMARK : DATA STRUCTURES
+#-----------------------------------------------------------
+#   Push/pop throughput of the frontier containers, and
+#   the `MemoryGraph` search loops that use them,
+#   against the deque wrappers they replaced, and the
+#   memory each holds for a queue of node ids.
+#
+#   Run with `python -m benchmarks.data_structures`.
+############################################################
+
+import collections
+import sys
+import timeit
+
+from adventure.memory_graph import MemoryGraph
+from benchmarks.synthetic import make_room_graph
+from tools.data_structures import Queue, Stack, RingQueue, PriorityQueue, IndexedPriorityQueue
+
+############################################################
+
+VALUE_COUNT = 200_000
+ROOM_COUNT = 20_000
+
+REPEAT = 5
+
+############################################################
+#   Baselines
+############################################################
+
+
+class LegacyQueue:
+
+    def __init__(self):
+
+        self.__container = collections.deque()
+        return
+
+    def __len__(self):
+
+        return len(self.__container)
+
+    def push(self, value):
+
+        self.__container.append(value)
+        return
+
+    def pop(self):
+
+        if len(self) > 0:
+            return self.__container.popleft()
+
+        else:
+            return None
+
+
+class LegacyStack:
+
+    def __init__(self):
+
+        self.__container = collections.deque()
+        return
+
+    def __len__(self):
+
+        return len(self.__container)
+
+    def push(self, value):
+
+        self.__container.appendleft(value)
+        return
+
+    def pop(self):
+
+        if len(self) > 0:
+            return self.__container.popleft()
+
+        else:
+            return None
+
+
+############################################################
+#   Workloads
+############################################################
+
+
+def push_pop(make_container, count=VALUE_COUNT):
+
+    container = make_container()
+
+    for value in range(count):
+        container.push(value)
+
+    while len(container) > 0:
+        container.pop()
+
+    return
+
+
+def bfs_rooms(room_graph, make_container, starting_room_id=0):
+    """
+    Breadth-first order of every room, as in `path_optimizer.find_shortest_path`.
+    """
+
+    visited = {starting_room_id}
+    rooms_to_visit = make_container()
+    rooms_to_visit.push(starting_room_id)
+
+    while len(rooms_to_visit) > 0:
+        room_id = rooms_to_visit.pop()
+        for next_room_id in room_graph[room_id].values():
+            if next_room_id not in visited:
+                visited.add(next_room_id)
+                rooms_to_visit.push(next_room_id)
+
+    return visited
+
+
+def measure_bytes(make_container, count=VALUE_COUNT):
+    """
+    Bytes held by a container of `count` distinct large ints, counting the ints it keeps alive.
+    """
+
+    container = make_container()
+    container.push_many(range(1 << 40, (1 << 40) + count))
+
+    if isinstance(container, RingQueue):
+        return sys.getsizeof(container._data)
+
+    values = container._container
+
+    return sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+
+
+def time_it(function):
+
+    return min(timeit.repeat(function, number=1, repeat=REPEAT))
+
+
+def print_row(name, baseline, seconds):
+
+    print(f"{name:<40} {seconds * 1000:>10.2f} {baseline / seconds:>8.2f}x")
+
+    return
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    world = make_room_graph(ROOM_COUNT, seed=ROOM_COUNT)
+    room_graph = {room_id: room_exits for (room_id, (coords, room_exits)) in world.items()}
+    memory_graph = MemoryGraph(
+        edges=[
+            (room_id, direction, to_room_id)
+            for (room_id, room_exits) in room_graph.items()
+            for (direction, to_room_id) in room_exits.items()
+        ],
+    )
+    far_room_id = max(room_graph)
+
+    print(f"{'workload':<40} {'ms':>10} {'speedup':>9}")
+
+    baseline = time_it(lambda: push_pop(LegacyQueue))
+    print_row("push/pop : LegacyQueue", baseline, baseline)
+    print_row("push/pop : Queue", baseline, time_it(lambda: push_pop(Queue)))
+    print_row("push/pop : RingQueue", baseline, time_it(lambda: push_pop(RingQueue)))
+
+    baseline = time_it(lambda: push_pop(LegacyStack))
+    print_row("push/pop : LegacyStack", baseline, baseline)
+    print_row("push/pop : Stack", baseline, time_it(lambda: push_pop(Stack)))
+
+    baseline = time_it(lambda: bfs_rooms(room_graph, LegacyQueue))
+    print_row("room bfs : LegacyQueue", baseline, baseline)
+    print_row("room bfs : Queue", baseline, time_it(lambda: bfs_rooms(room_graph, Queue)))
+    print_row("room bfs : RingQueue", baseline, time_it(lambda: bfs_rooms(room_graph, RingQueue)))
+
+    baseline = time_it(lambda: memory_graph.xft(0, LegacyQueue()))
+    print_row("MemoryGraph.bft : LegacyQueue", baseline, baseline)
+    print_row("MemoryGraph.bft : Queue", baseline, time_it(lambda: memory_graph.xft(0, Queue())))
+
+    baseline = time_it(lambda: memory_graph.xft(0, LegacyStack()))
+    print_row("MemoryGraph.dft : LegacyStack", baseline, baseline)
+    print_row("MemoryGraph.dft : Stack", baseline, time_it(lambda: memory_graph.xft(0, Stack())))
+
+    baseline = time_it(lambda: memory_graph.xfs__to_node(far_room_id, 0, LegacyQueue()))
+    print_row("MemoryGraph.bfs__to_node : LegacyQueue", baseline, baseline)
+    print_row(
+        "MemoryGraph.bfs__to_node : Queue",
+        baseline,
+        time_it(lambda: memory_graph.xfs__to_node(far_room_id, 0, Queue())),
+    )
+
+    print_row(
+        "MemoryGraph.bfs__to_node : PriorityQueue",
+        baseline,
+        time_it(lambda: memory_graph.xfs__to_node(far_room_id, 0, PriorityQueue(key=len))),
+    )
+    print_row(
+        "MemoryGraph.bfs__to_node : IndexedPQ",
+        baseline,
+        time_it(lambda: memory_graph.xfs__to_node(
+            far_room_id, 0, IndexedPriorityQueue(key=len, index=lambda path: path[-1][1]),
+        )),
+    )
+
+    print()
+    print(f"{'memory':<40} {'KiB':>10}")
+
+    for make_container in (Queue, RingQueue):
+        print(f"{make_container.__name__ + f' of {VALUE_COUNT} ids':<40} {measure_bytes(make_container) / 1024:>10.1f}")
@@ -0,0 +1,111 @@
+############################################################
+#   BENCHMARK : DEBUG TOOLS
+#-----------------------------------------------------------
+#   Cost per call of `iterable_to_str` and `debug_str`
+#   with their styles and options resolved on every call
+#   (as before they were compiled), from the cache, and
+#   precompiled; and of `debug_print` with debugging off,
+#   below its level (with lazy arguments), and shown,
+#   printed directly or through the background writer.
+#
+#   Run with `python -m benchmarks.debug_tools`.
+############################################################
+
+import contextlib
+import os
+import timeit
+
+from tools.debug_tools import (
+    LEVEL__DEBUG,
+    DebugFormatter,
+    debug_print,
+    debug_str,
+    get_debug_formatter,
+    set_debugging,
+    start_debug_writer,
+    stop_debug_writer,
+)
+from tools.iter_tools import Formatter, get_formatter, iterable_to_str
+
+############################################################
+
+ROOM = {"n": 12, "s": "?", "e": 40}
+MOVES = ["n", "e", "e", "s", "w"]
+OPTIONS = {"args__between": "; "}
+
+NUMBER = 20_000
+
+############################################################
+
+
+def time_call(name, function, stdout=None):
+    """
+    Time `function`, with `sys.stdout` redirected to `stdout` if given.
+    """
+
+    with contextlib.redirect_stdout(stdout) if stdout is not None else contextlib.nullcontext():
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=3))
+
+    print(f"{name:<44} {seconds / NUMBER * 1e6:>10.2f}")
+
+    return
+
+
+if __name__ == "__main__":
+
+    print(f"{'call':<44} {'us / call':>10}")
+
+    time_call("Formatter('dict')(...), resolved every call", lambda: Formatter("dict")(ROOM))
+    time_call("iterable_to_str(..., 'dict'), cached", lambda: iterable_to_str(ROOM, "dict"))
+
+    formatter = get_formatter("dict")
+    time_call("precompiled Formatter", lambda: formatter(ROOM))
+
+    print()
+
+    time_call(
+        "DebugFormatter(...).debug_str, every call",
+        lambda: DebugFormatter(**OPTIONS).debug_str("move_to", MOVES, ROOM, ["found a room"]),
+    )
+    time_call(
+        "debug_str(...), cached",
+        lambda: debug_str("move_to", MOVES, ROOM, ["found a room"], **OPTIONS),
+    )
+
+    debug_formatter = get_debug_formatter(**OPTIONS)
+    time_call(
+        "precompiled DebugFormatter.debug_str",
+        lambda: debug_formatter.debug_str("move_to", MOVES, ROOM, ["found a room"]),
+    )
+
+    print()
+
+    set_debugging(False)
+    time_call(
+        "debug_print(...), debugging off",
+        lambda: debug_print("move_to", MOVES, ROOM, ["found a room"], **OPTIONS),
+    )
+    set_debugging(True)
+    time_call(
+        "debug_print(..., should_print=False)",
+        lambda: debug_print("move_to", MOVES, ROOM, ["found a room"], should_print=False, **OPTIONS),
+    )
+    time_call(
+        "debug_print(lambda: ..., level=DEBUG), hidden",
+        lambda: debug_print("move_to", lambda: MOVES, lambda: ROOM, level=LEVEL__DEBUG),
+    )
+
+    with open(os.devnull, "w") as devnull:
+
+        time_call(
+            "debug_print(...), printed",
+            lambda: debug_print("move_to", MOVES, ROOM, ["found a room"], **OPTIONS),
+            stdout=devnull,
+        )
+
+        start_debug_writer(devnull)
+        time_call(
+            "debug_print(...), through the writer",
+            lambda: debug_print("move_to", MOVES, ROOM, ["found a room"], **OPTIONS),
+        )
+        stop_debug_writer()
@@ -0,0 +1,85 @@
+############################################################
+#   BENCHMARK : EVENT LOG
+#-----------------------------------------------------------
+#   Cost of logging `traverse_world`'s events, in each
+#   format and with each kind of sampling, on a large
+#   synthetic world: traversal time against a traversal
+#   without a log, events written, and bytes per event.
+#
+#   Run with `python -m benchmarks.event_log`.
+############################################################
+
+import os
+import tempfile
+import time
+
+from adventure.adv import Adventure
+from adventure.event_log import EventLog, FORMAT__BINARY, FORMAT__NDJSON
+from benchmarks.synthetic import make_room_graph, write_world_file
+
+############################################################
+
+ROOM_COUNT = 200_000
+LOOP_CHANCE = 0.05
+SEED = 0
+
+EVENT_LOGS = (
+    # (name, format, every, reservoir size)
+    ("binary, all events", FORMAT__BINARY, 1, None),
+    ("ndjson, all events", FORMAT__NDJSON, 1, None),
+    ("binary, every 100th", FORMAT__BINARY, 100, None),
+    ("binary, reservoir of 10000", FORMAT__BINARY, 1, 10_000),
+)
+
+############################################################
+
+
+def time_traversal(adventure):
+    """
+    Time a traversal, with closing its event log, if any.
+    """
+
+    started = time.perf_counter()
+    adventure.traverse_world(show_path=False, as_buffer=True)
+
+    if adventure.event_log is not None:
+        adventure.event_log.close()
+
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+
+        world_file = os.path.join(temp_dir, "synthetic.txt")
+        write_world_file(world_file, make_room_graph(ROOM_COUNT, LOOP_CHANCE, seed=SEED))
+        adventure = Adventure(world_file, seed=SEED, use_cache=False)
+
+        base_seconds = time_traversal(adventure)
+
+        print(f"{ROOM_COUNT} rooms")
+        print(f"{'event log':<28} {'seconds':>8} {'overhead':>9} {'events':>10} {'written':>10} {'bytes/event':>12}")
+        print(f"{'none':<28} {base_seconds:>8.3f}")
+
+        for (name, format, every, reservoir_size) in EVENT_LOGS:
+
+            log_file = os.path.join(temp_dir, "events")
+            adventure.event_log = EventLog(
+                log_file,
+                format=format,
+                every=every,
+                reservoir_size=reservoir_size,
+                seed=SEED,
+            )
+
+            seconds = time_traversal(adventure)
+            event_log = adventure.event_log
+            file_size = os.path.getsize(log_file)
+
+            print(
+                f"{name:<28} {seconds:>8.3f} {seconds / base_seconds - 1:>9.1%} {event_log.sequence:>10}"
+                f" {event_log.written:>10} {file_size / max(event_log.written, 1):>12.1f}"
+            )
+
+            adventure.event_log = None
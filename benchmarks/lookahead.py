@@ -0,0 +1,83 @@
+############################################################
+#   BENCHMARK : LOOKAHEAD
+#-----------------------------------------------------------
+#   Moves saved by peeking through unexplored exits before
+#   choosing one, per peek spent, on the main maze and on
+#   synthetic mazes with and without loops.
+#
+#   Run with `python -m benchmarks.lookahead`.
+############################################################
+
+import os
+import tempfile
+import time
+
+from adventure.adv import Adventure
+from benchmarks.synthetic import make_room_graph, write_world_file
+
+############################################################
+
+MAIN_MAZE_FILE = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps/main_maze.txt"))
+
+SYNTHETIC_WORLDS = (
+    # (room count, loop chance)
+    (10_000, 0.0),
+    (10_000, 0.05),
+    (10_000, 0.2),
+)
+
+SEEDS = range(10)
+
+############################################################
+
+
+def bench(name, world_file):
+
+    adventure = Adventure(world_file, use_cache=False)
+    totals = {False: [0, 0, 0.0], True: [0, 0, 0.0]}    # -- moves, peeks, seconds
+
+    for lookahead in (False, True):
+
+        adventure.lookahead = lookahead
+
+        for seed in SEEDS:
+            adventure.seed = seed
+            started = time.perf_counter()
+            move_count = len(adventure.traverse_world(show_path=False, as_buffer=True))
+            totals[lookahead][0] += move_count
+            totals[lookahead][1] += adventure.player.peek_count
+            totals[lookahead][2] += time.perf_counter() - started
+
+    runs = len(SEEDS)
+    (base_moves, _, base_seconds) = (total / runs for total in totals[False])
+    (moves, peeks, seconds) = (total / runs for total in totals[True])
+    saved = base_moves - moves
+
+    print(
+        f"{name:<24} {len(adventure.world.rooms):>7} {base_moves:>10.1f} {moves:>10.1f}"
+        f" {saved / base_moves:>7.2%} {peeks:>9.1f} {saved / peeks if peeks else 0.0:>10.3f}"
+        f" {base_seconds:>8.3f} {seconds:>8.3f}"
+    )
+
+    return
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    print(f"averages over {len(SEEDS)} seeds")
+    print(
+        f"{'world':<24} {'rooms':>7} {'moves':>10} {'lookahead':>10}"
+        f" {'saved':>7} {'peeks':>9} {'saved/peek':>10} {'seconds':>8} {'(la)':>8}"
+    )
+
+    bench("main_maze", MAIN_MAZE_FILE)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for (room_count, loop_chance) in SYNTHETIC_WORLDS:
+            world_file = os.path.join(temp_dir, f"synthetic_{room_count}_{loop_chance}.txt")
+            write_world_file(world_file, make_room_graph(room_count, loop_chance, seed=0))
+            bench(f"synthetic loops={loop_chance}", world_file)
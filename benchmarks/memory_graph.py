@@ -0,0 +1,155 @@
+############################################################
+#   BENCHMARK : MEMORY GRAPH
+#-----------------------------------------------------------
+#   Building a grid of about 1M directed edges from a list
+#   of its edges, with the constructor and `from_edges`
+#   (from a list, and from a NumPy array if NumPy is
+#   installed).
+#
+#   Shortest paths across it: `bfs__to_node` (a path copy
+#   per push) against `dijkstra__to_node` unweighted
+#   (parent links) and with every seventh eastward edge
+#   made costlier.
+#
+#   Repeated `bfs__to_node` queries with the query cache:
+#   a miss, a hit, a hit after an edge is re-added unchanged,
+#   and a miss after a new edge invalidates the cache.
+#
+#   Run with `python -m benchmarks.memory_graph`.
+############################################################
+
+import time
+
+from adventure.memory_graph import MemoryGraph
+
+############################################################
+
+GRID_SIZE = 501    # 4 * 501 * 500 = 1,002,000 directed edges
+
+SLOW_EDGE_EVERY = 7
+SLOW_EDGE_WEIGHT = 3
+
+############################################################
+
+
+def make_grid_edges(size=GRID_SIZE):
+    """
+    List the north and east edges of a `size` by `size` grid; their inverses complete it.
+    """
+
+    edges = list()
+
+    for y in range(size):
+        for x in range(size):
+            node = y * size + x
+            if x + 1 < size:
+                edges.append((node, "e", node + 1))
+            if y + 1 < size:
+                edges.append((node, "n", node + size))
+
+    return edges
+
+
+def time_build(name, function, *args):
+
+    started = time.perf_counter()
+    memory_graph = function(*args)
+    elapsed = time.perf_counter() - started
+
+    print(f"{name:<44} {elapsed * 1000:>10.1f}")
+
+    return memory_graph
+
+
+def make_grid_graph(size=GRID_SIZE):
+    """
+    Make a `size` by `size` grid of nodes with edges both ways between grid neighbors.
+    """
+
+    memory_graph = MemoryGraph()
+
+    for y in range(size):
+        for x in range(size):
+            node = y * size + x
+            if x + 1 < size:
+                memory_graph.add_edge(node, "e", node + 1)
+                memory_graph.add_edge(node + 1, "w", node)
+            if y + 1 < size:
+                memory_graph.add_edge(node, "n", node + size)
+                memory_graph.add_edge(node + size, "s", node)
+
+    return memory_graph
+
+
+def time_call(name, function, *args):
+
+    started = time.perf_counter()
+    path = function(*args)
+    elapsed = time.perf_counter() - started
+
+    print(f"{name:<44} {len(path) - 1:>8} {elapsed * 1000:>10.1f}")
+
+    return path
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    edges = make_grid_edges()
+    inverse_labels = (("n", "s"), ("e", "w"))
+
+    print(f"{'build from ' + str(len(edges)) + ' edges and inverses':<44} {'ms':>10}")
+
+    time_build("MemoryGraph(edges=...)", lambda: MemoryGraph(edges=edges, inverse_labels=inverse_labels))
+    time_build("MemoryGraph.from_edges(list)", MemoryGraph.from_edges, edges, inverse_labels)
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is not None:
+        edge_array = numpy.array(edges, dtype=object)
+        time_build("MemoryGraph.from_edges(numpy array)", MemoryGraph.from_edges, edge_array, inverse_labels)
+
+    print()
+
+    started = time.perf_counter()
+    memory_graph = make_grid_graph()
+    edge_count = sum(map(len, memory_graph.map.values()))
+    print(f"built {edge_count} edges in {time.perf_counter() - started:.2f} s")
+    print()
+
+    targets = {
+        "near": 50 * GRID_SIZE + 50,
+        "far": GRID_SIZE * GRID_SIZE - 1,
+    }
+
+    print(f"{'search':<44} {'moves':>8} {'ms':>10}")
+
+    for (target_name, target) in targets.items():
+        time_call(f"bfs__to_node ({target_name})", memory_graph.bfs__to_node, target, 0)
+        time_call(f"dijkstra__to_node, unweighted ({target_name})", memory_graph.dijkstra__to_node, target, 0)
+
+    near = targets["near"]
+    memory_graph.enable_query_cache()
+
+    time_call("cached bfs__to_node (near): miss", memory_graph.bfs__to_node, near, 0)
+    time_call("cached bfs__to_node (near): hit", memory_graph.bfs__to_node, near, 0)
+    memory_graph.add_edge(0, "e", 1)    # -- unchanged
+    time_call("... after re-adding an edge: hit", memory_graph.bfs__to_node, near, 0)
+    memory_graph.add_edge(near, "x", -1)    # -- a new dead end
+    time_call("... after adding an edge: miss", memory_graph.bfs__to_node, near, 0)
+
+    print(f"query cache: {memory_graph.get_query_cache_stats()}")
+    memory_graph.disable_query_cache()
+
+    for node in range(0, GRID_SIZE * GRID_SIZE, SLOW_EDGE_EVERY):
+        if "e" in memory_graph.map[node]:
+            memory_graph.set_weight(node, "e", SLOW_EDGE_WEIGHT)
+
+    for (target_name, target) in targets.items():
+        time_call(f"dijkstra__to_node, weighted ({target_name})", memory_graph.dijkstra__to_node, target, 0)
@@ -0,0 +1,64 @@
+############################################################
+#   BENCHMARK : PATH OPTIMIZER
+#-----------------------------------------------------------
+#   Moves saved and time taken by the path optimizer, on
+#   the main maze and on large synthetic worlds.
+#
+#   Run with `python -m benchmarks.path_optimizer`.
+############################################################
+
+import os
+import tempfile
+import time
+
+from adventure.adv import Adventure
+from adventure.path_optimizer import optimize_moves
+from benchmarks.synthetic import make_room_graph, write_world_file
+
+############################################################
+
+MAPS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps"))
+
+SYNTHETIC_ROOM_COUNTS = (10_000, 50_000)
+
+SEEDS = (0, 1, 2)
+
+############################################################
+
+
+def bench(name, world_file):
+
+    for seed in SEEDS:
+
+        adventure = Adventure(world_file, seed=seed, use_cache=False)
+        moves = adventure.traverse_world(show_path=False, as_buffer=True)
+
+        started = time.perf_counter()
+        optimized_moves = optimize_moves(adventure.world, moves)
+        elapsed = time.perf_counter() - started
+
+        assert adventure.replay_moves(optimized_moves) is not None
+
+        print(
+            f"{name:<20} {seed:>4} {len(moves):>8} {len(optimized_moves):>8}"
+            f" {len(moves) - len(optimized_moves):>6} {elapsed:>9.3f}"
+        )
+
+    return
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    print(f"{'map':<20} {'seed':>4} {'moves':>8} {'after':>8} {'saved':>6} {'seconds':>9}")
+
+    bench("main_maze", os.path.join(MAPS_DIR, "main_maze.txt"))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for room_count in SYNTHETIC_ROOM_COUNTS:
+            world_file = os.path.join(temp_dir, f"synthetic_{room_count}.txt")
+            write_world_file(world_file, make_room_graph(room_count, seed=room_count))
+            bench(f"synthetic_{room_count}", world_file)
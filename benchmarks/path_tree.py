@@ -0,0 +1,161 @@
+############################################################
+#   BENCHMARK : PATH TREE
+#-----------------------------------------------------------
+#   Shortest-path trees against a breadth-first search per
+#   query, on a large synthetic world:
+#
+#   -   the cost of keeping trees up to date while a
+#       traversal is replayed into a fresh memory, checked
+#       against trees rebuilt from scratch afterwards;
+#   -   routes back to the starting room;
+#   -   routes between random rooms, through the best of
+#       the trees, and how much longer they are.
+#
+#   Run with `python -m benchmarks.path_tree`.
+############################################################
+
+import os
+import random
+import tempfile
+import time
+
+from adventure.adv import Adventure
+from adventure.exploration import make_memory, record_room, move_to
+from adventure.path_tree import ShortestPathTree, find_route
+from benchmarks.synthetic import make_room_graph, write_world_file
+
+############################################################
+
+ROOM_COUNT = 100_000
+LOOP_CHANCE = 0.05
+HUB_COUNT = 4    # -- besides the starting room
+QUERY_COUNT = 200
+SEED = 0
+
+############################################################
+
+
+def replay(adventure, moves, hub_ids):
+    """
+    Walk `moves` from the starting room into a fresh memory, as `TraversalCheckpoint.resume` does.
+    Returns `(memory, seconds)`.
+    """
+
+    player = adventure.player
+    player.current_room = adventure.world.starting_room
+    memory = make_memory()
+
+    started = time.perf_counter()
+
+    if hub_ids is not None:
+
+        for room_id in (player.current_room.id, *hub_ids):
+            memory.add_path_tree(room_id)
+
+        # Hubs aren't discovered yet: adding their trees must not add them to the memory.
+        assert len(memory.map) == 0
+
+    for direction in moves:
+        record_room(memory, player)
+        move_to(memory, player, direction)
+
+    record_room(memory, player)
+
+    return (memory, time.perf_counter() - started)
+
+
+def time_queries(name, queries, find_path, reference_lengths=None):
+
+    started = time.perf_counter()
+    lengths = [len(find_path(from_room_id, to_room_id)) - 1 for (from_room_id, to_room_id) in queries]
+    elapsed = time.perf_counter() - started
+
+    stretch = ""
+
+    if reference_lengths is not None:
+        stretch = f"{sum(lengths) / sum(reference_lengths):>8.3f}"
+
+    print(f"{name:<36} {elapsed / len(queries) * 1000:>12.4f} {sum(lengths) / len(lengths):>10.1f} {stretch}")
+
+    return lengths
+
+
+if __name__ == "__main__":
+
+    rng = random.Random(SEED)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        world_file = os.path.join(temp_dir, "synthetic.txt")
+        write_world_file(world_file, make_room_graph(ROOM_COUNT, LOOP_CHANCE, seed=SEED))
+        adventure = Adventure(world_file, seed=SEED, use_cache=False)
+
+    moves = adventure.traverse_world(show_path=False, as_buffer=True)
+    room_ids = list(adventure.world.rooms)
+    hub_ids = rng.sample(room_ids, HUB_COUNT)
+    starting_room_id = adventure.world.starting_room.id
+
+    print(f"{ROOM_COUNT} rooms, {len(moves)} moves, {HUB_COUNT} hubs")
+    print()
+
+    #-----------------------------------------------------------
+    #   Upkeep
+    #-----------------------------------------------------------
+
+    (plain_memory, plain_seconds) = replay(adventure, moves, None)
+    (memory, tree_seconds) = replay(adventure, moves, hub_ids)
+
+    assert memory.map == plain_memory.map
+
+    started = time.perf_counter()
+    rebuilt_trees = [ShortestPathTree(memory, path_tree.root) for path_tree in memory.path_trees]
+    rebuild_seconds = (time.perf_counter() - started) / len(rebuilt_trees)
+
+    for (path_tree, rebuilt_tree) in zip(memory.path_trees, rebuilt_trees):
+        assert path_tree.depths == rebuilt_tree.depths
+
+    print(f"{'replay without trees':<36} {plain_seconds:>8.3f} s")
+    print(f"{'replay with incremental trees':<36} {tree_seconds:>8.3f} s")
+    print(f"{'rebuild one tree from scratch':<36} {rebuild_seconds:>8.3f} s")
+    print()
+
+    #-----------------------------------------------------------
+    #   Queries
+    #-----------------------------------------------------------
+
+    root_tree = memory.path_trees[0]
+
+    print(f"{'query':<36} {'ms / query':>12} {'length':>10} {'stretch':>8}")
+
+    to_start = [(rng.choice(room_ids), starting_room_id) for _ in range(QUERY_COUNT)]
+
+    bfs_lengths = time_queries(
+        "to start: bfs__parents",
+        to_start,
+        lambda from_room_id, to_room_id: memory.bfs__parents(lambda node: node == to_room_id, from_room_id),
+    )
+    time_queries(
+        "to start: tree",
+        to_start,
+        lambda from_room_id, to_room_id: root_tree.get_path_to_root(from_room_id),
+        bfs_lengths,
+    )
+
+    between = [(rng.choice(room_ids), rng.choice(room_ids)) for _ in range(QUERY_COUNT)]
+
+    bfs_lengths = time_queries(
+        "between rooms: bfs__parents",
+        between,
+        lambda from_room_id, to_room_id: memory.bfs__parents(lambda node: node == to_room_id, from_room_id),
+    )
+    time_queries(
+        "between rooms: start tree",
+        between,
+        root_tree.get_route,
+        bfs_lengths,
+    )
+    time_queries(
+        f"between rooms: best of {len(memory.path_trees)} trees",
+        between,
+        lambda from_room_id, to_room_id: find_route(memory.path_trees, from_room_id, to_room_id),
+        bfs_lengths,
+    )
@@ -0,0 +1,130 @@
+############################################################
+#   BENCHMARK : STARTUP
+#-----------------------------------------------------------
+#   A `python -X importtime` regression check for the
+#   `adventure` entry point.
+#
+#   Run with `python -m benchmarks.startup`.
+#   Exits non-zero when startup is over budget, or when a
+#   module that should be lazy is imported.
+############################################################
+
+import os
+import subprocess
+import sys
+
+############################################################
+
+PROJECT_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+
+ENTRY_POINT__ARGS = ("-m", "adventure.adv", "--no-map", "--no-test")
+
+# Total import time of modules the entry point adds over a bare interpreter,
+# in microseconds. Measured at about 15 ms (mostly `argparse`), with headroom.
+ENTRY_POINT__BUDGET_US = 30_000
+
+# Modules that `--no-map --no-test` with a warm world cache must not import.
+LAZY_MODULES = (
+    "adventure.memory_graph",
+    "adventure.path_cache",
+    "ast",
+    "hashlib",
+    "pickle",
+    "random",
+    "tools.iter_tools",
+    "typing",
+)
+
+REPEAT = 5
+
+############################################################
+
+
+def read_import_times(*python_args):
+    """
+    Run `python -X importtime *python_args` from the project directory.
+    Returns a list of `(name, self_us, cumulative_us, depth)` in import order.
+    """
+
+    completed = subprocess.run(
+        (sys.executable, "-X", "importtime", *python_args),
+        cwd=PROJECT_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    import_times = list()
+
+    for line in completed.stderr.splitlines():
+
+        if not line.startswith("import time:"):
+            continue
+
+        (self_us, cumulative_us, name) = line[len("import time:"):].split("|")
+
+        if not self_us.strip().isdigit():
+            continue    # -- this is the header.
+
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        import_times.append((name.strip(), int(self_us), int(cumulative_us), depth))
+
+    return import_times
+
+
+def measure_added_import_time(*python_args):
+    """
+    Measure the total import time of top-level modules that
+    `python *python_args` imports and a bare interpreter doesn't.
+    Returns `(added_us, imported_names)`.
+    """
+
+    baseline_names = {name for (name, *rest) in read_import_times("-c", "pass")}
+    import_times = read_import_times(*python_args)
+
+    added_us = sum(
+        cumulative_us
+        for (name, self_us, cumulative_us, depth) in import_times
+        if depth == 0 and name not in baseline_names
+    )
+
+    return (added_us, {name for (name, *rest) in import_times})
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    # Warm the world cache and the bytecode caches.
+    subprocess.run(
+        (sys.executable, *ENTRY_POINT__ARGS),
+        cwd=PROJECT_DIR,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+
+    measurements = [measure_added_import_time(*ENTRY_POINT__ARGS) for _ in range(REPEAT)]
+    added_us = min(added_us for (added_us, imported_names) in measurements)
+    imported_names = measurements[0][1]
+    eager_modules = [name for name in LAZY_MODULES if name in imported_names]
+
+    print(f"entry point: python {' '.join(ENTRY_POINT__ARGS)}")
+    print(f"added import time: {added_us / 1000:.2f} ms (budget {ENTRY_POINT__BUDGET_US / 1000:.2f} ms)")
+
+    failed = False
+
+    if added_us > ENTRY_POINT__BUDGET_US:
+        print("STARTUP CHECK FAILED: over budget")
+        failed = True
+
+    if eager_modules:
+        print(f"STARTUP CHECK FAILED: eagerly imported {', '.join(eager_modules)}")
+        failed = True
+
+    if not failed:
+        print("STARTUP CHECK PASSED")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,116 @@
+############################################################
+#   SYNTHETIC WORLDS
+#-----------------------------------------------------------
+#   Generators for large worlds in the same format as the
+#   bundled maps: `{room_id: [(x, y), {direction: room_id}]}`.
+############################################################
+
+import os
+import random
+
+############################################################
+
+DIRECTION_OFFSETS = {
+    "n": (0, 1),
+    "s": (0, -1),
+    "e": (1, 0),
+    "w": (-1, 0),
+}
+
+INVERSE_DIRECTIONS = {
+    "n": "s",
+    "s": "n",
+    "e": "w",
+    "w": "e",
+}
+
+DEFAULT__LOOP_CHANCE = 0.05
+
+############################################################
+#   Generators
+############################################################
+
+
+def make_room_graph(room_count, loop_chance=DEFAULT__LOOP_CHANCE, seed=None):
+    """
+    Make a random maze of `room_count` rooms on a square grid.
+    Rooms are grown from room `0` as a random tree, and then
+    each remaining grid neighbor is connected with chance `loop_chance`.
+    """
+
+    rng = random.Random(seed)
+    size = 1
+
+    while size * size < room_count:
+        size += 1
+
+    coords = [(size // 2, size // 2)]
+    room_at = {coords[0]: 0}
+    exits = [dict()]
+    growing = [0]
+
+    while len(coords) < room_count and growing:
+
+        index = rng.randrange(len(growing))
+        room_id = growing[index]
+        (x, y) = coords[room_id]
+
+        options = [
+            (direction, (x + dx, y + dy))
+            for (direction, (dx, dy)) in DIRECTION_OFFSETS.items()
+            if 0 <= x + dx < size and 0 <= y + dy < size and (x + dx, y + dy) not in room_at
+        ]
+
+        if not options:
+            growing[index] = growing[-1]
+            growing.pop()
+            continue
+
+        (direction, next_coords) = rng.choice(options)
+        next_room_id = len(coords)
+
+        coords.append(next_coords)
+        room_at[next_coords] = next_room_id
+        exits.append(dict())
+        growing.append(next_room_id)
+
+        exits[room_id][direction] = next_room_id
+        exits[next_room_id][INVERSE_DIRECTIONS[direction]] = room_id
+
+    if loop_chance > 0:
+        for (room_id, (x, y)) in enumerate(coords):
+            for direction in ("n", "e"):
+                (dx, dy) = DIRECTION_OFFSETS[direction]
+                next_room_id = room_at.get((x + dx, y + dy))
+                if (
+                    next_room_id is not None
+                    and direction not in exits[room_id]
+                    and rng.random() < loop_chance
+                ):
+                    exits[room_id][direction] = next_room_id
+                    exits[next_room_id][INVERSE_DIRECTIONS[direction]] = room_id
+
+    return {
+        room_id: [coords[room_id], exits[room_id]]
+        for room_id in range(len(coords))
+    }
+
+
+def write_world_file(world_file, room_graph):
+    """
+    Write `room_graph` to `world_file` in the format of the bundled maps.
+    """
+
+    os.makedirs(os.path.dirname(world_file) or ".", exist_ok=True)
+
+    with open(world_file, "w") as world_file_stream:
+        world_file_stream.write("{\n")
+        world_file_stream.write(
+            ",\n".join(
+                f"  {room_id}: [{coords!r}, {room_exits!r}]"
+                for (room_id, (coords, room_exits)) in room_graph.items()
+            )
+        )
+        world_file_stream.write("\n}\n")
+
+    return
@@ -0,0 +1,87 @@
+############################################################
+#   BENCHMARK : WORLD CACHE
+#-----------------------------------------------------------
+#   Cold (parse) and warm (unmarshal) load times for every
+#   bundled map and for large synthetic maps.
+#
+#   Run with `python -m benchmarks.world_cache`.
+############################################################
+
+import os
+import tempfile
+import timeit
+
+from adventure.world import World
+from adventure.world_cache import get_cache_file, load_world
+from benchmarks.synthetic import make_room_graph, write_world_file
+
+############################################################
+
+MAPS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "../maps"))
+
+SYNTHETIC_ROOM_COUNTS = (10_000, 100_000)
+
+REPEAT = 5
+
+############################################################
+
+
+def remove_cache(world_file):
+
+    try:
+        os.remove(get_cache_file(world_file))
+    except OSError:
+        pass
+
+    return
+
+
+def time_load(world_file, use_cache, cold):
+
+    def setup():
+        if cold:
+            remove_cache(world_file)
+        return
+
+    def load():
+        (world_info, world_digest) = load_world(world_file, use_cache)
+        World().load_graph(world_info)
+        return
+
+    # Prime the cache for warm runs.
+    load_world(world_file, True)
+
+    return min(timeit.repeat(load, setup=setup, number=1, repeat=REPEAT))
+
+
+def bench_world_file(name, world_file):
+
+    no_cache = time_load(world_file, use_cache=False, cold=True)
+    cold = time_load(world_file, use_cache=True, cold=True)
+    warm = time_load(world_file, use_cache=True, cold=False)
+
+    print(
+        f"{name:<24} {no_cache * 1000:>10.2f} {cold * 1000:>10.2f} {warm * 1000:>10.2f}"
+        f" {no_cache / warm:>8.1f}x"
+    )
+
+    return
+
+
+############################################################
+#   Main
+############################################################
+
+if __name__ == "__main__":
+
+    print(f"{'map':<24} {'parse ms':>10} {'cold ms':>10} {'warm ms':>10} {'speedup':>9}")
+
+    for name in sorted(os.listdir(MAPS_DIR)):
+        if name.endswith(".txt"):
+            bench_world_file(name, os.path.join(MAPS_DIR, name))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for room_count in SYNTHETIC_ROOM_COUNTS:
+            world_file = os.path.join(temp_dir, f"synthetic_{room_count}.txt")
+            write_world_file(world_file, make_room_graph(room_count, seed=room_count))
+            bench_world_file(f"synthetic_{room_count}", world_file)
@@ -2,7 +2,10 @@
 #   DATA STRUCTURES
 ############################################################
 
+import array
 import collections
+import heapq
+import itertools
 
 ############################################################
 #   Default Dicts
@@ -47,28 +50,65 @@ class NestedDefaultDict(_DefaultDict):
 
 class Queue:
 
-    def __init__(self):
+    __slots__ = ("_container",)
+
+    def __init__(self, values=None):
+
+        self._container = collections.deque()
+
+        if values is not None:
+            self.push_many(values)
 
-        self.__container = collections.deque()
         return
 
     def __len__(self):
 
-        return len(self.__container)
+        return len(self._container)
 
     def push(self, value):
 
-        self.__container.append(value)
+        self._container.append(value)
+        return
+
+    def push_many(self, values):
+
+        self._container.extend(values)
         return
 
     def pop(self):
 
-        if len(self) > 0:
-            return self.__container.popleft()
+        try:
+            return self._container.popleft()
 
-        else:
+        except IndexError:
             return None
 
+    def pop_many(self, count):
+        """
+        Pop up to `count` values, in the order `pop` would return them.
+        """
+
+        popleft = self._container.popleft
+        count = min(count, len(self._container))
+
+        return [popleft() for _ in range(count)]
+
+    def peek(self):
+        """
+        Get the value `pop` would return next, without removing it.
+        """
+
+        try:
+            return self._container[0]
+
+        except IndexError:
+            return None
+
+    def clear(self):
+
+        self._container.clear()
+        return
+
 
 ############################################################
 #   Stack
@@ -77,24 +117,555 @@ class Queue:
 
 class Stack:
 
-    def __init__(self):
+    __slots__ = ("_container",)
+
+    def __init__(self, values=None):
+
+        self._container = list()
+
+        if values is not None:
+            self.push_many(values)
 
-        self.__container = collections.deque()
         return
 
     def __len__(self):
 
-        return len(self.__container)
+        return len(self._container)
 
     def push(self, value):
 
-        self.__container.appendleft(value)
+        self._container.append(value)
+        return
+
+    def push_many(self, values):
+        """
+        Push each value in turn, so the last one is on top.
+        """
+
+        self._container.extend(values)
         return
 
     def pop(self):
 
-        if len(self) > 0:
-            return self.__container.popleft()
+        try:
+            return self._container.pop()
+
+        except IndexError:
+            return None
+
+    def pop_many(self, count):
+        """
+        Pop up to `count` values, in the order `pop` would return them.
+        """
+
+        container = self._container
+        count = min(count, len(container))
+        values = container[len(container) - count:]
+        values.reverse()
+        del container[len(container) - count:]
+
+        return values
+
+    def peek(self):
+        """
+        Get the value `pop` would return next, without removing it.
+        """
+
+        try:
+            return self._container[-1]
+
+        except IndexError:
+            return None
+
+    def clear(self):
+
+        self._container.clear()
+        return
+
+
+############################################################
+#   Ring Queue
+############################################################
+
+
+class RingQueue:
+    """
+    A first-in first-out queue of integers, such as node ids, in a preallocated `array`.
+    The array doubles in size when it fills up, and never shrinks.
+    It holds ids in a quarter of the memory of a `Queue`, but pushes and pops are slower.
+    """
+
+    __slots__ = ("_data", "_mask", "_head", "_length")
+
+    DEFAULT__CAPACITY = 1024
+    DEFAULT__TYPECODE = "q"
+
+    def __init__(
+        self,
+        values=None,
+        capacity=DEFAULT__CAPACITY,
+        typecode=DEFAULT__TYPECODE,
+    ):
+
+        # Round up to a power of two, so positions wrap with a mask.
+        capacity = 1 << max(0, capacity - 1).bit_length()
+
+        self._data = array.array(typecode, bytes(capacity * array.array(typecode).itemsize))
+        self._mask = capacity - 1
+        self._head = 0
+        self._length = 0
+
+        if values is not None:
+            self.push_many(values)
+
+        return
+
+    def __len__(self):
+
+        return self._length
+
+    def _reserve(self, length):
+        """
+        Grow the array until it can hold `length` values, moving the head to the front.
+        """
+
+        capacity = self._mask + 1
+
+        if length <= capacity:
+            return
+
+        while capacity < length:
+            capacity <<= 1
+
+        data = self._data
+        head = self._head
+        tail = head + self._length
+
+        grown = data[head:min(tail, len(data))] + data[:max(0, tail - len(data))]
+        grown.frombytes(bytes((capacity - len(grown)) * data.itemsize))
 
+        self._data = grown
+        self._mask = capacity - 1
+        self._head = 0
+
+        return
+
+    def push(self, value):
+
+        if self._length > self._mask:
+            self._reserve(self._length + 1)
+
+        self._data[(self._head + self._length) & self._mask] = value
+        self._length += 1
+
+        return
+
+    def push_many(self, values):
+
+        values = array.array(self._data.typecode, values)
+        self._reserve(self._length + len(values))
+
+        data = self._data
+        start = (self._head + self._length) & self._mask
+        split = min(len(values), len(data) - start)
+
+        data[start:start + split] = values[:split]
+        data[:len(values) - split] = values[split:]
+        self._length += len(values)
+
+        return
+
+    def pop(self):
+
+        if self._length == 0:
+            return None
+
+        value = self._data[self._head]
+        self._head = (self._head + 1) & self._mask
+        self._length -= 1
+
+        return value
+
+    def pop_many(self, count):
+        """
+        Pop up to `count` values, in the order `pop` would return them.
+        """
+
+        data = self._data
+        count = min(count, self._length)
+        head = self._head
+        split = min(count, len(data) - head)
+
+        values = data[head:head + split].tolist() + data[:count - split].tolist()
+        self._head = (head + count) & self._mask
+        self._length -= count
+
+        return values
+
+    def peek(self):
+        """
+        Get the value `pop` would return next, without removing it.
+        """
+
+        if self._length == 0:
+            return None
+
+        return self._data[self._head]
+
+    def clear(self):
+
+        self._head = 0
+        self._length = 0
+
+        return
+
+
+############################################################
+#   Priority Queue
+############################################################
+
+
+class PriorityQueue:
+    """
+    A min-heap of values, ordered by `key(value)`.
+    Values with equal keys are popped in the order they were pushed,
+    so with `key=len` over paths, `MemoryGraph.xfs` runs a breadth-first search.
+    """
+
+    __slots__ = ("_container", "_key", "_counter")
+
+    DEFAULT__KEY = None
+
+    def __init__(self, values=None, key=DEFAULT__KEY):
+
+        self._container = list()
+        self._key = key if key is not None else (lambda value: value)
+        self._counter = itertools.count()
+
+        if values is not None:
+            self.push_many(values)
+
+        return
+
+    def __len__(self):
+
+        return len(self._container)
+
+    def push(self, value):
+
+        heapq.heappush(self._container, (self._key(value), next(self._counter), value))
+        return
+
+    def push_many(self, values):
+
+        key = self._key
+        counter = self._counter
+        container = self._container
+
+        container.extend((key(value), next(counter), value) for value in values)
+        heapq.heapify(container)
+
+        return
+
+    def pop(self):
+
+        try:
+            return heapq.heappop(self._container)[2]
+
+        except IndexError:
+            return None
+
+    def pop_many(self, count):
+        """
+        Pop up to `count` values, in the order `pop` would return them.
+        """
+
+        container = self._container
+        count = min(count, len(container))
+
+        return [heapq.heappop(container)[2] for _ in range(count)]
+
+    def peek(self):
+        """
+        Get the value `pop` would return next, without removing it.
+        """
+
+        try:
+            return self._container[0][2]
+
+        except IndexError:
+            return None
+
+    def clear(self):
+
+        self._container.clear()
+        return
+
+
+class IndexedPriorityQueue:
+    """
+    A min-heap that holds at most one value per `index(value)`, ordered by `key(value)`.
+    Pushing a value whose index is already queued keeps whichever has the smaller key,
+    which is the decrease-key step of Dijkstra's algorithm.
+    With `index` returning a path's last node, `MemoryGraph.xfs` keeps one path per frontier node.
+    """
+
+    __slots__ = ("_heap", "_positions", "_key", "_index", "_counter")
+
+    DEFAULT__KEY = None
+    DEFAULT__INDEX = None
+
+    # Heap entries: `[priority, order, index, value]`. Orders are unique,
+    # so comparing entries never reaches `index` or `value`.
+    _PRIORITY = 0
+    _INDEX = 2
+    _VALUE = 3
+
+    def __init__(self, values=None, key=DEFAULT__KEY, index=DEFAULT__INDEX):
+
+        self._heap = list()
+        self._positions = dict()
+        self._key = key if key is not None else (lambda value: value)
+        self._index = index if index is not None else (lambda value: value)
+        self._counter = itertools.count()
+
+        if values is not None:
+            self.push_many(values)
+
+        return
+
+    def __len__(self):
+
+        return len(self._heap)
+
+    def __contains__(self, index):
+
+        return index in self._positions
+
+    def get_priority(self, index):
+        """
+        Get the priority of the value queued under `index`.
+        """
+
+        return self._heap[self._positions[index]][self._PRIORITY]
+
+    def push(self, value, priority=None):
+        """
+        Queue `value` with `priority` (by default `key(value)`),
+        unless a value with the same index is queued with a priority no greater.
+        """
+
+        if priority is None:
+            priority = self._key(value)
+
+        index = self._index(value)
+        position = self._positions.get(index)
+
+        if position is None:
+            self._heap.append([priority, next(self._counter), index, value])
+            self._positions[index] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+
+        elif priority < self._heap[position][self._PRIORITY]:
+            entry = self._heap[position]
+            entry[self._PRIORITY] = priority
+            entry[self._VALUE] = value
+            self._sift_up(position)
+
+        return
+
+    def push_many(self, values):
+
+        for value in values:
+            self.push(value)
+
+        return
+
+    def update(self, value, priority=None):
+        """
+        Queue `value` with `priority` (by default `key(value)`),
+        replacing any value with the same index whatever its priority.
+        """
+
+        if priority is None:
+            priority = self._key(value)
+
+        position = self._positions.get(self._index(value))
+
+        if position is None:
+            self.push(value, priority)
+            return
+
+        entry = self._heap[position]
+        old_priority = entry[self._PRIORITY]
+        entry[self._PRIORITY] = priority
+        entry[self._VALUE] = value
+
+        if priority < old_priority:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+        return
+
+    def pop(self):
+
+        heap = self._heap
+
+        if not heap:
+            return None
+
+        last = heap.pop()
+
+        if heap:
+            (entry, heap[0]) = (heap[0], last)
+            self._positions[last[self._INDEX]] = 0
+            self._sift_down(0)
         else:
+            entry = last
+
+        del self._positions[entry[self._INDEX]]
+
+        return entry[self._VALUE]
+
+    def pop_many(self, count):
+        """
+        Pop up to `count` values, in the order `pop` would return them.
+        """
+
+        count = min(count, len(self._heap))
+
+        return [self.pop() for _ in range(count)]
+
+    def peek(self):
+        """
+        Get the value `pop` would return next, without removing it.
+        """
+
+        if not self._heap:
             return None
+
+        return self._heap[0][self._VALUE]
+
+    def clear(self):
+
+        self._heap.clear()
+        self._positions.clear()
+        return
+
+    def _sift_up(self, position):
+
+        heap = self._heap
+        positions = self._positions
+        entry = heap[position]
+
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent] < entry:
+                break
+            heap[position] = heap[parent]
+            positions[heap[position][self._INDEX]] = position
+            position = parent
+
+        heap[position] = entry
+        positions[entry[self._INDEX]] = position
+
+        return
+
+    def _sift_down(self, position):
+
+        heap = self._heap
+        positions = self._positions
+        entry = heap[position]
+        count = len(heap)
+
+        while True:
+            child = 2 * position + 1
+            if child >= count:
+                break
+            if child + 1 < count and heap[child + 1] < heap[child]:
+                child += 1
+            if entry < heap[child]:
+                break
+            heap[position] = heap[child]
+            positions[heap[position][self._INDEX]] = position
+            position = child
+
+        heap[position] = entry
+        positions[entry[self._INDEX]] = position
+
+        return
+
+
+############################################################
+#   LRU Cache
+############################################################
+
+
+class LRUCache:
+    """
+    A dict of at most `max_size` entries, which drops the least recently used entry when full.
+    Lookups through `get` are counted as `hits` and `misses`, and dropped entries as `evictions`.
+    """
+
+    __slots__ = ("_container", "max_size", "hits", "misses", "evictions")
+
+    DEFAULT__MAX_SIZE = 1024
+
+    def __init__(self, max_size=DEFAULT__MAX_SIZE):
+
+        if max_size < 1:
+            raise Exception("LRUCache.SizeError", max_size)
+
+        self._container = collections.OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        return
+
+    def __len__(self):
+
+        return len(self._container)
+
+    def __contains__(self, key):
+
+        return key in self._container
+
+    def get(self, key, default=None):
+        """
+        Get the value of `key`, marking it as the most recently used, or `default` if it isn't cached.
+        """
+
+        container = self._container
+
+        if key not in container:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        container.move_to_end(key)
+
+        return container[key]
+
+    def put(self, key, value):
+
+        container = self._container
+
+        container[key] = value
+        container.move_to_end(key)
+
+        if len(container) > self.max_size:
+            container.popitem(last=False)
+            self.evictions += 1
+
+        return
+
+    def clear(self):
+        """
+        Drop every entry. The counts are kept.
+        """
+
+        self._container.clear()
+        return
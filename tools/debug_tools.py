@@ -2,9 +2,13 @@
 #   DEBUG TOOLS
 ############################################################
 
+import atexit
+import queue
+import sys
+import threading
 import typing as ty
-from tools.data_structures import DefaultDict
-from tools.iter_tools import iterable_to_str
+from tools.data_structures import DefaultDict, LRUCache
+from tools.iter_tools import get_formatter
 
 ############################################################
 
@@ -210,6 +214,146 @@ def parse_options__messages(
     }
 
 
+############################################################
+#   Debug Formatter
+############################################################
+
+
+class DebugFormatter:
+    """
+    The `debug_str` functions for one set of `options`,
+    with the options parsed and their `Formatter`s compiled once.
+    """
+
+    def __init__(self, **options):
+
+        self.call_sign = parse_options__call_sign(**options)
+        self.call_sign__name = parse_options__call_sign__name(**options)
+        self.call_sign__args = parse_options__call_sign__args(**options)
+
+        args_options = parse_options__args(**options)
+
+        self.format_args = get_formatter("args", **args_options)
+        self.format_kwargs = get_formatter("kwargs", **parse_options__kwargs(**options))
+        self.format_args_and_kwargs = get_formatter("plain", **args_options)
+        self.format_messages = get_formatter("plain", **parse_options__messages(**options))
+
+        return
+
+    def debug_str(
+            self,
+            name: ty__name,
+            args: ty.Optional[ty__args] = None,
+            kwargs: ty.Optional[ty__kwargs] = None,
+            messages: ty.Optional[ty__messages] = None,
+    ) -> str:
+
+        return "".join((
+            self.debug_str__call_sign(name, args, kwargs),
+            self.debug_str__messages(messages),
+        ))
+
+    def debug_str__call_sign(
+            self,
+            name: ty__name,
+            args: ty.Optional[ty__args] = None,
+            kwargs: ty.Optional[ty__kwargs] = None,
+    ) -> str:
+
+        return "".join((
+            self.call_sign["before"],
+            self.debug_str__call_sign__name(name),
+            self.debug_str__call_sign__args(args, kwargs),
+            self.call_sign["after"],
+        ))
+
+    def debug_str__call_sign__name(
+            self,
+            name: ty.Optional[ty__name] = None,
+    ) -> str:
+
+        return "".join((
+            self.call_sign__name["before"],
+            name,
+            self.call_sign__name["after"],
+        ))
+
+    def debug_str__call_sign__args(
+            self,
+            args: ty.Optional[ty__args] = None,
+            kwargs: ty.Optional[ty__kwargs] = None,
+    ) -> str:
+
+        args_str = None
+
+        if args is None and kwargs is None:
+            args_str = ""
+
+        elif args is not None and kwargs is None:
+            args_str = self.debug_str__args(args)
+
+        elif args is None and kwargs is not None:
+            args_str = self.debug_str__kwargs(kwargs)
+
+        else:
+            args_str = self.format_args_and_kwargs((
+                self.debug_str__args(args),
+                self.debug_str__kwargs(kwargs),
+            ))
+
+        return "".join((
+            self.call_sign__args["before"],
+            args_str,
+            self.call_sign__args["after"],
+        ))
+
+    def debug_str__args(
+            self,
+            args: ty.Optional[ty__args] = None,
+    ) -> str:
+
+        return self.format_args(args) if args is not None else ""
+
+    def debug_str__kwargs(
+            self,
+            kwargs: ty.Optional[ty__kwargs] = None,
+    ) -> str:
+
+        return self.format_kwargs(kwargs) if kwargs is not None else ""
+
+    def debug_str__messages(
+            self,
+            messages: ty.Optional[ty__messages] = None,
+    ) -> str:
+
+        return self.format_messages(messages) if messages is not None else ""
+
+
+#-----------------------------------------------------------
+
+DEBUG_FORMATTER__CACHE_SIZE = 64
+
+_DEBUG_FORMATTERS = LRUCache(DEBUG_FORMATTER__CACHE_SIZE)
+
+
+def get_debug_formatter(**options) -> DebugFormatter:
+    """
+    Get the `DebugFormatter` of `options`, compiling it on first use.
+    """
+
+    try:
+        key = tuple(sorted(options.items())) if options else None
+        debug_formatter = _DEBUG_FORMATTERS.get(key)
+    except TypeError:
+        return DebugFormatter(**options)
+
+    if debug_formatter is None:
+        debug_formatter = DebugFormatter(**options)
+        _DEBUG_FORMATTERS.put(key, debug_formatter)
+
+    return debug_formatter
+
+
 ############################################################
 #   Debug Strings
 ############################################################
@@ -223,10 +367,7 @@ def debug_str(
         **options,
 ) -> str:
 
-    return "".join((
-        debug_str__call_sign(name, args, kwargs, **options),
-        debug_str__messages(messages, **options),
-    ))
+    return get_debug_formatter(**options).debug_str(name, args, kwargs, messages)
 
 
 #-----------------------------------------------------------
@@ -239,14 +380,7 @@ def debug_str__call_sign(
         **options,
 ) -> str:
 
-    o = parse_options__call_sign(**options)
-
-    return "".join((
-        o["before"],
-        debug_str__call_sign__name(name, **options),
-        debug_str__call_sign__args(args, kwargs, **options),
-        o["after"],
-    ))
+    return get_debug_formatter(**options).debug_str__call_sign(name, args, kwargs)
 
 
 #-----------------------------------------------------------
@@ -257,13 +391,7 @@ def debug_str__call_sign__name(
         **options,
 ) -> str:
 
-    o = parse_options__call_sign__name(**options)
-
-    return "".join((
-        o["before"],
-        name,
-        o["after"],
-    ))
+    return get_debug_formatter(**options).debug_str__call_sign__name(name)
 
 
 #-----------------------------------------------------------
@@ -275,34 +403,7 @@ def debug_str__call_sign__args(
         **options,
 ) -> str:
 
-    o = parse_options__call_sign__args(**options)
-
-    args_str = None
-
-    if args is None and kwargs is None:
-        args_str = ""
-
-    elif args is not None and kwargs is None:
-        args_str = debug_str__args(args, **options)
-
-    elif args is None and kwargs is not None:
-        args_str = debug_str__kwargs(kwargs, **options)
-
-    else:
-        args_str = iterable_to_str(
-            (
-                debug_str__args(args, **options),
-                debug_str__kwargs(kwargs, **options),
-            ),
-            style="plain",
-            **parse_options__args(**options),
-        )
-
-    return "".join((
-        o["before"],
-        args_str,
-        o["after"],
-    ))
+    return get_debug_formatter(**options).debug_str__call_sign__args(args, kwargs)
 
 
 #-----------------------------------------------------------
@@ -313,15 +414,7 @@ def debug_str__args(
         **options,
 ) -> str:
 
-    if args is None:
-        return ""
-
-    else:
-        return iterable_to_str(
-            args,
-            style="args",
-            **parse_options__args(**options),
-        )
+    return get_debug_formatter(**options).debug_str__args(args)
 
 
 #-----------------------------------------------------------
@@ -332,15 +425,7 @@ def debug_str__kwargs(
         **options,
 ) -> str:
 
-    if kwargs is None:
-        return ""
-
-    else:
-        return iterable_to_str(
-            kwargs,
-            style="kwargs",
-            **parse_options__kwargs(**options),
-        )
+    return get_debug_formatter(**options).debug_str__kwargs(kwargs)
 
 
 #-----------------------------------------------------------
@@ -351,15 +436,7 @@ def debug_str__messages(
         **options,
 ) -> str:
 
-    if messages is None:
-        return ""
-
-    else:
-        return iterable_to_str(
-            messages,
-            style="plain",
-            **parse_options__messages(**options),
-        )
+    return get_debug_formatter(**options).debug_str__messages(messages)
 
 
 ############################################################
@@ -367,6 +444,201 @@ def debug_str__messages(
 ############################################################
 
 DEFAULT__SHOULD_PRINT = True
+DEFAULT__DEBUGGING = True
+
+# When `False`, every `debug_print` returns at once, without formatting anything.
+_DEBUGGING = DEFAULT__DEBUGGING
+
+
+def set_debugging(debugging: bool) -> None:
+
+    global _DEBUGGING
+
+    _DEBUGGING = debugging
+
+    return
+
+
+def is_debugging() -> bool:
+
+    return _DEBUGGING
+
+
+#-----------------------------------------------------------
+#   Levels and Categories
+#-----------------------------------------------------------
+
+LEVEL__TRACE = 5
+LEVEL__DEBUG = 10
+LEVEL__INFO = 20
+LEVEL__WARNING = 30
+LEVEL__ERROR = 40
+
+DEFAULT__LEVEL = LEVEL__INFO    # -- of a message
+DEFAULT__MIN_LEVEL = LEVEL__INFO    # -- of the messages shown
+DEFAULT__CATEGORY = None
+
+# The least level shown, overall and in categories that have their own.
+_MIN_LEVEL = DEFAULT__MIN_LEVEL
+_CATEGORY_MIN_LEVELS = dict()
+
+
+def set_debug_level(
+        min_level: ty.Optional[int],
+        category: ty.Optional[str] = DEFAULT__CATEGORY,
+) -> None:
+    """
+    Show messages of `min_level` and above: in `category` if given, else in every category without its own.
+    A `min_level` of `None` makes `category` follow the overall level again.
+    """
+
+    global _MIN_LEVEL
+
+    if category is None:
+        _MIN_LEVEL = min_level if min_level is not None else DEFAULT__MIN_LEVEL
+    elif min_level is None:
+        _CATEGORY_MIN_LEVELS.pop(category, None)
+    else:
+        _CATEGORY_MIN_LEVELS[category] = min_level
+
+    return
+
+
+def is_debug_enabled(
+        level: int = DEFAULT__LEVEL,
+        category: ty.Optional[str] = DEFAULT__CATEGORY,
+) -> bool:
+    """
+    Whether a message of `level` in `category` would be shown.
+    Hot loops can check this once, and skip their `debug_print` calls entirely.
+    """
+
+    return _DEBUGGING and level >= _CATEGORY_MIN_LEVELS.get(category, _MIN_LEVEL)
+
+
+def resolve_lazy(value: ty.Any) -> ty.Any:
+    """
+    Call `value` if it is a callable standing in for a value, as for lazy `debug_print` arguments.
+    """
+
+    return value() if callable(value) else value
+
+
+#-----------------------------------------------------------
+#   Writer
+#-----------------------------------------------------------
+
+
+class DebugWriter:
+    """
+    Writes debug output to `stream` from a background thread, in batches of up to `batch_size` lines,
+    so that writing doesn't hold up the code being debugged.
+    The stream is flushed whenever the writer catches up.
+    """
+
+    DEFAULT__BATCH_SIZE = 256
+
+    def __init__(self, stream=None, batch_size=DEFAULT__BATCH_SIZE):
+
+        self.stream = stream if stream is not None else sys.stdout
+        self.batch_size = batch_size
+
+        self.jobs = queue.Queue()
+        self.writer = threading.Thread(target=self.write_jobs, name="DebugWriter", daemon=True)
+        self.writer.start()
+
+        return
+
+    def write(self, text: str) -> None:
+
+        self.jobs.put(text)
+
+        return
+
+    def close(self) -> None:
+        """
+        Wait for queued output to be written, and stop the writer.
+        """
+
+        if self.writer is not None:
+            self.jobs.put(None)
+            self.writer.join()
+            self.writer = None
+
+        return
+
+    def write_jobs(self) -> None:
+
+        jobs = self.jobs
+        closing = False
+
+        while not closing:
+
+            batch = [jobs.get()]
+
+            while len(batch) < self.batch_size and not jobs.empty():
+                batch.append(jobs.get_nowait())
+
+            if None in batch:
+                batch = batch[:batch.index(None)]
+                closing = True
+
+            if batch:
+                self.stream.write("\n".join(batch) + "\n")
+
+            if closing or jobs.empty():
+                self.stream.flush()
+
+        return
+
+
+_DEBUG_WRITER = None
+
+
+def start_debug_writer(stream=None, batch_size=DebugWriter.DEFAULT__BATCH_SIZE) -> DebugWriter:
+    """
+    Send all debug output through a `DebugWriter` until `stop_debug_writer`.
+    """
+
+    global _DEBUG_WRITER
+
+    stop_debug_writer()
+    _DEBUG_WRITER = DebugWriter(stream, batch_size)
+
+    return _DEBUG_WRITER
+
+
+def stop_debug_writer() -> None:
+    """
+    Write out any queued debug output, and go back to printing it directly.
+    """
+
+    global _DEBUG_WRITER
+
+    if _DEBUG_WRITER is not None:
+        _DEBUG_WRITER.close()
+        _DEBUG_WRITER = None
+
+    return
+
+
+atexit.register(stop_debug_writer)
+
+
+def write_debug(text: str) -> None:
+    """
+    Print `text`, through the debug writer if one is started.
+    """
+
+    if _DEBUG_WRITER is not None:
+        _DEBUG_WRITER.write(text)
+    else:
+        print(text)
+
+    return
+
+
+#-----------------------------------------------------------
 
 
 def debug_print(
@@ -375,11 +647,28 @@ def debug_print(
         kwargs: ty.Optional[ty__kwargs] = None,
         messages: ty.Optional[ty__messages] = None,
         should_print: bool = DEFAULT__SHOULD_PRINT,
+        level: int = DEFAULT__LEVEL,
+        category: ty.Optional[str] = DEFAULT__CATEGORY,
         **options,
 ) -> None:
-
-    if should_print:
-        print(debug_str(name, args, kwargs, messages, **options))
+    """
+    Print `debug_str(name, args, kwargs, messages, **options)` if `level` is shown in `category`.
+    Any of `name`, `args`, `kwargs` and `messages` may be a function without arguments
+    that returns it, which is only called when the message is shown.
+    """
+
+    if (
+        _DEBUGGING
+        and should_print
+        and level >= _CATEGORY_MIN_LEVELS.get(category, _MIN_LEVEL)
+    ):
+        write_debug(debug_str(
+            resolve_lazy(name),
+            resolve_lazy(args),
+            resolve_lazy(kwargs),
+            resolve_lazy(messages),
+            **options,
+        ))
 
     return
 
@@ -395,8 +684,8 @@ def debug_print__call_sign(
     **options,
 ):
 
-    if should_print:
-        print(debug_str__call_sign(name, args, kwargs, **options))
+    if _DEBUGGING and should_print:
+        write_debug(debug_str__call_sign(name, args, kwargs, **options))
 
     return
 
@@ -410,8 +699,8 @@ def debug_print__call_sign__name(
     **options,
 ):
 
-    if should_print:
-        print(debug_str__call_sign__name(name, **options))
+    if _DEBUGGING and should_print:
+        write_debug(debug_str__call_sign__name(name, **options))
 
     return
 
@@ -426,8 +715,8 @@ def debug_print__call_sign__args(
     **options,
 ):
 
-    if should_print:
-        print(debug_str__call_sign__args(args, kwargs, **options))
+    if _DEBUGGING and should_print:
+        write_debug(debug_str__call_sign__args(args, kwargs, **options))
 
     return
 
@@ -441,8 +730,8 @@ def debug_print__args(
     **options,
 ):
 
-    if should_print:
-        print(debug_str__args(args, **options))
+    if _DEBUGGING and should_print:
+        write_debug(debug_str__args(args, **options))
 
     return
 
@@ -456,8 +745,8 @@ def debug_print__kwargs(
     **options,
 ):
 
-    if should_print:
-        print(debug_str__kwargs(kwargs, **options))
+    if _DEBUGGING and should_print:
+        write_debug(debug_str__kwargs(kwargs, **options))
 
     return
 
@@ -471,7 +760,7 @@ def debug_print__messages(
     **options,
 ):
 
-    if should_print:
-        print(debug_str__messages(messages, **options))
+    if _DEBUGGING and should_print:
+        write_debug(debug_str__messages(messages, **options))
 
     return
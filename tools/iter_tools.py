@@ -6,7 +6,7 @@ import itertools
 import functools
 import copy
 
-from .data_structures import DefaultDict
+from .data_structures import DefaultDict, LRUCache
 ############################################################
 #   Type Checking
 ############################################################
@@ -319,17 +319,34 @@ _ITERABLE_TO_STR__STYLE_FAMILY = {
     },
 }
 
-_ITERABLE_TO_STR__STYLES = {
-    key: inherit(_ITERABLE_TO_STR__STYLE_FAMILY, key, delete_extends_key=True)
-    for key in _ITERABLE_TO_STR__STYLE_FAMILY.keys()
-}
+_ITERABLE_TO_STR__STYLES = None
 
 
-def iterable_to_str(
-        iterable: ty.Iterable[ty.Any],
+def get_iterable_to_str__styles() -> ty.Dict[str, ty__iterable_to_str__style]:
+    """
+    Get the resolved `iterable_to_str` styles, resolving them on first use.
+    """
+
+    global _ITERABLE_TO_STR__STYLES
+
+    if _ITERABLE_TO_STR__STYLES is None:
+        _ITERABLE_TO_STR__STYLES = {
+            key: inherit(_ITERABLE_TO_STR__STYLE_FAMILY, key, delete_extends_key=True)
+            for key in _ITERABLE_TO_STR__STYLE_FAMILY.keys()
+        }
+
+    return _ITERABLE_TO_STR__STYLES
+
+
+def resolve_iterable_to_str__style(
         style: ty.Union[None, str, ty__iterable_to_str__style] = None,
         **options
-) -> str:
+) -> ty__iterable_to_str__style:
+    """
+    Resolve `style` and `options` into the complete style that `iterable_to_str` formats with.
+    """
+
+    styles = get_iterable_to_str__styles()
 
     # Parse `style`
 
@@ -341,7 +358,7 @@ def iterable_to_str(
         style_name = "base"
 
     elif isinstance(style, str):
-        if style in _ITERABLE_TO_STR__STYLES:
+        if style in styles:
 
             style_name = style
 
@@ -364,17 +381,17 @@ def iterable_to_str(
     # Combine `style` with `options`
 
     if style_name is not None:
-        style = inherit(_ITERABLE_TO_STR__STYLES, style_name)
+        style = inherit(styles, style_name)
 
     elif style_dict is not None:
-        style = inherit(_ITERABLE_TO_STR__STYLES, "base", overlay=style_dict)
+        style = inherit(styles, "base", overlay=style_dict)
 
     else:
         raise Exception("iterable_to_str.ProgrammerError")
 
     if "extends" in style:
         style = inherit(
-            _ITERABLE_TO_STR__STYLES,
+            styles,
             style["extends"],
             overlay=style,
             delete_extends_key=True,
@@ -382,7 +399,7 @@ def iterable_to_str(
 
     if "extends" in options:
         options = inherit(
-            _ITERABLE_TO_STR__STYLES,
+            styles,
             options["extends"],
             overlay=options,
             delete_extends_key=True,
@@ -393,22 +410,94 @@ def iterable_to_str(
         **options,
     }
 
-    # Style the iterable `iterable`
-
-    def each_str(i: ty.Any, x: ty.Any, c: ty.Iterable) -> str:
-        return "".join((
-            style["before_each"],
-            style["to_str"](i, x, c),
-            style["after_each"],
-        ))
-
-    def all_str() -> str:
-        return "".join((
-            style["before_all"],
-            style["between"].join(
-                each_str(i, x, iterable) for (i, x) in enumerate(iterable)
-            ),
-            style["after_all"],
-        ))
-
-    return all_str()
+    return style
+
+
+class Formatter:
+    """
+    A compiled `iterable_to_str` style.
+    The style and options are resolved once, so formatting doesn't copy or merge any dicts.
+    """
+
+    __slots__ = (
+        "style",
+        "to_str",
+        "before_all",
+        "after_all",
+        "between",
+        "before_each",
+        "after_each",
+    )
+
+    def __init__(
+            self,
+            style: ty.Union[None, str, ty__iterable_to_str__style] = None,
+            **options
+    ):
+
+        style = resolve_iterable_to_str__style(style, **options)
+
+        self.style = style
+        self.to_str = style["to_str"]
+        self.before_all = style["before_all"]
+        self.after_all = style["after_all"]
+        self.between = style["between"]
+        self.before_each = style["before_each"]
+        self.after_each = style["after_each"]
+
+        return
+
+    def __call__(self, iterable: ty.Iterable[ty.Any]) -> str:
+
+        to_str = self.to_str
+
+        if self.before_each or self.after_each:
+            before_each = self.before_each
+            after_each = self.after_each
+            each_strs = (
+                before_each + to_str(i, x, iterable) + after_each
+                for (i, x) in enumerate(iterable)
+            )
+        else:
+            each_strs = (to_str(i, x, iterable) for (i, x) in enumerate(iterable))
+
+        return self.before_all + self.between.join(each_strs) + self.after_all
+
+
+ITERABLE_TO_STR__FORMATTER_CACHE_SIZE = 256
+
+_ITERABLE_TO_STR__FORMATTERS = LRUCache(ITERABLE_TO_STR__FORMATTER_CACHE_SIZE)
+
+
+def get_formatter(
+        style: ty.Union[None, str, ty__iterable_to_str__style] = None,
+        **options
+) -> Formatter:
+    """
+    Get the `Formatter` of `style` and `options`, compiling it on first use.
+    Styles and options that can't be hashed are compiled on every call.
+    """
+
+    try:
+        key = (
+            style if style is None or isinstance(style, str) else tuple(style.items()),
+            tuple(sorted(options.items())) if options else None,
+        )
+        formatter = _ITERABLE_TO_STR__FORMATTERS.get(key)
+    except (AttributeError, TypeError):
+        return Formatter(style, **options)
+
+    if formatter is None:
+        formatter = Formatter(style, **options)
+        _ITERABLE_TO_STR__FORMATTERS.put(key, formatter)
+
+    return formatter
+
+
+def iterable_to_str(
+        iterable: ty.Iterable[ty.Any],
+        style: ty.Union[None, str, ty__iterable_to_str__style] = None,
+        **options
+) -> str:
+
+    return get_formatter(style, **options)(iterable)